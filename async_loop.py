@@ -0,0 +1,71 @@
+"""
+Async Loop Module
+Long-lived asyncio event loop running in a background thread
+"""
+import asyncio
+import concurrent.futures
+import threading
+
+
+class AsyncLoopThread:
+    """
+    Background asyncio loop that worker threads submit coroutines to
+
+    Replaces asyncio.run() per request: the loop (and on Windows the
+    Proactor / default executor behind it) is created once and reused.
+    """
+
+    def __init__(self, name='asyncio-loop'):
+        self.loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._ready.set)
+        try:
+            self.loop.run_forever()
+        finally:
+            try:
+                # Cancel in-flight requests so callers blocked in run()/submit() get CancelledError
+                pending = asyncio.all_tasks(self.loop)
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+            finally:
+                self.loop.close()
+
+    @property
+    def is_running(self):
+        return self._thread.is_alive() and not self.loop.is_closed()
+
+    def submit(self, coro):
+        """
+        Schedule a coroutine on the loop
+
+        Returns:
+            concurrent.futures.Future
+        """
+        if not self.is_running:
+            coro.close()
+            raise RuntimeError("Async loop is not running")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro, timeout=None):
+        """Run a coroutine on the loop and block until it finishes"""
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def stop(self, timeout=2.0):
+        """Stop the loop and wait for the thread to exit"""
+        if self._thread.is_alive():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout)
@@ -4,10 +4,16 @@ Helper functions for audio processing
 """
 import numpy as np
 
+from resampler import resample
+from pitch_detector import PitchEstimator, classify_gender
+
 
 class AudioUtils:
     """Audio processing utilities"""
     
+    # One pitch estimator per sample rate (window/FFT setup is reused)
+    _pitch_estimators = {}
+    
     @staticmethod
     def calculate_rms(audio_data):
         """
@@ -60,13 +66,9 @@ class AudioUtils:
         if channels == 2:
             audio_array = audio_array.reshape(-1, 2).mean(axis=1).astype(np.int16)
         
-        # Resample
-        num_samples = int(len(audio_array) * to_rate / from_rate)
-        resampled = np.interp(
-            np.linspace(0, len(audio_array), num_samples),
-            np.arange(len(audio_array)),
-            audio_array
-        ).astype(np.int16)
+        # Resample (polyphase windowed-sinc, filter bank cached per rate pair)
+        resampled = resample(audio_array.astype(np.float32), from_rate, to_rate)
+        resampled = np.clip(np.round(resampled), -32768, 32767).astype(np.int16)
         
         return resampled.tobytes()
     
@@ -83,34 +85,13 @@ class AudioUtils:
             str: 'male', 'female', or 'unknown'
         """
         try:
-            # Simple pitch detection using autocorrelation
-            correlation = np.correlate(audio_array, audio_array, mode='full')
-            correlation = correlation[len(correlation)//2:]
-            
-            # Find the first peak after the zero lag
-            diff = np.diff(correlation)
-            start = np.where(diff > 0)[0]
-            if len(start) == 0:
-                return "unknown"
-            
-            start = start[0]
-            peak = np.argmax(correlation[start:]) + start
-            
-            # Calculate frequency
-            if peak == 0:
-                return "unknown"
-            
-            frequency = sample_rate / peak
+            # Frame-wise FFT autocorrelation, 60-400 Hz, median over voiced frames
+            estimator = AudioUtils._pitch_estimators.get(sample_rate)
+            if estimator is None:
+                estimator = PitchEstimator(sample_rate)
+                AudioUtils._pitch_estimators[sample_rate] = estimator
             
-            # Classify based on frequency
-            # Male: typically 85-180 Hz
-            # Female: typically 165-255 Hz
-            if frequency < 165:
-                return "male"
-            elif frequency > 180:
-                return "female"
-            else:
-                return "unknown"  # Overlap zone
+            return classify_gender(estimator.estimate(audio_array))
                 
         except Exception:
             return "unknown"
@@ -0,0 +1,87 @@
+"""
+Batched STT Module
+Transcribes a backlog of utterances with one batched Whisper call
+"""
+import bisect
+
+import numpy as np
+
+try:
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:  # faster-whisper < 1.1 has no batched pipeline
+    BatchedInferencePipeline = None
+
+
+class BatchedTranscriber:
+    """
+    Several utterances -> one BatchedInferencePipeline call
+
+    The utterances are concatenated and passed as clip_timestamps, so each
+    one is decoded as its own sequence in the same encoder/decoder batch.
+    Segments are mapped back to their utterance by start time. Utterances
+    longer than one Whisper window, or a missing batched pipeline, fall
+    back to one transcribe() call each.
+    """
+
+    MAX_CLIP_SECONDS = 30.0
+
+    def __init__(self, model, sample_rate=16000):
+        """
+        Args:
+            model: faster_whisper.WhisperModel
+            sample_rate: Sample rate of the utterances (16kHz)
+        """
+        self.model = model
+        self.sample_rate = sample_rate
+        self.pipeline = BatchedInferencePipeline(model=model) if BatchedInferencePipeline else None
+
+    @property
+    def available(self):
+        return self.pipeline is not None
+
+    def transcribe(self, audios, **options):
+        """
+        Args:
+            audios: List of float32 16kHz utterances
+            **options: transcribe() options (decoding_options)
+
+        Returns:
+            list: Transcript per utterance, in order
+        """
+        max_samples = int(self.MAX_CLIP_SECONDS * self.sample_rate)
+        batchable = [i for i, audio in enumerate(audios) if 0 < len(audio) <= max_samples]
+        if not self.pipeline or len(batchable) < 2:
+            batchable = []
+
+        texts = [""] * len(audios)
+        for i, audio in enumerate(audios):
+            if i not in batchable and len(audio):
+                segments, _ = self.model.transcribe(audio, **options)
+                texts[i] = "".join(segment.text for segment in segments).strip()
+
+        if batchable:
+            for i, text in zip(batchable, self._transcribe_batched([audios[i] for i in batchable], options)):
+                texts[i] = text
+        return texts
+
+    def _transcribe_batched(self, audios, options):
+        starts, clips, offset = [], [], 0
+        for audio in audios:
+            starts.append(offset / self.sample_rate)
+            clips.append({'start': offset, 'end': offset + len(audio)})
+            offset += len(audio)
+
+        options = dict(options)
+        # Clips replace VAD; the front-end VAD already trimmed the utterances
+        options.pop('vad_parameters', None)
+        options['vad_filter'] = False
+        options['clip_timestamps'] = clips
+        options['batch_size'] = len(audios)
+
+        segments, _ = self.pipeline.transcribe(np.concatenate(audios), **options)
+
+        texts = [""] * len(audios)
+        for segment in segments:
+            index = max(0, bisect.bisect_right(starts, segment.start + 1e-3) - 1)
+            texts[index] += segment.text
+        return [text.strip() for text in texts]
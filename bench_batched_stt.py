@@ -0,0 +1,86 @@
+"""
+Benchmark: batched Whisper inference for a backlog of utterances
+Utterances/sec for sequential transcribe() vs BatchedInferencePipeline per batch size
+
+Usage:
+    python bench_batched_stt.py wav_dir [model]
+
+wav_dir holds short utterance WAVs (NPC lines); .txt references are optional
+and, when present, are used to report CER per batch size.
+"""
+import sys
+import time
+
+import numpy as np
+
+from batched_stt import BatchedTranscriber
+from bench_utils import char_error_rate, load_test_set, load_wav, load_whisper_model
+from config import Config
+from decoding_profiles import decoding_options
+from resampler import resample
+
+WHISPER_RATE = 16000
+BATCH_SIZES = (1, 2, 4, 8, 16)
+
+
+def main():
+    print("=" * 70)
+    print("BENCHMARK: batched STT throughput vs batch size")
+    print("=" * 70)
+
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return
+
+    items = load_test_set(sys.argv[1])
+    if not items:
+        print(f"\n⚠️ No WAV files found in {sys.argv[1]}")
+        return
+
+    model_name = sys.argv[2] if len(sys.argv) > 2 else 'small'
+    model = load_whisper_model(model_name)
+    if model is None:
+        return
+
+    transcriber = BatchedTranscriber(model, WHISPER_RATE)
+    if not transcriber.available:
+        print("⚠️ BatchedInferencePipeline needs faster-whisper >= 1.1")
+        return
+
+    audios, references = [], []
+    for path, reference in items:
+        audio, rate = load_wav(path)
+        if rate != WHISPER_RATE:
+            audio = resample(audio, rate, WHISPER_RATE)
+        audios.append(audio)
+        references.append(reference)
+
+    options = decoding_options(
+        {'beam_size': Config.DEFAULTS['beam_size']},
+        language='zh', no_speech_threshold=0.6
+    )
+    transcriber.transcribe(audios[:2], **options)  # Warm-up
+
+    total = sum(len(audio) for audio in audios) / WHISPER_RATE
+    print(f"\n📊 {len(audios)} utterances, {total:.1f}s audio (model: {model_name})")
+    print(f"\n   {'batch':>5} {'utt/s':>7} {'RTF':>7} {'CER':>7}")
+    for batch_size in BATCH_SIZES:
+        if batch_size > len(audios) and batch_size > 1:
+            break
+        texts = []
+        start = time.perf_counter()
+        for i in range(0, len(audios), batch_size):
+            texts.extend(transcriber.transcribe(audios[i:i + batch_size], **options))
+        elapsed = time.perf_counter() - start
+
+        scored = [(ref, text) for ref, text in zip(references, texts) if ref]
+        cer = f"{np.mean([char_error_rate(ref, text) for ref, text in scored]) * 100:6.2f}%" if scored else "    --"
+        label = "seq" if batch_size == 1 else str(batch_size)
+        print(f"   {label:>5} {len(audios) / elapsed:7.2f} {elapsed / total:7.3f} {cer:>7}")
+
+    print("\n   batch 1 = one transcribe() per utterance (previous behaviour)")
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: Whisper decoding profiles
+Real-time factor (decode seconds / audio seconds) and CER per profile
+
+Usage:
+    python bench_decoding_profiles.py wav_dir [model] [beam_size]
+
+wav_dir holds name.wav + name.txt (Chinese reference) pairs. beam_size is
+the Beam Size slider value used by profiles without their own beam.
+"""
+import sys
+import time
+
+import numpy as np
+
+from bench_utils import char_error_rate, load_test_set, load_wav, load_whisper_model
+from config import Config
+from decoding_profiles import decoding_options
+from resampler import resample
+
+WHISPER_RATE = 16000
+
+
+def main():
+    print("=" * 70)
+    print("BENCHMARK: Whisper decoding profiles")
+    print("=" * 70)
+
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return
+
+    items = [(path, ref) for path, ref in load_test_set(sys.argv[1]) if ref]
+    if not items:
+        print(f"\n⚠️ No wav/txt pairs found in {sys.argv[1]}")
+        return
+
+    model_name = sys.argv[2] if len(sys.argv) > 2 else 'small'
+    beam_size = int(sys.argv[3]) if len(sys.argv) > 3 else Config.DEFAULTS['beam_size']
+    model = load_whisper_model(model_name)
+    if model is None:
+        return
+
+    audios = []
+    for path, reference in items:
+        audio, rate = load_wav(path)
+        if rate != WHISPER_RATE:
+            audio = resample(audio, rate, WHISPER_RATE)
+        audios.append((audio, reference))
+    total = sum(len(audio) for audio, _ in audios) / WHISPER_RATE
+
+    # Warm-up
+    segments, _ = model.transcribe(audios[0][0][:WHISPER_RATE], language='zh')
+    list(segments)
+
+    print(f"\n📊 {len(items)} utterances, {total:.1f}s audio (model: {model_name}, slider beam: {beam_size})")
+    print(f"\n   {'profile':<10} {'beam':>5} {'RTF':>7} {'p95 latency':>12} {'CER':>7}")
+    for name in Config.DECODING_PROFILES:
+        options = decoding_options(
+            {'decoding_profile': name, 'beam_size': beam_size},
+            language='zh', vad_filter=False, no_speech_threshold=0.6
+        )
+        decode_time, latencies, errors = 0.0, [], []
+        for audio, reference in audios:
+            start = time.perf_counter()
+            segments, _ = model.transcribe(audio, **options)
+            text = "".join(s.text for s in segments)  # Segments decode lazily
+            elapsed = time.perf_counter() - start
+            decode_time += elapsed
+            latencies.append(elapsed)
+            errors.append(char_error_rate(reference, text))
+        print(f"   {name:<10} {options['beam_size']:>5} {decode_time / total:7.3f} "
+              f"{np.percentile(latencies, 95) * 1000:10.0f}ms {np.mean(errors) * 100:6.2f}%")
+
+    print("\n   RTF < 1.0 means faster than real time")
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
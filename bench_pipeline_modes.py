@@ -0,0 +1,102 @@
+"""
+Benchmark: cascade vs single-hop speech translation
+End-to-end latency (speech -> Vietnamese text) and WER for each pipeline mode
+
+Usage:
+    python bench_pipeline_modes.py wav_dir [model] [backend]
+
+wav_dir holds name.wav + name.txt pairs where the .txt is the Vietnamese
+reference translation. backend is 'google' (default) or 'local'.
+
+Modes:
+    cascade            Whisper transcribe (zh) -> translator (zh -> vi)
+    whisper_translate  Whisper translate task (zh -> en) -> MT hop (en -> vi)
+"""
+import sys
+import time
+
+import numpy as np
+
+from bench_utils import load_test_set, load_wav, load_whisper_model, word_error_rate
+from config import Config
+from resampler import resample
+from translator_backends import create_translator
+
+WHISPER_RATE = 16000
+
+
+def run_mode(model, translator, audio, task):
+    """
+    Returns:
+        tuple: (stt seconds, translation seconds, Vietnamese text)
+    """
+    start = time.perf_counter()
+    segments, _ = model.transcribe(
+        audio, language='zh', task=task, beam_size=5, vad_filter=False, no_speech_threshold=0.6
+    )
+    text = " ".join(s.text.strip() for s in segments).strip()
+    stt = time.perf_counter() - start
+
+    start = time.perf_counter()
+    translated = translator.translate(text) if text else ""
+    return stt, time.perf_counter() - start, translated or ""
+
+
+def main():
+    print("=" * 70)
+    print("BENCHMARK: pipeline modes (cascade vs Whisper translate)")
+    print("=" * 70)
+
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return
+
+    wav_dir = sys.argv[1]
+    model_name = sys.argv[2] if len(sys.argv) > 2 else 'small'
+    backend = sys.argv[3] if len(sys.argv) > 3 else Config.DEFAULTS['translator_backend']
+
+    items = [(path, ref) for path, ref in load_test_set(wav_dir) if ref]
+    if not items:
+        print(f"\n⚠️ No wav/txt pairs found in {wav_dir}")
+        return
+
+    model = load_whisper_model(model_name)
+    if model is None:
+        return
+
+    settings = {'translator_backend': backend}
+    modes = (
+        ('cascade', 'transcribe', create_translator(settings)),
+        ('whisper_translate', 'translate', create_translator(settings, pivot=True)),
+    )
+
+    audios = []
+    for path, reference in items:
+        audio, rate = load_wav(path)
+        if rate != WHISPER_RATE:
+            audio = resample(audio, rate, WHISPER_RATE)
+        audios.append((audio, reference))
+
+    # Warm up both decoder paths so the first utterance isn't penalized
+    for _, task, _ in modes:
+        run_mode(model, modes[0][2], audios[0][0][:WHISPER_RATE], task)
+
+    print(f"\n📊 {len(items)} utterances (model: {model_name}, backend: {backend})")
+    print(f"\n   {'mode':<18} {'stt':>8} {'translate':>10} {'total':>8} {'p95':>8} {'WER':>7}")
+    for mode, task, translator in modes:
+        stt_times, mt_times, totals, errors = [], [], [], []
+        for audio, reference in audios:
+            stt, mt, hypothesis = run_mode(model, translator, audio, task)
+            stt_times.append(stt)
+            mt_times.append(mt)
+            totals.append(stt + mt)
+            errors.append(word_error_rate(reference, hypothesis))
+        print(f"   {mode:<18} {np.mean(stt_times) * 1000:6.0f}ms {np.mean(mt_times) * 1000:8.0f}ms "
+              f"{np.mean(totals) * 1000:6.0f}ms {np.percentile(totals, 95) * 1000:6.0f}ms "
+              f"{np.mean(errors) * 100:6.1f}%")
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
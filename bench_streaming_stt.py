@@ -0,0 +1,130 @@
+"""
+Benchmark: utterance STT (4s hard cuts) vs streaming STT (local agreement)
+Replays WAV files in simulated real time and reports first-text latency,
+end-of-speech latency and CER
+
+Usage:
+    python bench_streaming_stt.py wav_dir [model]
+
+wav_dir holds name.wav + name.txt (Chinese reference) pairs; long sentences
+(> 4s) show the difference best.
+"""
+import sys
+import time
+
+import numpy as np
+
+from bench_utils import char_error_rate, load_test_set, load_wav, load_whisper_model
+from config import Config
+from resampler import resample
+from streaming_stt import StreamingTranscriber
+
+WHISPER_RATE = 16000
+MAX_BUFFER_DURATION = 4.0  # Forced cut of the utterance mode (capture loop)
+OPTIONS = {'beam_size': 5, 'language': 'zh', 'vad_filter': False, 'no_speech_threshold': 0.6}
+
+
+def run_utterance(model, audio):
+    """
+    Capture-loop behaviour: transcribe every 4s piece once it is complete
+
+    Returns:
+        tuple: (first text time, final text time, text) in seconds from speech start
+    """
+    clock, first, parts = 0.0, None, []
+    step = int(MAX_BUFFER_DURATION * WHISPER_RATE)
+    for start in range(0, len(audio), step):
+        piece = audio[start:start + step]
+        clock = max(clock, (start + len(piece)) / WHISPER_RATE)
+        decode_start = time.perf_counter()
+        segments, _ = model.transcribe(piece, **OPTIONS)
+        parts.append("".join(s.text for s in segments).strip())
+        clock += time.perf_counter() - decode_start
+        if first is None and parts[-1]:
+            first = clock
+    return first, clock, "".join(parts)
+
+
+def run_streaming(model, audio):
+    """
+    Streaming STT fed in update_interval steps; decode time delays the simulated clock
+
+    Returns:
+        tuple: (first text time, final text time, text) in seconds from speech start
+    """
+    options = Config.STREAMING_STT
+    transcriber = StreamingTranscriber(
+        model, WHISPER_RATE, buffer_trim=options['buffer_trim'],
+        prompt_chars=options['prompt_chars'], options=OPTIONS
+    )
+    step = int(options['update_interval'] * WHISPER_RATE)
+    clock, first, text = 0.0, None, ""
+    for start in range(0, len(audio), step):
+        transcriber.insert_audio(audio[start:start + step])
+        if transcriber.duration < options['min_chunk']:
+            continue
+        clock = max(clock, min(start + step, len(audio)) / WHISPER_RATE)
+        decode_start = time.perf_counter()
+        text += transcriber.process_iter()
+        clock += time.perf_counter() - decode_start
+        if first is None and text.strip():
+            first = clock
+
+    clock = max(clock, len(audio) / WHISPER_RATE)
+    decode_start = time.perf_counter()
+    text += transcriber.finish()
+    clock += time.perf_counter() - decode_start
+    if first is None:
+        first = clock
+    return first, clock, text.strip()
+
+
+def main():
+    print("=" * 70)
+    print("BENCHMARK: utterance vs streaming STT (simulated real time)")
+    print("=" * 70)
+
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return
+
+    items = [(path, ref) for path, ref in load_test_set(sys.argv[1]) if ref]
+    if not items:
+        print(f"\n⚠️ No wav/txt pairs found in {sys.argv[1]}")
+        return
+
+    model_name = sys.argv[2] if len(sys.argv) > 2 else 'small'
+    model = load_whisper_model(model_name)
+    if model is None:
+        return
+
+    audios = []
+    for path, reference in items:
+        audio, rate = load_wav(path)
+        if rate != WHISPER_RATE:
+            audio = resample(audio, rate, WHISPER_RATE)
+        audios.append((audio, reference))
+
+    # Warm-up
+    model.transcribe(audios[0][0][:WHISPER_RATE], **OPTIONS)
+
+    total = sum(len(audio) for audio, _ in audios) / WHISPER_RATE
+    print(f"\n📊 {len(items)} utterances, {total:.1f}s of speech (model: {model_name})")
+    print(f"\n   {'mode':<10} {'first text':>11} {'after speech end':>17} {'CER':>7}")
+    for name, run in (("utterance", run_utterance), ("streaming", run_streaming)):
+        firsts, lags, errors = [], [], []
+        for audio, reference in audios:
+            first, final, text = run(model, audio)
+            firsts.append(first)
+            lags.append(final - len(audio) / WHISPER_RATE)
+            errors.append(char_error_rate(reference, text))
+        print(f"   {name:<10} {np.mean(firsts) * 1000:9.0f}ms {np.mean(lags) * 1000:15.0f}ms "
+              f"{np.mean(errors) * 100:6.2f}%")
+
+    print("\n   first text: from speech start to the first text leaving STT")
+    print("   after speech end: from the last sample to the complete transcript")
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark: translation micro-batching under bursty dialogue
+Offline: a fake translator models one HTTP round trip per request
+
+Reports throughput and queueing delay for each (batch size, wait window) pair.
+"""
+import queue
+import threading
+import time
+
+import numpy as np
+
+from translation_batcher import drain_batch, translate_batch
+
+ROUND_TRIP = 0.12     # Seconds per request (network + service)
+PER_LINE = 0.002      # Extra seconds per line in a request
+BURSTS = 3
+LINES_PER_BURST = 6
+LINE_GAP = 0.03       # Seconds between lines inside a burst
+BURST_GAP = 0.8
+
+
+class FakeTranslator:
+    """Stand-in for GoogleTranslator with a fixed latency model"""
+
+    def __init__(self):
+        self.requests = 0
+
+    def translate(self, text):
+        self.requests += 1
+        lines = text.split("\n")
+        time.sleep(ROUND_TRIP + PER_LINE * len(lines))
+        return "\n".join(f"vi:{line}" for line in lines)
+
+
+def run(max_batch, window):
+    translator = FakeTranslator()
+    q = queue.Queue()
+    delays = []
+    done = threading.Event()
+    total = BURSTS * LINES_PER_BURST
+
+    def consumer():
+        while len(delays) < total:
+            try:
+                batch = drain_batch(q, max_batch, window, timeout=0.5)
+            except queue.Empty:
+                continue
+            translate_batch(translator, [text for text, _ in batch])
+            now = time.perf_counter()
+            delays.extend(now - queued_at for _, queued_at in batch)
+        done.set()
+
+    threading.Thread(target=consumer, daemon=True).start()
+
+    start = time.perf_counter()
+    for burst in range(BURSTS):
+        for line in range(LINES_PER_BURST):
+            q.put((f"第{burst}段第{line}句", time.perf_counter()))
+            time.sleep(LINE_GAP)
+        time.sleep(BURST_GAP)
+    done.wait()
+    elapsed = time.perf_counter() - start
+
+    return {
+        'requests': translator.requests,
+        'mean_delay_ms': np.mean(delays) * 1000,
+        'p95_delay_ms': np.percentile(delays, 95) * 1000,
+        'busy_lines_per_sec': total / (translator.requests * ROUND_TRIP + total * PER_LINE),
+        'elapsed': elapsed
+    }
+
+
+def main():
+    print("=" * 70)
+    print("BENCHMARK: translation micro-batching (fake translator)")
+    print("=" * 70)
+    print(f"   {BURSTS} bursts x {LINES_PER_BURST} lines, {LINE_GAP * 1000:.0f}ms apart, "
+          f"round trip {ROUND_TRIP * 1000:.0f}ms")
+    print(f"\n   {'batch':>5} {'window':>7} {'requests':>9} {'lines/s':>8} {'mean delay':>11} {'p95 delay':>10}")
+
+    for max_batch in (1, 4, 8):
+        for window_ms in (0, 50, 150):
+            if max_batch == 1 and window_ms:
+                continue
+            result = run(max_batch, window_ms / 1000)
+            print(f"   {max_batch:>5} {window_ms:>5}ms {result['requests']:>9} "
+                  f"{result['busy_lines_per_sec']:>8.1f} {result['mean_delay_ms']:>9.0f}ms "
+                  f"{result['p95_delay_ms']:>8.0f}ms")
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
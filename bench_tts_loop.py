@@ -0,0 +1,153 @@
+"""
+Benchmark: asyncio.run() per request vs persistent AsyncLoopThread
+Measures the per-request event loop setup/teardown that TTSEngine no longer pays
+
+Usage:
+    python bench_tts_loop.py          # loop overhead + local fake Edge server (offline)
+    python bench_tts_loop.py --edge   # also time real Edge TTS requests
+"""
+import asyncio
+import sys
+import time
+
+from async_loop import AsyncLoopThread
+
+REQUESTS = 200
+SERVER_REQUESTS = 50
+EDGE_REQUESTS = 5
+EDGE_TEXT = "Xin chào các bạn, đây là bài test"
+EDGE_VOICE = "vi-VN-HoaiMyNeural"
+
+
+async def noop_request():
+    """Stand-in for a request: one round trip through the loop"""
+    await asyncio.sleep(0)
+
+
+def per_request(fn, count):
+    start = time.perf_counter()
+    for _ in range(count):
+        fn()
+    return (time.perf_counter() - start) / count * 1000
+
+
+def bench_overhead(loop_thread):
+    print("\n📊 Loop overhead per request (no network)")
+    run_ms = per_request(lambda: asyncio.run(noop_request()), REQUESTS)
+    persistent_ms = per_request(lambda: loop_thread.run(noop_request()), REQUESTS)
+    print(f"   asyncio.run()       {run_ms:7.3f} ms")
+    print(f"   persistent loop     {persistent_ms:7.3f} ms")
+    print(f"   Eliminated overhead {run_ms - persistent_ms:7.3f} ms/request")
+
+
+def start_fake_edge_server(server_thread, audio_chunks=8, chunk_bytes=4096):
+    """
+    Local websocket server shaped like Edge TTS: one text request in,
+    a few binary audio frames out, then close
+
+    Returns:
+        tuple: (url, aiohttp AppRunner)
+    """
+    from aiohttp import WSMsgType, web
+
+    async def synthesize(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for message in ws:
+            if message.type == WSMsgType.TEXT:
+                for _ in range(audio_chunks):
+                    await ws.send_bytes(b"\x00" * chunk_bytes)
+                break
+        await ws.close()
+        return ws
+
+    async def start():
+        app = web.Application()
+        app.router.add_get('/tts', synthesize)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        return f"http://127.0.0.1:{port}/tts", runner
+
+    return server_thread.run(start(), timeout=10)
+
+
+def bench_fake_server(loop_thread):
+    """Per-request session + websocket round trip, as edge_tts.Communicate does"""
+    try:
+        import aiohttp
+    except ImportError:
+        print("\n⚠️ aiohttp not installed (comes with edge_tts), skipping fake server benchmark")
+        return
+
+    server_thread = AsyncLoopThread(name='fake-edge-server')
+    try:
+        url, runner = start_fake_edge_server(server_thread)
+
+        async def synthesize():
+            size = 0
+            async with aiohttp.ClientSession() as session:
+                async with session.ws_connect(url) as ws:
+                    await ws.send_str(EDGE_TEXT)
+                    async for message in ws:
+                        if message.type == aiohttp.WSMsgType.BINARY:
+                            size += len(message.data)
+            return size
+
+        size = asyncio.run(synthesize())
+
+        print(f"\n📊 Local fake Edge server ({SERVER_REQUESTS} requests, {size // 1024} KB audio each)")
+        run_ms = per_request(lambda: asyncio.run(synthesize()), SERVER_REQUESTS)
+        persistent_ms = per_request(lambda: loop_thread.run(synthesize(), timeout=10), SERVER_REQUESTS)
+        print(f"   asyncio.run()       {run_ms:7.3f} ms")
+        print(f"   persistent loop     {persistent_ms:7.3f} ms")
+        print(f"   Eliminated overhead {run_ms - persistent_ms:7.3f} ms/request")
+
+        server_thread.run(runner.cleanup(), timeout=10)
+    finally:
+        server_thread.stop()
+
+
+def bench_edge(loop_thread):
+    try:
+        import edge_tts
+    except ImportError:
+        print("\n⚠️ edge_tts not installed, skipping Edge benchmark")
+        return
+
+    async def synthesize():
+        communicate = edge_tts.Communicate(EDGE_TEXT, EDGE_VOICE)
+        size = 0
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                size += len(chunk["data"])
+        return size
+
+    print(f"\n📊 Edge TTS end-to-end ({EDGE_REQUESTS} requests)")
+    run_ms = per_request(lambda: asyncio.run(synthesize()), EDGE_REQUESTS)
+    persistent_ms = per_request(lambda: loop_thread.run(synthesize()), EDGE_REQUESTS)
+    print(f"   asyncio.run()       {run_ms:7.1f} ms")
+    print(f"   persistent loop     {persistent_ms:7.1f} ms")
+
+
+def main():
+    print("=" * 70)
+    print("BENCHMARK: Edge TTS event loop reuse")
+    print("=" * 70)
+
+    loop_thread = AsyncLoopThread(name='bench-loop')
+    try:
+        bench_overhead(loop_thread)
+        bench_fake_server(loop_thread)
+        if '--edge' in sys.argv:
+            bench_edge(loop_thread)
+    finally:
+        loop_thread.stop()
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark Utilities
+Shared helpers for the bench_*.py scripts (WAV loading, test sets, error rates)
+"""
+import os
+import re
+import time
+import wave
+
+import numpy as np
+
+
+def load_wav(path):
+    """
+    Load a PCM WAV file as mono float32
+
+    Args:
+        path: Path to a 16-bit (or 32-bit) PCM WAV file
+
+    Returns:
+        tuple: (audio float32 in [-1, 1], sample_rate)
+    """
+    with wave.open(path, 'rb') as wf:
+        channels = wf.getnchannels()
+        width = wf.getsampwidth()
+        rate = wf.getframerate()
+        raw = wf.readframes(wf.getnframes())
+
+    if width == 2:
+        audio = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+    elif width == 4:
+        audio = np.frombuffer(raw, dtype=np.int32).astype(np.float32) / 2147483648.0
+    else:
+        raise ValueError(f"Unsupported sample width: {width * 8} bit")
+
+    if channels > 1:
+        audio = audio.reshape(-1, channels).mean(axis=1)
+    return audio, rate
+
+
+def load_test_set(directory):
+    """
+    Collect (wav_path, reference_text) pairs
+
+    Every `name.wav` in the directory is paired with `name.txt` (UTF-8 reference
+    transcript); WAVs without a transcript get reference None.
+    """
+    items = []
+    for name in sorted(os.listdir(directory)):
+        if not name.lower().endswith('.wav'):
+            continue
+        wav_path = os.path.join(directory, name)
+        txt_path = os.path.splitext(wav_path)[0] + '.txt'
+        reference = None
+        if os.path.exists(txt_path):
+            with open(txt_path, 'r', encoding='utf-8') as f:
+                reference = f.read().strip()
+        items.append((wav_path, reference))
+    return items
+
+
+_IGNORED_CHARS = re.compile(r'[\s\.,!?;:，。！？；：、"\'“”‘’()（）《》]+')
+
+
+def _edit_distance(ref, hyp):
+    prev = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        cur = [i] + [0] * len(hyp)
+        for j, h in enumerate(hyp, 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (r != h))
+        prev = cur
+    return prev[-1]
+
+
+def char_error_rate(reference, hypothesis):
+    """
+    Character error rate, ignoring whitespace and punctuation (suits Chinese)
+
+    Returns:
+        float: edits / reference length (0.0 for an empty reference)
+    """
+    ref = _IGNORED_CHARS.sub('', reference or '').lower()
+    hyp = _IGNORED_CHARS.sub('', hypothesis or '').lower()
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    return _edit_distance(ref, hyp) / len(ref)
+
+
+def word_error_rate(reference, hypothesis):
+    """Word error rate on whitespace-separated tokens (suits Vietnamese/English)"""
+    ref = _IGNORED_CHARS.sub(' ', reference or '').lower().split()
+    hyp = _IGNORED_CHARS.sub(' ', hypothesis or '').lower().split()
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    return _edit_distance(ref, hyp) / len(ref)
+
+
+def time_call(fn, *args, repeat=5, **kwargs):
+    """
+    Time a function call
+
+    Returns:
+        tuple: (best seconds over `repeat` runs, last result)
+    """
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def load_whisper_model(model='small', compute_type='int8'):
+    """Load a WhisperModel for benchmarks (None if faster-whisper is not installed)"""
+    try:
+        from faster_whisper import WhisperModel
+    except ImportError:
+        print("⚠️ faster-whisper not installed, skipping transcription benchmark")
+        return None
+
+    try:
+        import torch
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+    except ImportError:
+        device = "cpu"
+    return WhisperModel(model, device=device, compute_type=compute_type)
@@ -0,0 +1,211 @@
+"""
+Benchmark: capture-loop speech gates
+How many seconds of non-speech each gate sends to Whisper (and how much speech it misses)
+
+Usage:
+    python bench_vad.py [corpus_dir]
+
+corpus_dir holds name.wav + name.speech.txt pairs; each line of the .txt is
+"start end" (seconds) of one labeled speech region. Without a corpus, a
+synthetic game-audio mix (speech-like bursts, music bed, explosions) is used.
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+from bench_utils import load_wav
+from config import Config
+from resampler import StreamingPreprocessor
+from vad import create_vad
+
+CHUNK = Config.AUDIO['chunk_size']
+WHISPER_RATE = Config.AUDIO['whisper_rate']
+PAUSE_TIME = 0.3           # Capture loop settings (voicetrans.py)
+MIN_AUDIO_LENGTH = 1.0
+MAX_BUFFER_DURATION = 4.0
+
+
+def synthetic_corpus(rate=48000, seconds=60, seed=0):
+    """
+    Returns:
+        tuple: (audio, rate, [(start, end) speech regions])
+    """
+    rng = np.random.default_rng(seed)
+    audio = np.zeros(rate * seconds, dtype=np.float32)
+    t = np.arange(len(audio)) / rate
+
+    # Music bed (chords with harmonics) from 10s to 50s
+    music = np.zeros_like(audio)
+    for i, root in enumerate((220.0, 261.6, 196.0, 246.9) * 10):
+        start, end = int((10 + i) * rate), int((11 + i) * rate)
+        if start >= int(50 * rate):
+            break
+        for ratio in (1.0, 1.25, 1.5, 2.0):
+            for harmonic in (1, 2, 3):
+                music[start:end] += np.sin(2 * np.pi * root * ratio * harmonic * t[start:end]) / (harmonic * 8)
+    audio += 0.08 * music
+
+    # Explosions: loud low-passed noise bursts with a fast decay
+    for at in (5.0, 22.0, 37.5, 55.0):
+        n = int(1.2 * rate)
+        noise = rng.standard_normal(n)
+        kernel = np.ones(240) / 240  # ~200 Hz low-pass at 48 kHz
+        rumble = np.convolve(noise, kernel, mode='same') * np.exp(-np.arange(n) / (0.35 * rate))
+        start = int(at * rate)
+        audio[start:start + n] += (0.9 * rumble / np.abs(rumble).max()).astype(np.float32)
+
+    # Speech-like bursts: voiced syllables with a moving pitch and formant-shaped harmonics
+    regions = []
+    for at, length in ((2.0, 2.2), (13.0, 3.0), (26.0, 5.5), (41.0, 2.5), (57.0, 1.5)):
+        start = int(at * rate)
+        pos = start
+        end = start + int(length * rate)
+        while pos < end:
+            syllable = int(rng.uniform(0.15, 0.25) * rate)
+            n = min(syllable, end - pos)
+            ts = np.arange(n) / rate
+            f0 = rng.uniform(110, 230) * (1 + 0.1 * np.sin(2 * np.pi * 3 * ts))
+            phase = 2 * np.pi * np.cumsum(f0) / rate
+            voice = np.zeros(n)
+            for harmonic in range(1, 20):
+                freq = f0.mean() * harmonic
+                gain = np.exp(-((freq - 700) / 600) ** 2) + 0.6 * np.exp(-((freq - 1800) / 500) ** 2)
+                voice += gain * np.sin(harmonic * phase)
+            voice *= np.sin(np.pi * np.arange(n) / n) ** 2
+            audio[pos:pos + n] += (0.25 * voice / np.abs(voice).max()).astype(np.float32)
+            pos += n + int(rng.uniform(0.02, 0.08) * rate)
+        regions.append((at, at + length))
+
+    return np.clip(audio, -1, 1), rate, regions
+
+
+def load_corpus(directory):
+    items = []
+    for name in sorted(os.listdir(directory)):
+        if not name.lower().endswith('.wav'):
+            continue
+        path = os.path.join(directory, name)
+        labels = os.path.splitext(path)[0] + '.speech.txt'
+        if not os.path.exists(labels):
+            continue
+        with open(labels, 'r', encoding='utf-8') as f:
+            regions = [tuple(map(float, line.split()[:2])) for line in f if line.strip()]
+        audio, rate = load_wav(path)
+        items.append((audio, rate, regions))
+    return items
+
+
+def simulate(audio, rate, gate):
+    """
+    Replay the capture loop with a speech gate
+
+    Args:
+        gate: fn(raw chunk, 16 kHz chunk) -> bool
+
+    Returns:
+        tuple: (list of sent chunk start times, gate seconds of CPU)
+    """
+    preprocessor = StreamingPreprocessor(rate, 1, WHISPER_RATE)
+    chunk_s = CHUNK / rate
+    sent, utterance = [], []
+    first_speech = last_speech = None
+    gate_time = 0.0
+
+    for i in range(0, len(audio) - CHUNK + 1, CHUNK):
+        now = i / rate
+        raw = audio[i:i + CHUNK]
+        start = time.perf_counter()
+        speech = gate(raw, preprocessor.process(raw))
+        gate_time += time.perf_counter() - start
+
+        if speech:
+            if first_speech is None:
+                first_speech = now
+            utterance.append(now)
+            last_speech = now
+            if now + chunk_s - first_speech > MAX_BUFFER_DURATION:
+                sent.extend(utterance)
+                utterance, first_speech = [], None
+        elif utterance and now - last_speech > PAUSE_TIME:
+            if now - first_speech > MIN_AUDIO_LENGTH:
+                sent.extend(utterance)
+            utterance, first_speech = [], None
+
+    if utterance and last_speech - first_speech > MIN_AUDIO_LENGTH:
+        sent.extend(utterance)
+    return sent, gate_time
+
+
+def score(sent, chunk_s, regions):
+    """
+    Returns:
+        tuple: (whisper seconds, wasted non-speech seconds, missed speech seconds)
+    """
+    def in_speech(t):
+        return any(start <= t + chunk_s / 2 < end for start, end in regions)
+
+    wasted = sum(chunk_s for t in sent if not in_speech(t))
+    speech_total = sum(end - start for start, end in regions)
+    caught = sum(chunk_s for t in sent if in_speech(t))
+    return len(sent) * chunk_s, wasted, max(0.0, speech_total - caught)
+
+
+def make_gates():
+    """Fresh gates (detector state is per file)"""
+    gates = [("mean|x| > 0.01 (old)", lambda raw, audio16: np.abs(raw).mean() > 0.01)]
+
+    def detector_gate(detector):
+        return lambda raw, audio16: detector.is_speech(audio16)
+
+    energy, _ = create_vad({'vad_backend': 'energy'}, WHISPER_RATE)
+    gates.append(("Energy VAD", detector_gate(energy)))
+
+    hybrid, warning = create_vad({'vad_backend': 'hybrid'}, WHISPER_RATE)
+    if not warning:
+        gates.append(("Energy + Silero VAD", detector_gate(hybrid)))
+    return gates, warning
+
+
+def main():
+    print("=" * 70)
+    print("BENCHMARK: speech gate -> wasted Whisper seconds")
+    print("=" * 70)
+
+    if len(sys.argv) > 1:
+        corpus = load_corpus(sys.argv[1])
+        if not corpus:
+            print(f"\n⚠️ No wav/.speech.txt pairs found in {sys.argv[1]}")
+            return
+        label = sys.argv[1]
+    else:
+        corpus = [synthetic_corpus()]
+        label = "synthetic game mix (music bed, explosions, speech bursts)"
+
+    total_s = sum(len(audio) / rate for audio, rate, _ in corpus)
+    speech_s = sum(end - start for _, _, regions in corpus for start, end in regions)
+    print(f"\n📊 {label}: {total_s:.1f}s audio, {speech_s:.1f}s labeled speech")
+
+    results = {}
+    for audio, rate, regions in corpus:
+        gates, warning = make_gates()
+        for name, gate in gates:
+            sent, gate_time = simulate(audio, rate, gate)
+            totals = results.setdefault(name, np.zeros(4))
+            totals += (*score(sent, CHUNK / rate, regions), gate_time)
+
+    if warning:
+        print(f"⚠️ Hybrid VAD skipped: {warning}")
+    print(f"\n   {'gate':<24} {'to Whisper':>11} {'wasted':>8} {'missed':>8} {'gate cost':>10}")
+    for name, (sent_s, wasted_s, missed_s, cost) in results.items():
+        print(f"   {name:<24} {sent_s:9.1f}s {wasted_s:6.1f}s {missed_s:6.1f}s "
+              f"{cost / total_s * 1000:7.2f}ms/s")
+
+    print("\n   wasted: non-speech seconds Whisper would decode")
+    print("   missed: labeled speech seconds never sent")
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Check: forced-cut chunking on recorded WAV files
+Replays long recordings (cutscenes, monologues) through the 4s forced cut
+with and without the overlap tail and compares the transcripts to references
+
+Usage:
+    python check_overlap_chunking.py wav_dir [model]
+
+wav_dir holds name.wav + name.txt (Chinese reference) pairs, ideally longer
+than max_buffer_duration. Exits with status 1 if overlap chunking is worse
+than hard cuts on any file.
+"""
+import sys
+
+from bench_utils import char_error_rate, load_test_set, load_wav, load_whisper_model
+from config import Config
+from overlap_chunker import OverlapChunker
+from resampler import resample
+
+WHISPER_RATE = 16000
+MAX_BUFFER_DURATION = 4.0  # Same forced cut as the capture loop
+OPTIONS = {'beam_size': 5, 'language': 'zh', 'vad_filter': False, 'no_speech_threshold': 0.6}
+
+
+def hard_cuts(model, audio):
+    """Previous behaviour: every 4s piece is transcribed on its own"""
+    step = int(MAX_BUFFER_DURATION * WHISPER_RATE)
+    parts = []
+    for start in range(0, len(audio), step):
+        segments, _ = model.transcribe(audio[start:start + step], **OPTIONS)
+        parts.append("".join(s.text for s in segments).strip())
+    return parts
+
+
+def overlap_cuts(model, audio):
+    """Forced cuts with an overlap tail, as in the capture loop"""
+    settings = Config.OVERLAP_CHUNKING
+    chunker = OverlapChunker(settings['guard'], settings['max_overlap'])
+    parts = []
+    start = 0
+    while True:
+        end = min(start + int(MAX_BUFFER_DURATION * WHISPER_RATE), len(audio))
+        final = end >= len(audio)
+        segments, _ = model.transcribe(audio[start:end], word_timestamps=True, **OPTIONS)
+        words = [(w.start, w.end, w.word) for s in segments for w in (s.words or [])]
+        text, keep = chunker.split(words, (end - start) / WHISPER_RATE, final)
+        parts.append(text)
+        if final:
+            return parts
+        start = end - int(round(keep * WHISPER_RATE))
+
+
+def main():
+    print("=" * 70)
+    print("CHECK: overlap chunking at the max_buffer_duration cut")
+    print("=" * 70)
+
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return 0
+
+    items = [(path, ref) for path, ref in load_test_set(sys.argv[1]) if ref]
+    if not items:
+        print(f"\n⚠️ No wav/txt pairs found in {sys.argv[1]}")
+        return 0
+
+    model = load_whisper_model(sys.argv[2] if len(sys.argv) > 2 else 'small')
+    if model is None:
+        return 0
+
+    failures = 0
+    totals = {'hard': 0.0, 'overlap': 0.0}
+    for path, reference in items:
+        audio, rate = load_wav(path)
+        if rate != WHISPER_RATE:
+            audio = resample(audio, rate, WHISPER_RATE)
+
+        hard = hard_cuts(model, audio)
+        overlap = overlap_cuts(model, audio)
+        hard_cer = char_error_rate(reference, "".join(hard))
+        overlap_cer = char_error_rate(reference, "".join(overlap))
+        totals['hard'] += hard_cer
+        totals['overlap'] += overlap_cer
+
+        ok = overlap_cer <= hard_cer + 1e-9
+        failures += not ok
+        print(f"\n{'✅' if ok else '❌'} {path} ({len(audio) / WHISPER_RATE:.1f}s)")
+        print(f"   hard cuts   CER {hard_cer * 100:6.2f}%  {' | '.join(hard)}")
+        print(f"   overlap     CER {overlap_cer * 100:6.2f}%  {' | '.join(overlap)}")
+
+    print(f"\n📊 Mean CER: hard cuts {totals['hard'] / len(items) * 100:.2f}%, "
+          f"overlap {totals['overlap'] / len(items) * 100:.2f}%")
+    print(f"   {len(items) - failures}/{len(items)} files OK")
+    print("\n" + "=" * 70)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,7 @@
 import pyttsx3
 
+from voice_catalog import get_catalog
+
 print("=" * 80)
 print("CHECKING ALL AVAILABLE TTS VOICES ON YOUR SYSTEM")
 print("=" * 80)
@@ -7,66 +9,43 @@ print("=" * 80)
 try:
     engine = pyttsx3.init()
     voices = engine.getProperty('voices')
-    
+    # Always enumerate here (diagnostic) and refresh the cache the app reads
+    catalog = get_catalog(engine, refresh=True)
+
     print(f"\n✅ Found {len(voices)} TTS voices:\n")
-    
-    for i, voice in enumerate(voices):
+
+    for i, (voice, entry) in enumerate(zip(voices, catalog.voices)):
         print(f"\n{'='*80}")
         print(f"Voice #{i + 1}:")
         print(f"{'='*80}")
         print(f"  ID: {voice.id}")
         print(f"  Name: {voice.name}")
-        
-        # Print all attributes
+
+        # Raw driver fields
         if hasattr(voice, 'languages'):
             print(f"  Languages: {voice.languages}")
         if hasattr(voice, 'gender'):
             print(f"  Gender: {voice.gender}")
         if hasattr(voice, 'age'):
             print(f"  Age: {voice.age}")
-        
-        # Check if it might be Vietnamese with more patterns
-        is_vietnamese = False
-        reasons = []
-        
-        # Check name
-        name_lower = voice.name.lower()
-        if 'vietnam' in name_lower or 'việt' in name_lower or 'viet' in name_lower:
-            is_vietnamese = True
-            reasons.append("Name contains Vietnamese keywords")
-        
-        # Check ID
-        id_lower = voice.id.lower()
-        if 'vi-' in id_lower or 'vi_' in id_lower or 'vietnam' in id_lower or 'viet' in id_lower:
-            is_vietnamese = True
-            reasons.append("ID contains Vietnamese keywords")
-        
-        # Check languages
-        if hasattr(voice, 'languages') and voice.languages:
-            for lang in voice.languages:
-                lang_str = str(lang).lower()
-                if 'vi' in lang_str or 'vietnam' in lang_str:
-                    is_vietnamese = True
-                    reasons.append(f"Language tag: {lang}")
-        
-        if is_vietnamese:
+
+        # What the app makes of them
+        print(f"  Detected language: {entry['language'] or 'Unknown'}")
+        print(f"  Detected gender: {entry['gender'] or 'Unknown'}")
+
+        if entry['language'] == 'vi':
             print(f"\n  ⭐⭐⭐ VIETNAMESE VOICE DETECTED! ⭐⭐⭐")
-            print(f"  Reasons: {', '.join(reasons)}")
-        
+
         print("-" * 80)
-    
+
     print("\n" + "=" * 80)
     print("SUMMARY")
     print("=" * 80)
-    vietnamese_count = 0
-    for voice in voices:
-        name_lower = voice.name.lower()
-        id_lower = voice.id.lower()
-        if 'vietnam' in name_lower or 'việt' in name_lower or 'viet' in name_lower or 'vi-' in id_lower or 'vi_' in id_lower:
-            vietnamese_count += 1
-            print(f"✅ Vietnamese: {voice.name}")
-    
-    if vietnamese_count == 0:
+    vietnamese = catalog.find('vi')
+    for voice in vietnamese:
+        print(f"✅ Vietnamese: {voice['name']} ({voice['gender'] or 'unknown gender'})")
+
+    if not vietnamese:
         print("❌ No Vietnamese voices found!")
         print("\nPossible reasons:")
         print("1. Voice pack not installed correctly")
@@ -74,10 +53,12 @@ try:
         print("3. Voice is installed but not registered with pyttsx3")
         print("\nTry using Google TTS instead (check the box in the app)")
     else:
-        print(f"\n✅ Found {vietnamese_count} Vietnamese voice(s)!")
-    
+        print(f"\n✅ Found {len(vietnamese)} Vietnamese voice(s)!")
+        print(f"   App uses: female -> {catalog.best('vi', 'female')}")
+        print(f"             male   -> {catalog.best('vi', 'male')}")
+
     print("=" * 80)
-    
+
 except Exception as e:
     print(f"❌ Error: {e}")
     import traceback
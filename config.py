@@ -3,6 +3,7 @@ Configuration Module
 Centralized settings management
 OPTIMIZED FOR FAST RESPONSE!
 """
+import os
 
 class Config:
     """Application configuration"""
@@ -49,7 +50,150 @@ class Config:
         'pause_time': 0.2,  # ⚡ FAST: Dịch ngay sau 0.2s pause
         'min_audio_length': 0.3,  # ⚡ FAST: Chấp nhận câu ngắn 0.3s
         'padding_words': 1,
-        'padding_word': 'ừm'  # Từ đệm ngắn gọn
+        'padding_word': 'ừm',  # Từ đệm ngắn gọn
+        'tts_streaming': True,  # ⚡ Edge TTS: play while synthesizing
+        'tts_cache': True,  # 💾 Reuse audio of repeated lines
+        'translator_backend': 'google',
+        'pipeline_mode': 'cascade',
+        'stt_mode': 'utterance',
+        'decoding_profile': 'balanced'
+    }
+    
+    # Translation backends
+    TRANSLATOR_BACKENDS = {
+        'google': '🌐 Google Translate (online)',
+        'local': '💻 Local MT (offline, ~20-50ms)'
+    }
+    
+    # Pipeline modes
+    PIPELINE_MODES = {
+        'cascade': '🔗 Whisper (zh) → Translator (vi)',
+        'whisper_translate': '⚡ Whisper translate (en) → MT hop (vi)'
+    }
+    
+    # Whisper decoding profiles (beam_size None = Beam Size slider)
+    DECODING_PROFILES = {
+        'realtime': {
+            'display': '⚡ Realtime (greedy, no fallback)',
+            'beam_size': 1,
+            'best_of': 1,
+            'temperature': 0.0,             # No temperature fallback re-decodes
+            'without_timestamps': True,
+            'max_new_tokens': 128,          # Bounds runaway hallucinations
+            'condition_on_previous_text': False
+        },
+        'balanced': {
+            'display': '⚖️ Balanced (Beam Size slider, short fallback)',
+            'beam_size': None,
+            'best_of': 3,
+            'temperature': (0.0, 0.2, 0.4),
+            'condition_on_previous_text': False
+        },
+        'accurate': {
+            'display': '🎯 Accurate (beam 5, full fallback)',
+            'beam_size': 5,
+            'best_of': 5,
+            'temperature': (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+        }
+    }
+    
+    # Batched STT for backlogged utterances (voicetrans_modular)
+    STT_BATCH = {
+        'max_batch': 8,   # Utterances per batched Whisper call
+        'window_ms': 0    # Extra wait for more utterances (0 = only what is already queued)
+    }
+    
+    # Speech-to-text modes
+    STT_MODES = {
+        'utterance': '🧩 Utterance (transcribe after each pause)',
+        'streaming': '🌊 Streaming (emit stable words while speaking)'
+    }
+    
+    # Streaming STT (local agreement over a re-decoded window)
+    STREAMING_STT = {
+        'update_interval': 0.6,   # Seconds of new audio between re-decodes
+        'min_chunk': 1.0,         # Don't decode windows shorter than this
+        'buffer_trim': 12.0,      # Drop committed audio once the window is longer
+        'min_fragment_chars': 6,  # Hold tiny fragments back (better translations)
+        'prompt_chars': 200       # Trimmed text fed back as initial_prompt
+    }
+    
+    # Overlap between forced cuts (max_buffer_duration) in utterance mode
+    OVERLAP_CHUNKING = {
+        'enabled': True,
+        'guard': 0.5,        # Words ending this close to a cut wait for the next chunk
+        'max_overlap': 2.0   # Longest audio tail carried into the next chunk
+    }
+    
+    # Translation micro-batching (bursty dialogue)
+    TRANSLATION = {
+        'batch_size': 8,        # Max lines per request
+        'batch_window_ms': 50   # Extra wait for more lines after the first one
+    }
+    
+    # Local caches (survive restarts)
+    CACHE = {
+        'dir': os.path.join(os.path.expanduser('~'), '.gamevoicetrans'),
+        'tts_memory_mb': 32,
+        'tts_disk_mb': 256,
+        'translation_file': 'translations.json',
+        'translation_max_entries': 5000,
+        'translation_ttl_hours': None  # None = never expire
+    }
+    
+    # Installed pyttsx3 voices, cached in CACHE['dir']
+    VOICE_CATALOG = {
+        'file': 'voices.json',
+        'max_age_hours': 24 * 7   # Re-enumerate weekly (None = only when the driver/OS changes)
+    }
+    
+    # Offline MT (CTranslate2-converted MarianMT / NLLB model)
+    LOCAL_MT = {
+        'model_dir': os.path.join(CACHE['dir'], 'models', 'opus-mt-zh-vi'),
+        'device': 'cpu',
+        'compute_type': 'int8',
+        'beam_size': 2,
+        'source_prefix': None,  # NLLB: 'zho_Hans'
+        'target_prefix': None,  # NLLB: 'vie_Latn'
+        'pivot_model_dir': os.path.join(CACHE['dir'], 'models', 'opus-mt-en-vi')  # whisper_translate hop
+    }
+    
+    # Loaded Whisper models kept across Stop/Start (LRU over this estimate)
+    MODEL_REGISTRY = {
+        'memory_budget_mb': 4096
+    }
+    
+    # Voice activity detection (capture loop speech gate)
+    VAD = {
+        'backend': 'hybrid',          # 'energy' or 'hybrid' (energy gate + Silero)
+        'silero_model': os.path.join(CACHE['dir'], 'models', 'silero_vad.onnx'),
+        'speech_threshold': 0.5,      # Silero speech probability
+        'margin_db': 8.0,             # Above the adaptive noise floor
+        'min_level_db': -50.0,        # Always silence below this (dBFS)
+        'floor_rise_s': 4.0,          # Music/ambience is absorbed into the floor
+        'floor_fall_s': 0.1,
+        'floor_freeze_s': 4.0,        # Floor held during speech (longer runs = background)
+        'min_speech_band_ratio': 0.3, # Energy share in 250-4000 Hz (rejects rumble)
+        'hangover_ms': 200            # Keep word endings
+    }
+    
+    # Streaming TTS playback (Edge)
+    TTS_STREAMING = {
+        'first_segment_ms': 200,  # Jitter buffer before the first sound
+        'segment_ms': 600         # Audio decoded per following segment
+    }
+    
+    # Pipelined TTS: synthesize upcoming lines while the current one plays
+    TTS_PIPELINE = {
+        'workers': 2,     # Lines synthesized concurrently (pyttsx3 always uses 1)
+        'lookahead': 4    # Lines ready/being synthesized ahead of playback
+    }
+    
+    # Playback backend for synthesized lines
+    PLAYBACK = {
+        'backend': 'pygame',        # 'pygame' (mixer channel) | 'pcm' (persistent PortAudio stream)
+        'pcm_buffer_frames': 256,   # PCM callback size (~11ms @ 24kHz)
+        'crossfade_ms': 0           # PCM only: overlap consecutive lines (0 = back to back)
     }
     
     # Audio Settings
@@ -71,6 +215,7 @@ class Config:
         'bg': '#2b2b2b',
         'fg': 'white',
         'chinese': '#2196F3',
+        'english': '#90CAF9',
         'vietnamese': '#4CAF50',
         'info': '#FFC107',
         'error': '#f44336',
@@ -0,0 +1,32 @@
+"""
+Decoding Profiles Module
+Named Whisper decoding presets (latency vs accuracy) merged with the UI settings
+"""
+from config import Config
+
+
+def decoding_options(settings=None, **overrides):
+    """
+    Keyword arguments for WhisperModel.transcribe
+
+    The profile named in settings['decoding_profile'] supplies the search
+    settings; a profile without its own beam_size uses the Beam Size slider
+    (settings['beam_size']). Call-site options (language, task, VAD...) are
+    passed as overrides and win over the profile.
+
+    Args:
+        settings: Settings dict
+        **overrides: Options of the calling transcribe site
+
+    Returns:
+        dict
+    """
+    settings = settings or {}
+    name = settings.get('decoding_profile', Config.DEFAULTS['decoding_profile'])
+    profile = Config.DECODING_PROFILES.get(name) or Config.DECODING_PROFILES[Config.DEFAULTS['decoding_profile']]
+
+    options = {key: value for key, value in profile.items() if key != 'display'}
+    if options.get('beam_size') is None:
+        options['beam_size'] = settings.get('beam_size', Config.DEFAULTS['beam_size'])
+    options.update(overrides)
+    return options
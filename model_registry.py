@@ -0,0 +1,151 @@
+"""
+Model Registry Module
+Process-wide cache of loaded Whisper models shared by every TranslatorEngine
+"""
+import threading
+from collections import OrderedDict
+
+from config import Config
+
+# Approximate float16 weight size per model (MB); int8 is half, float32 double
+APPROX_MODEL_MB = {
+    'tiny': 75,
+    'base': 145,
+    'small': 485,
+    'medium': 1530,
+    'large-v2': 3090,
+    'large-v3': 3090
+}
+COMPUTE_TYPE_SCALE = {
+    'int8': 0.5,
+    'int8_float16': 0.5,
+    'int8_float32': 0.5,
+    'float16': 1.0,
+    'float32': 2.0
+}
+
+
+def _load_whisper(model_name, device, compute_type):
+    from faster_whisper import WhisperModel
+    return WhisperModel(model_name, device=device, compute_type=compute_type)
+
+
+class ModelRegistry:
+    """
+    Loaded models keyed by (model, device, compute_type)
+
+    get() returns the cached instance by reference, so a Stop/Start with
+    the same model costs nothing. Concurrent requests for a model that is
+    still loading wait for that one load. When the estimated footprint goes
+    over `memory_budget_mb`, the least recently used models are dropped
+    (their memory is freed once no running engine holds them).
+    """
+
+    def __init__(self, memory_budget_mb=4096, loader=_load_whisper):
+        """
+        Args:
+            memory_budget_mb: Estimated memory all cached models may use
+            loader: fn(model_name, device, compute_type) -> model
+        """
+        self.memory_budget_mb = memory_budget_mb
+        self.loader = loader
+        self.lock = threading.Lock()
+
+        self._models = OrderedDict()  # key -> model (LRU order)
+        self._loading = {}            # key -> threading.Event
+
+        self.hits = 0
+        self.loads = 0
+        self.evictions = 0
+
+    @staticmethod
+    def estimate_mb(key):
+        model_name, _, compute_type = key
+        return APPROX_MODEL_MB.get(model_name, 1000) * COMPUTE_TYPE_SCALE.get(compute_type, 1.0)
+
+    def contains(self, model_name, device, compute_type):
+        with self.lock:
+            return (model_name, device, compute_type) in self._models
+
+    def get(self, model_name, device, compute_type):
+        """
+        Cached model, loading it on first use
+
+        Raises:
+            Whatever the loader raises (nothing is cached then)
+        """
+        key = (model_name, device, compute_type)
+        while True:
+            with self.lock:
+                model = self._models.get(key)
+                if model is not None:
+                    self._models.move_to_end(key)
+                    self.hits += 1
+                    return model
+                event = self._loading.get(key)
+                owner = event is None
+                if owner:
+                    event = self._loading[key] = threading.Event()
+
+            if owner:
+                break
+            # Another thread is loading this model: wait and look again
+            event.wait()
+
+        model = None
+        try:
+            model = self.loader(model_name, device, compute_type)
+        finally:
+            # Publish the model before waking waiters, so none of them loads it again
+            with self.lock:
+                del self._loading[key]
+                if model is not None:
+                    self._models[key] = model
+                    self.loads += 1
+                    self._evict(keep=key)
+            event.set()
+        return model
+
+    def release(self, model_name, device, compute_type):
+        """Drop one model from the cache"""
+        with self.lock:
+            self._models.pop((model_name, device, compute_type), None)
+
+    def clear(self):
+        with self.lock:
+            self._models.clear()
+
+    def stats(self):
+        with self.lock:
+            return {
+                'models': [key[0] for key in self._models],
+                'estimated_mb': sum(self.estimate_mb(key) for key in self._models),
+                'hits': self.hits,
+                'loads': self.loads,
+                'evictions': self.evictions
+            }
+
+    def _evict(self, keep):
+        """Drop LRU models until the estimate fits the budget (caller holds the lock)"""
+        total = sum(self.estimate_mb(key) for key in self._models)
+        for key in list(self._models):
+            if total <= self.memory_budget_mb:
+                break
+            if key == keep:
+                continue
+            del self._models[key]
+            total -= self.estimate_mb(key)
+            self.evictions += 1
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def default_registry():
+    """Process-wide registry configured from Config.MODEL_REGISTRY"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry(Config.MODEL_REGISTRY['memory_budget_mb'])
+        return _registry
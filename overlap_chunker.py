@@ -0,0 +1,80 @@
+"""
+Overlap Chunker Module
+Bounded-latency chunking of long speech with an overlap tail between forced cuts
+"""
+from streaming_stt import join_words
+
+
+class OverlapChunker:
+    """
+    Decides what to emit at a forced cut and how much audio to carry over
+
+    At a forced cut only words that end at least `guard` seconds before the
+    cut are emitted (a word that close to the cut may be chopped). The audio
+    from the end of the last emitted word is kept (at most `max_overlap`
+    seconds) and decoded again as the start of the next chunk, where the
+    held-back words are heard whole. Words of the next chunk that were
+    already emitted are dropped by timestamp and by n-gram match.
+    """
+
+    def __init__(self, guard=0.5, max_overlap=2.0):
+        """
+        Args:
+            guard: Words ending within this many seconds of a cut are held back
+            max_overlap: Upper bound of the audio tail carried into the next chunk
+        """
+        self.guard = guard
+        self.max_overlap = max_overlap
+        self.reset()
+
+    def reset(self):
+        """Start a new utterance"""
+        self.chunk_start = 0.0    # Utterance time of the current chunk's first sample
+        self.emitted_until = 0.0  # Utterance time where the last emitted word ends
+        self.last_words = []      # Texts of the last emitted words (n-gram dedupe)
+
+    @property
+    def in_progress(self):
+        """True if the current chunk continues a forced cut (holds back audio)"""
+        return self.chunk_start > 0.0
+
+    def split(self, words, chunk_duration, final):
+        """
+        Take the word-timestamped transcript of the current chunk
+
+        Args:
+            words: (start, end, text) relative to the chunk start
+            chunk_duration: Seconds of audio in the chunk
+            final: True at the end of the utterance (pause), False at a forced cut
+
+        Returns:
+            tuple: (text to emit, seconds of audio tail to keep for the next chunk)
+        """
+        words = [(start + self.chunk_start, end + self.chunk_start, text) for start, end, text in words]
+        words = self._drop_emitted(words)
+        chunk_end = self.chunk_start + chunk_duration
+
+        if final:
+            self.reset()
+            return join_words(words).strip(), 0.0
+
+        emit = [word for word in words if word[1] <= chunk_end - self.guard]
+        if emit:
+            self.emitted_until = emit[-1][1]
+            self.last_words = [word[2].strip() for word in emit[-5:]]
+
+        keep = min(max(chunk_end - self.emitted_until, self.guard), self.max_overlap, chunk_duration)
+        self.chunk_start = chunk_end - keep
+        return join_words(emit).strip(), keep
+
+    def _drop_emitted(self, words):
+        # Timestamps: words centred before the emitted boundary were already spoken
+        words = [word for word in words if (word[0] + word[1]) / 2 > self.emitted_until]
+
+        # n-gram: the decode may repeat the last emitted words with shifted timestamps
+        if words and self.last_words and words[0][0] < self.emitted_until + self.guard:
+            longest = min(len(self.last_words), len(words), 5)
+            for n in range(longest, 0, -1):
+                if self.last_words[-n:] == [word[2].strip() for word in words[:n]]:
+                    return words[n:]
+        return words
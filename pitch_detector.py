@@ -0,0 +1,128 @@
+"""
+Pitch Detection Module
+Frame-wise FFT autocorrelation pitch estimator used for gender detection
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from config import Config
+
+
+class PitchEstimator:
+    """
+    Short-frame pitch (F0) estimator
+
+    Each frame's autocorrelation is computed with one batched FFT (O(n log n)
+    for the whole utterance), normalized by the window's own autocorrelation
+    and searched only over the lags of the min_hz..max_hz range. The
+    utterance pitch is the median over voiced frames.
+    """
+
+    def __init__(self, sample_rate=16000, frame_ms=48, hop_ms=16,
+                 min_hz=60, max_hz=400, voicing_threshold=0.45, silence_ratio=0.1):
+        """
+        Args:
+            sample_rate: Sample rate of the audio
+            frame_ms: Analysis frame length (must cover >= 2 periods of min_hz)
+            hop_ms: Hop between frames
+            min_hz: Lowest pitch searched
+            max_hz: Highest pitch searched
+            voicing_threshold: Minimum normalized autocorrelation peak for a voiced frame
+            silence_ratio: Frames quieter than this fraction of the loudest frame are skipped
+        """
+        self.sample_rate = sample_rate
+        self.frame_length = int(sample_rate * frame_ms / 1000)
+        self.hop_length = max(1, int(sample_rate * hop_ms / 1000))
+        self.min_lag = max(1, int(sample_rate / max_hz))
+        self.max_lag = min(self.frame_length - 1, int(np.ceil(sample_rate / min_hz)))
+        self.voicing_threshold = voicing_threshold
+        self.silence_ratio = silence_ratio
+
+        self.n_fft = 1 << int(np.ceil(np.log2(2 * self.frame_length)))
+        self.window = np.hanning(self.frame_length).astype(np.float32)
+
+        # Autocorrelation of the window itself, used to undo its taper
+        window_ac = np.fft.irfft(np.abs(np.fft.rfft(self.window, self.n_fft)) ** 2, self.n_fft)
+        self._window_ac = (window_ac[:self.max_lag + 2] / window_ac[0]).astype(np.float32)
+
+    def frame_pitches(self, audio):
+        """
+        Estimate pitch per frame
+
+        Args:
+            audio: Mono float audio array
+
+        Returns:
+            np.ndarray: F0 in Hz per frame (0.0 for unvoiced / silent frames)
+        """
+        audio = np.asarray(audio, dtype=np.float32)
+        if len(audio) < self.frame_length:
+            return np.zeros(0, dtype=np.float32)
+
+        frames = sliding_window_view(audio, self.frame_length)[::self.hop_length]
+        frames = frames - frames.mean(axis=1, keepdims=True)
+
+        energy = np.sqrt(np.mean(frames ** 2, axis=1))
+        loud = energy > max(energy.max() * self.silence_ratio, 1e-4)
+        pitches = np.zeros(len(frames), dtype=np.float32)
+        if not loud.any():
+            return pitches
+
+        spectrum = np.fft.rfft(frames[loud] * self.window, self.n_fft, axis=1)
+        ac = np.fft.irfft(np.abs(spectrum) ** 2, self.n_fft, axis=1)[:, :self.max_lag + 2]
+        ac = ac / np.maximum(ac[:, :1], 1e-12) / np.maximum(self._window_ac, 1e-3)
+
+        search = ac[:, self.min_lag:self.max_lag + 1]
+        best = search.max(axis=1)
+        # Prefer the shortest lag close to the best peak (avoids sub-octave errors)
+        lag = np.argmax(search >= 0.9 * best[:, None], axis=1)
+        # Climb to the local maximum of that peak
+        for _ in range(self.max_lag - self.min_lag):
+            right = np.minimum(lag + 1, search.shape[1] - 1)
+            climb = search[np.arange(len(lag)), right] > search[np.arange(len(lag)), lag]
+            if not climb.any():
+                break
+            lag = np.where(climb, right, lag)
+
+        # Parabolic interpolation around the peak
+        rows = np.arange(len(lag))
+        idx = lag + self.min_lag
+        left = ac[rows, idx - 1]
+        center = ac[rows, idx]
+        right = ac[rows, idx + 1]
+        denom = left - 2 * center + right
+        offset = np.where(np.abs(denom) > 1e-12, 0.5 * (left - right) / np.where(denom == 0, 1, denom), 0.0)
+        offset = np.clip(offset, -0.5, 0.5)
+
+        voiced = center >= self.voicing_threshold
+        frame_f0 = np.where(voiced, self.sample_rate / (idx + offset), 0.0)
+        pitches[loud] = frame_f0
+        return pitches
+
+    def estimate(self, audio):
+        """
+        Utterance pitch (median over voiced frames)
+
+        Returns:
+            float or None: F0 in Hz, None if no frame is voiced
+        """
+        pitches = self.frame_pitches(audio)
+        voiced = pitches[pitches > 0]
+        if len(voiced) == 0:
+            return None
+        return float(np.median(voiced))
+
+
+def classify_gender(frequency):
+    """
+    Map a pitch to 'male', 'female' or 'unknown' using Config.GENDER_DETECTION
+
+    Male: typically 85-180 Hz, female: typically 165-255 Hz
+    """
+    if frequency is None:
+        return "unknown"
+    if frequency < Config.GENDER_DETECTION['male_max_hz']:
+        return "male"
+    if frequency > Config.GENDER_DETECTION['female_min_hz']:
+        return "female"
+    return "unknown"  # Overlap zone
@@ -0,0 +1,359 @@
+"""
+Playback Module
+TTS line playback with a completion handle instead of get_busy polling
+- PygamePlayback: one decoded Sound per line on a reserved mixer channel
+- PCMPlayback: persistent PortAudio output stream fed from a queue (optional crossfade)
+"""
+import io
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+
+import numpy as np
+import pygame
+
+try:
+    import pyaudiowpatch as pyaudio
+except ImportError:
+    pyaudio = None
+
+from config import Config
+
+# Mixer channels the TTS players use: 0 = StreamingPlayer, 1 = PygamePlayback
+TTS_CHANNELS = 2
+
+_reserved_channels = TTS_CHANNELS
+_reserve_lock = threading.Lock()
+
+
+def reserve_channel(channel_id):
+    """
+    Mixer Channel `channel_id`, kept away from pygame's automatic channel picks
+
+    pygame.mixer.set_reserved(n) sets the count (it does not add to it), so
+    every player reserves through here: the count only grows and covers all
+    TTS channels, whichever player opens its channel first.
+    """
+    global _reserved_channels
+    with _reserve_lock:
+        _reserved_channels = max(_reserved_channels, channel_id + 1)
+        if pygame.mixer.get_num_channels() < _reserved_channels:
+            pygame.mixer.set_num_channels(_reserved_channels)
+        pygame.mixer.set_reserved(_reserved_channels)
+        return pygame.mixer.Channel(channel_id)
+
+
+class PlaybackHandle:
+    """
+    Completion handle for one playing line
+
+    Backed by a concurrent Future: wait() blocks on an event and wakes the
+    moment playback ends, add_done_callback() runs on the completing thread.
+    """
+
+    def __init__(self, duration=0.0, on_stop=None):
+        """
+        Args:
+            duration: Length of the line (seconds)
+            on_stop: Called by stop() to silence the line in its backend
+        """
+        self.duration = duration
+        self.on_stop = on_stop
+        self.started = time.perf_counter()
+        self.ended = None
+        self._future = Future()
+        self._timer = None
+
+    def wait(self, timeout=None):
+        """Block until playback ends; returns False on timeout"""
+        try:
+            self._future.result(timeout)
+            return True
+        except FutureTimeout:
+            return False
+
+    def done(self):
+        return self._future.done()
+
+    def add_done_callback(self, fn):
+        """fn(handle) once playback ends (immediately if it already has)"""
+        self._future.add_done_callback(lambda _: fn(self))
+
+    def stop(self):
+        """Silence this line only (no-op once it has ended)"""
+        if self.done():
+            return
+        if self._timer:
+            self._timer.cancel()
+        if self.on_stop:
+            self.on_stop()
+        self._finish()
+
+    def _finish(self):
+        if not self._future.done():
+            self.ended = time.perf_counter()
+            self._future.set_result(self.ended - self.started)
+
+
+class PygamePlayback:
+    """
+    Sound/Channel playback; completion is scheduled from the decoded length
+
+    pygame end events (Channel.set_endevent) only arrive through an
+    initialized display event loop, which the tkinter app does not run.
+    The decoded Sound has an exact length, so a timer fires when it should
+    end and the channel is only checked in a short settle window after that.
+    """
+
+    def __init__(self, channel_id=1, settle_ms=300, settle_step_ms=2):
+        """
+        Args:
+            channel_id: Reserved mixer channel (0 is the streaming player's)
+            settle_ms: Max wait past the expected end for the channel to drain
+            settle_step_ms: Check interval inside the settle window
+        """
+        self.channel_id = channel_id
+        self.settle = settle_ms / 1000
+        self.settle_step = settle_step_ms / 1000
+        self.channel = None
+        self.current = None
+
+    def prepare(self, audio_data):
+        """Decode bytes (MP3/WAV) to a Sound; callable from any thread ahead of play()"""
+        if isinstance(audio_data, pygame.mixer.Sound):
+            return audio_data
+        if isinstance(audio_data, np.ndarray):
+            # PCM prepared by PCMPlayback (mixer format) when falling back to pygame
+            return pygame.mixer.Sound(buffer=np.ascontiguousarray(audio_data).tobytes())
+        return pygame.mixer.Sound(file=io.BytesIO(audio_data))
+
+    def play(self, audio):
+        """
+        Start playback (non-blocking)
+
+        Args:
+            audio: Bytes or a Sound from prepare()
+
+        Returns:
+            PlaybackHandle
+        """
+        sound = self.prepare(audio)
+        channel = self._channel()
+        if self.current and not self.current.done():
+            self.current.stop()
+
+        handle = PlaybackHandle(sound.get_length(), channel.stop)
+        channel.play(sound)
+        handle._timer = threading.Timer(handle.duration, self._settle, (handle,))
+        handle._timer.daemon = True
+        handle._timer.start()
+        self.current = handle
+        return handle
+
+    def stop(self):
+        if self.current:
+            self.current.stop()
+
+    def close(self):
+        self.stop()
+
+    def _channel(self):
+        if self.channel is None:
+            self.channel = reserve_channel(self.channel_id)
+        return self.channel
+
+    def _settle(self, handle):
+        """Expected end reached: finish once the mixer has drained the channel"""
+        deadline = time.perf_counter() + self.settle
+        while self.channel.get_busy() and not handle.done() and time.perf_counter() < deadline:
+            time.sleep(self.settle_step)
+        handle._finish()
+
+
+class PCMPlayback:
+    """
+    One persistent PortAudio output stream for all lines
+
+    The stream is opened once and keeps running (silence when idle), so a
+    line starts on the next callback instead of after a device open + file
+    decode. prepare() decodes MP3/WAV to int16 PCM at the mixer format; the
+    TTS pipeline calls it in its synthesis workers. Prepared lines go into a
+    deque (append/popleft are atomic, no lock in the audio callback) and the
+    callback starts the next one inside the same buffer the previous one
+    ends in. With crossfade_ms > 0 every line gets a short fade in/out and
+    the next line starts that much before the previous one ends. Stopping a
+    handle drops only that line; the callback skips finished handles.
+    """
+
+    def __init__(self, frames_per_buffer=256, crossfade_ms=0, audio=None):
+        """
+        Args:
+            frames_per_buffer: Callback size (256 frames @ 24kHz = ~11ms)
+            crossfade_ms: Overlap between consecutive lines (0 = back to back)
+            audio: Shared PyAudio instance (created on first use if None)
+        """
+        if pyaudio is None:
+            raise RuntimeError("pyaudiowpatch not installed")
+        self.frames_per_buffer = frames_per_buffer
+        self.crossfade_ms = crossfade_ms
+        self.audio = audio
+        self.owns_audio = audio is None
+
+        self.rate = None
+        self.channels = None
+        self.stream = None
+        self.lock = threading.Lock()      # Guards opening the stream only
+
+        self._pending = deque()           # (pcm, handle) waiting to start
+        self._voices = []                 # [pcm, position, handle] playing (callback thread only)
+        self._clear = False
+
+    def prepare(self, audio_data):
+        """Decode bytes (MP3/WAV) to int16 PCM frames; callable from any thread ahead of play()"""
+        if isinstance(audio_data, np.ndarray):
+            return audio_data
+        rate, _, channels = self._format()
+        sound = pygame.mixer.Sound(file=io.BytesIO(audio_data))
+        pcm = np.frombuffer(sound.get_raw(), dtype=np.int16)
+        pcm = pcm[:len(pcm) - len(pcm) % channels].reshape(-1, channels)
+
+        fade = min(int(rate * self.crossfade_ms / 1000), len(pcm) // 2)
+        if fade:
+            ramp = np.linspace(0.0, 1.0, fade, dtype=np.float32)[:, None]
+            pcm = pcm.astype(np.float32)
+            pcm[:fade] *= ramp
+            pcm[-fade:] *= ramp[::-1]
+            pcm = pcm.astype(np.int16)
+        return pcm
+
+    def play(self, audio):
+        """
+        Queue a line on the output stream (non-blocking)
+
+        Args:
+            audio: Bytes or PCM from prepare()
+
+        Returns:
+            PlaybackHandle (completes when the callback has written the last frame)
+        """
+        pcm = self.prepare(audio)
+        self._open()
+        handle = PlaybackHandle(len(pcm) / self.rate)
+        self._pending.append((pcm, handle))
+        return handle
+
+    def stop(self):
+        """Silence everything playing or queued"""
+        self._clear = True
+        while self._pending:
+            try:
+                self._pending.popleft()[1]._finish()
+            except IndexError:
+                break
+
+    def close(self):
+        self.stop()
+        if self.stream:
+            self.stream.stop_stream()
+            self.stream.close()
+            self.stream = None
+        if self.audio and self.owns_audio:
+            self.audio.terminate()
+            self.audio = None
+
+    def _format(self):
+        """Output format = pygame mixer format, so get_raw() PCM needs no conversion"""
+        mixer = pygame.mixer.get_init()
+        if not mixer:
+            raise RuntimeError("pygame mixer not initialized (needed to decode MP3)")
+        if mixer[1] != -16:
+            raise RuntimeError(f"pygame mixer sample format {mixer[1]} is not signed 16-bit")
+        return mixer
+
+    def _open(self):
+        with self.lock:
+            if self.stream:
+                return
+            self.rate, _, self.channels = self._format()
+            if self.audio is None:
+                self.audio = pyaudio.PyAudio()
+            self.stream = self.audio.open(
+                format=pyaudio.paInt16,
+                channels=self.channels,
+                rate=self.rate,
+                output=True,
+                frames_per_buffer=self.frames_per_buffer,
+                stream_callback=self._callback
+            )
+            self.stream.start_stream()
+
+    def _callback(self, in_data, frame_count, time_info, status):
+        return self._mix(frame_count).tobytes(), pyaudio.paContinue
+
+    def _mix(self, frame_count):
+        """Next `frame_count` frames of output (callback thread)"""
+        if self._clear:
+            self._clear = False
+            for _, _, handle in self._voices:
+                handle._finish()
+            self._voices = []
+
+        # Lines stopped through their handle
+        self._voices = [voice for voice in self._voices if not voice[2].done()]
+        while self._pending and self._pending[0][1].done():
+            self._pending.popleft()
+
+        # Start the next line where the last one ends (minus the crossfade)
+        if self._pending:
+            lead = int(self.rate * self.crossfade_ms / 1000)
+            start = 0
+            if self._voices:
+                pcm, position, _ = self._voices[-1]
+                start = max(0, len(pcm) - position - lead)
+            if start < frame_count:
+                pcm, handle = self._pending.popleft()
+                self._voices.append([pcm, -start, handle])
+
+        out = np.zeros((frame_count, self.channels), dtype=np.int32)
+        for voice in self._voices:
+            pcm, position, handle = voice
+            offset = max(0, -position)
+            position = max(0, position)
+            n = min(frame_count - offset, len(pcm) - position)
+            out[offset:offset + n] += pcm[position:position + n]
+            voice[1] = position + n
+
+        finished = [voice for voice in self._voices if voice[1] >= len(voice[0])]
+        if finished:
+            self._voices = [voice for voice in self._voices if voice[1] < len(voice[0])]
+            for _, _, handle in finished:
+                handle._finish()
+        return np.clip(out, -32768, 32767).astype(np.int16)
+
+
+def create_playback(settings=None):
+    """
+    Build the playback backend selected in Config.PLAYBACK / settings ('playback_backend')
+
+    'pcm' falls back to pygame when pyaudiowpatch is missing or the output
+    stream cannot be opened.
+
+    Returns:
+        tuple: (player, warning message or None)
+    """
+    settings = settings or {}
+    playback = Config.PLAYBACK
+    backend = settings.get('playback_backend', playback['backend'])
+
+    if backend == 'pcm':
+        try:
+            player = PCMPlayback(
+                frames_per_buffer=playback['pcm_buffer_frames'],
+                crossfade_ms=settings.get('crossfade_ms', playback['crossfade_ms'])
+            )
+            player._open()
+            return player, None
+        except Exception as e:
+            return PygamePlayback(), f"PCM output unavailable ({e}), using pygame"
+    return PygamePlayback(), None
@@ -0,0 +1,171 @@
+"""
+pyttsx3 Worker Module
+One long-lived pyttsx3 engine on its own thread, fed through a job queue
+"""
+import os
+import queue
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+
+import pyttsx3
+
+from voice_catalog import get_catalog
+
+
+class Pyttsx3Worker:
+    """
+    Serializes every pyttsx3 call onto one thread
+
+    pyttsx3 drivers (SAPI5 COM objects, NSSpeech, espeak) belong to the
+    thread that created them, which is why the engine used to be created
+    per sentence. The worker creates it once, picks the voice once and then
+    only runs say()/save_to_file() + runAndWait() per job, so a sentence no
+    longer pays for driver startup and a voice scan. Voices come from the
+    shared voice catalog (cached on disk, so startup skips enumeration too).
+    """
+
+    def __init__(self, rate=150, ui=None):
+        """
+        Args:
+            rate: Speech rate (words per minute)
+            ui: UI for logging
+        """
+        self.rate = rate
+        self.ui = ui
+        self.voice_ids = {}  # gender -> Vietnamese voice id (None when none is installed)
+        self.jobs = queue.Queue()
+        self.ready = threading.Event()
+        self.init_error = None
+        self.closed = False
+        self.lock = threading.Lock()  # Orders submits against shutdown()
+
+        self.thread = threading.Thread(target=self._run, daemon=True, name='pyttsx3')
+        self.thread.start()
+
+    def voice_for(self, gender='female'):
+        """Voice id used for `gender` (after startup)"""
+        self.ready.wait()
+        return self.voice_ids.get(gender)
+
+    def speak(self, text, gender='female', timeout=None):
+        """Speak on the default output device (blocking)"""
+        return self._submit('speak', (text, gender)).result(timeout)
+
+    def synthesize(self, text, gender='female', timeout=None):
+        """
+        Render text to WAV bytes (blocking)
+
+        Returns:
+            bytes or None
+        """
+        return self._submit('save', (text, gender)).result(timeout)
+
+    def shutdown(self):
+        """Fail queued jobs, reject new ones and let the engine thread exit"""
+        with self.lock:
+            self.closed = True
+            while True:
+                try:
+                    job = self.jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if job:
+                    job[2].set_exception(RuntimeError("pyttsx3 worker is shut down"))
+            self.jobs.put(None)
+
+    def _submit(self, kind, payload):
+        future = Future()
+        self.ready.wait()
+        with self.lock:
+            if self.init_error:
+                future.set_exception(self.init_error)
+            elif self.closed:
+                future.set_exception(RuntimeError("pyttsx3 worker is shut down"))
+            else:
+                self.jobs.put((kind, payload, future))
+        return future
+
+    def _run(self):
+        try:
+            self._init_com()
+            start = time.perf_counter()
+            engine = pyttsx3.init()
+            engine.setProperty('rate', self.rate)
+            engine.setProperty('volume', 1.0)
+            self._select_voices(engine)
+            if self.ui: self.ui.log(f"✅ pyttsx3 engine ready in {(time.perf_counter() - start) * 1000:.0f}ms", 'info')
+        except Exception as e:
+            self.init_error = e
+            if self.ui: self.ui.log(f"⚠️ pyttsx3 Error: {e}", 'warning')
+            return
+        finally:
+            self.ready.set()
+
+        current_voice = None
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+            kind, payload, future = job
+            try:
+                text, gender = payload
+                voice_id = self.voice_ids.get(gender)
+                if voice_id and voice_id != current_voice:
+                    try:
+                        engine.setProperty('voice', voice_id)
+                    except Exception:
+                        # Cached voice was uninstalled: enumerate again
+                        self._select_voices(engine, refresh=True)
+                        voice_id = self.voice_ids.get(gender)
+                        if voice_id:
+                            engine.setProperty('voice', voice_id)
+                    current_voice = voice_id
+
+                if kind == 'speak':
+                    engine.say(text)
+                    engine.runAndWait()
+                    result = None
+                else:
+                    result = self._save(engine, text)
+                future.set_result(result)
+            except Exception as e:
+                future.set_exception(e)
+
+        try:
+            engine.stop()
+        except Exception:
+            pass
+
+    def _select_voices(self, engine, refresh=False):
+        # A newly installed voice pack changes the voice set stamp, which invalidates the cache
+        catalog = get_catalog(engine, refresh=refresh)
+        self.voice_ids = {gender: catalog.best('vi', gender) for gender in ('female', 'male')}
+
+    @staticmethod
+    def _init_com():
+        """SAPI5 needs COM initialized on the thread that owns the engine (Windows only)"""
+        try:
+            import comtypes
+            comtypes.CoInitialize()
+        except (ImportError, OSError):
+            pass
+
+    @staticmethod
+    def _save(engine, text):
+        """pyttsx3 can only render to a file path, so this goes through a temp file"""
+        temp_file = os.path.join(tempfile.gettempdir(), f"pyttsx3_{int(time.time()*1000)}.wav")
+        try:
+            engine.save_to_file(text, temp_file)
+            engine.runAndWait()
+            if os.path.exists(temp_file) and os.path.getsize(temp_file) > 0:
+                with open(temp_file, 'rb') as f:
+                    return f.read()
+            return None
+        finally:
+            try:
+                if os.path.exists(temp_file):
+                    os.unlink(temp_file)
+            except OSError:
+                pass
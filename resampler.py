@@ -0,0 +1,229 @@
+"""
+Resampler Module
+Polyphase windowed-sinc resampling (replaces np.interp)
+"""
+import time
+from functools import lru_cache
+from math import gcd
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+# Filter design
+NUM_ZEROS = 8      # Zero crossings of the sinc kept on each side
+ROLLOFF = 0.94     # Cutoff as a fraction of the lower Nyquist frequency
+KAISER_BETA = 8.0
+
+# Outputs computed per vectorized step (bounds temporary memory)
+BLOCK_SIZE = 4096
+# Switch to the per-phase strided path once every phase has this many outputs
+PHASE_LOOP_MIN = 8
+
+
+@lru_cache(maxsize=16)
+def get_filter_bank(from_rate, to_rate):
+    """
+    Build (once per rate pair) the polyphase filter bank for from_rate -> to_rate
+
+    Args:
+        from_rate: Source sample rate
+        to_rate: Target sample rate
+
+    Returns:
+        tuple: (bank, up, down, delay) where bank has shape (up, taps) and is
+               stored time-reversed so it can be dotted directly with input windows
+    """
+    g = gcd(int(from_rate), int(to_rate))
+    up = int(to_rate) // g
+    down = int(from_rate) // g
+    factor = max(up, down)
+
+    # Prototype low-pass at the upsampled rate (up * from_rate)
+    cutoff = 0.5 * ROLLOFF / factor
+    half = int(np.ceil(NUM_ZEROS / (2 * cutoff)))
+    taps_per_phase = int(np.ceil((2 * half + 1) / up))
+    length = taps_per_phase * up
+
+    n = np.arange(length) - half
+    window = np.zeros(length)
+    window[:2 * half + 1] = np.kaiser(2 * half + 1, KAISER_BETA)
+    prototype = 2 * cutoff * np.sinc(2 * cutoff * n) * up * window
+
+    # bank[p, j] = h[p + j*up], reversed along j
+    bank = prototype.reshape(taps_per_phase, up).T[:, ::-1]
+    bank = np.ascontiguousarray(bank, dtype=np.float32)
+    bank.setflags(write=False)
+    return bank, up, down, half
+
+
+class StreamingResampler:
+    """
+    Incremental resampler that keeps filter state across chunks
+
+    Feeding audio chunk by chunk produces the same samples as resampling the
+    concatenated signal in one go (the filter needs a few samples of look-ahead,
+    which flush() releases at the end).
+    """
+
+    def __init__(self, from_rate, to_rate):
+        self.from_rate = int(from_rate)
+        self.to_rate = int(to_rate)
+        self.bank, self.up, self.down, self.delay = get_filter_bank(self.from_rate, self.to_rate)
+        self.taps = self.bank.shape[1]
+        self.reset()
+
+    def reset(self):
+        """Forget all buffered input (start of a new utterance)"""
+        # x[-taps+1 .. -1] are implicit zeros
+        self._buffer = np.zeros(self.taps - 1, dtype=np.float32)
+        self._buffer_start = -(self.taps - 1)  # Absolute index of _buffer[0]
+        self._next_out = 0                     # Absolute index of next output sample
+        self._in_count = 0                     # Real input samples received
+
+    def _expected_outputs(self):
+        return int(self._in_count * self.up / self.down)
+
+    def process(self, samples):
+        """
+        Resample the next chunk of a mono signal
+
+        Args:
+            samples: 1-D float array
+
+        Returns:
+            np.ndarray: float32 output samples that are ready (may be empty)
+        """
+        samples = np.asarray(samples, dtype=np.float32)
+        self._in_count += len(samples)
+        return self._consume(samples, limit=None)
+
+    def flush(self):
+        """
+        Release the samples held back for look-ahead and reset the state
+
+        Returns:
+            np.ndarray: Remaining float32 output samples
+        """
+        pad = np.zeros(self.delay // self.up + self.taps + 1, dtype=np.float32)
+        out = self._consume(pad, limit=self._expected_outputs())
+        self.reset()
+        return out
+
+    def _consume(self, samples, limit):
+        if len(samples):
+            self._buffer = np.concatenate((self._buffer, samples))
+
+        up, down, delay, taps = self.up, self.down, self.delay, self.taps
+        available = self._buffer_start + len(self._buffer)  # One past last input index
+
+        # Output n needs input up to base(n) = (n*down + delay) // up
+        end = -((delay - available * up) // down)  # ceil((available*up - delay) / down)
+        if limit is not None:
+            end = min(end, limit)
+        start = self._next_out
+        if end <= start:
+            return np.zeros(0, dtype=np.float32)
+
+        windows = sliding_window_view(self._buffer, taps)
+        count = end - start
+        out = np.empty(count, dtype=np.float32)
+        if count >= PHASE_LOOP_MIN * up:
+            # Long input: outputs sharing a phase read windows `down` apart,
+            # so each phase is one strided matrix-vector product (no gather copy)
+            for r in range(min(up, count)):
+                t = (start + r) * down + delay
+                first = t // up - (taps - 1) - self._buffer_start
+                rows = windows[first::down][:len(range(r, count, up))]
+                out[r::up] = rows @ self.bank[t % up]
+        else:
+            # Short chunk: gather windows and phases for all outputs at once
+            for block_start in range(start, end, BLOCK_SIZE):
+                n = np.arange(block_start, min(block_start + BLOCK_SIZE, end), dtype=np.int64)
+                t = n * down + delay
+                first = t // up - (taps - 1) - self._buffer_start
+                out[block_start - start:block_start - start + len(n)] = np.einsum(
+                    'ij,ij->i', windows[first], self.bank[t % up]
+                )
+
+        self._next_out = end
+
+        # Drop input that no future output can reach
+        keep_from = (end * down + delay) // up - (taps - 1) - self._buffer_start
+        if keep_from > 0:
+            self._buffer = self._buffer[keep_from:]
+            self._buffer_start += keep_from
+
+        return out
+
+
+def resample(samples, from_rate, to_rate):
+    """
+    One-shot resampling of a mono float signal
+
+    Args:
+        samples: 1-D float array
+        from_rate: Source sample rate
+        to_rate: Target sample rate
+
+    Returns:
+        np.ndarray: float32 array of int(len(samples) * to_rate / from_rate) samples
+    """
+    samples = np.asarray(samples, dtype=np.float32)
+    if int(from_rate) == int(to_rate):
+        return samples
+
+    resampler = StreamingResampler(from_rate, to_rate)
+    head = resampler.process(samples)
+    tail = resampler.flush()
+    return np.concatenate((head, tail)) if len(tail) else head
+
+
+class StreamingPreprocessor:
+    """
+    Converts raw capture chunks to Whisper-ready audio as they arrive
+
+    Interleaved multi-channel float32 -> mono -> target rate float32, so the
+    DSP cost is spread over the capture loop instead of landing between
+    end-of-speech and transcription.
+    """
+
+    def __init__(self, from_rate, channels, to_rate=16000):
+        self.channels = int(channels)
+        self.from_rate = int(from_rate)
+        self.to_rate = int(to_rate)
+        self._resampler = StreamingResampler(from_rate, to_rate) if self.from_rate != self.to_rate else None
+        self.last_dsp_time = 0.0  # Seconds of DSP for the last chunk
+        self.dsp_time = 0.0       # Seconds of DSP counted for the current utterance (count_last)
+
+    def process(self, chunk):
+        """
+        Args:
+            chunk: Interleaved float32 samples from stream.read()
+
+        Returns:
+            np.ndarray: Mono float32 samples at to_rate
+        """
+        start = time.perf_counter()
+        if self.channels > 1:
+            chunk = chunk.reshape(-1, self.channels).mean(axis=1)
+        out = self._resampler.process(chunk) if self._resampler else np.asarray(chunk, dtype=np.float32)
+        self.last_dsp_time = time.perf_counter() - start
+        return out
+
+    def count_last(self):
+        """Count the last chunk's DSP toward the utterance (call for gated speech chunks only)"""
+        self.dsp_time += self.last_dsp_time
+
+    def reset_stats(self):
+        """Start counting DSP for a new utterance (the resampler state stays continuous)"""
+        self.dsp_time = 0.0
+
+    def flush(self):
+        """End of utterance: returns the held-back tail and resets the state"""
+        return self._resampler.flush() if self._resampler else np.zeros(0, dtype=np.float32)
+
+    def reset(self):
+        if self._resampler:
+            self._resampler.reset()
+        self.dsp_time = 0.0
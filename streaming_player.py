@@ -0,0 +1,255 @@
+"""
+Streaming Player Module
+Plays an MP3 stream (Edge TTS) while it is still being synthesized
+"""
+import io
+import time
+
+import pygame
+
+from playback import reserve_channel
+
+
+# MPEG audio header tables
+_MPEG_VERSIONS = {0: 2.5, 2: 2, 3: 1}
+_SAMPLE_RATES = {1: (44100, 48000, 32000), 2: (22050, 24000, 16000), 2.5: (11025, 12000, 8000)}
+_LAYER3_BITRATES = {
+    1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+
+def parse_mp3_header(header):
+    """
+    Parse a 4-byte MPEG Layer III frame header
+
+    Returns:
+        tuple or None: (frame_length_bytes, sample_rate, samples_per_frame)
+    """
+    if len(header) < 4 or header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+        return None
+
+    version = _MPEG_VERSIONS.get((header[1] >> 3) & 0x03)
+    layer = (header[1] >> 1) & 0x03
+    bitrate_index = (header[2] >> 4) & 0x0F
+    rate_index = (header[2] >> 2) & 0x03
+    padding = (header[2] >> 1) & 0x01
+    if version is None or layer != 1 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    bitrate = _LAYER3_BITRATES[1 if version == 1 else 2][bitrate_index] * 1000
+    samples_per_frame = 1152 if version == 1 else 576
+    frame_length = samples_per_frame // 8 * bitrate // sample_rate + padding
+    return frame_length, sample_rate, samples_per_frame
+
+
+def side_info_length(header):
+    """Bytes of Layer III side info after the header (and CRC)"""
+    mono = (header[3] >> 6) == 3
+    if _MPEG_VERSIONS.get((header[1] >> 3) & 0x03) == 1:
+        return 17 if mono else 32
+    return 9 if mono else 17
+
+
+def _frame_layout(data, offset):
+    """(frame length, offset of the main data, main_data_begin) of the frame at `offset`"""
+    header = data[offset:offset + 4]
+    info = offset + 4 + (0 if header[1] & 0x01 else 2)  # 16-bit CRC after the header
+    if _MPEG_VERSIONS.get((header[1] >> 3) & 0x03) == 1:
+        begin = data[info] << 1 | data[info + 1] >> 7
+    else:
+        begin = data[info]
+    return parse_mp3_header(header)[0], info + side_info_length(header), begin
+
+
+def reservoir_frame(data, starts, index):
+    """
+    Silent frame that carries the bit reservoir of frame `index`
+
+    A Layer III frame may take the start of its audio data from the frames
+    before it (up to 511 bytes back), so decoding cannot simply start at a
+    frame in the middle of a stream. Put in front of that frame, this
+    max-bitrate frame with empty side info decodes to silence and holds
+    exactly the bytes it borrows.
+
+    Args:
+        data: MP3 stream bytes
+        starts: Offsets of its complete frames
+        index: Frame the decode starts at
+
+    Returns:
+        bytes: The frame (empty if frame `index` borrows nothing)
+    """
+    _, _, begin = _frame_layout(data, starts[index])
+    if not begin:
+        return b''
+
+    borrowed = bytearray()
+    for i in range(index - 1, -1, -1):
+        frame_length, main_data, _ = _frame_layout(data, starts[i])
+        borrowed[:0] = data[main_data:starts[i] + frame_length]
+        if len(borrowed) >= begin:
+            break
+    borrowed = borrowed[-begin:]
+
+    header = bytearray(data[starts[index]:starts[index] + 4])
+    header[1] |= 0x01                        # No CRC
+    header[2] = 0xE0 | (header[2] & 0x0D)    # Bitrate index 14, no padding
+    frame_length = parse_mp3_header(header)[0]
+    return bytes(header) + bytes(frame_length - 4 - len(borrowed)) + bytes(borrowed)  # Side info all zero
+
+
+def complete_frames(data, offset=0, starts=None):
+    """
+    Walk MP3 frames from `offset`
+
+    Args:
+        starts: Optional list the start offset of every complete frame is appended to
+
+    Returns:
+        tuple: (end offset of the last complete frame, seconds of audio in those frames)
+    """
+    # Skip an ID3v2 tag at the very start
+    if offset == 0 and data[:3] == b'ID3' and len(data) >= 10:
+        offset = 10 + ((data[6] & 0x7F) << 21 | (data[7] & 0x7F) << 14 | (data[8] & 0x7F) << 7 | (data[9] & 0x7F))
+
+    seconds = 0.0
+    while offset + 4 <= len(data):
+        header = parse_mp3_header(data[offset:offset + 4])
+        if header is None:
+            offset += 1  # Resync
+            continue
+        frame_length, sample_rate, samples_per_frame = header
+        if offset + frame_length > len(data):
+            break
+        if starts is not None:
+            starts.append(offset)
+        offset += frame_length
+        seconds += samples_per_frame / sample_rate
+    return offset, seconds
+
+
+class StreamingPlayer:
+    """
+    Jitter-buffered MP3 playback on a pygame mixer channel
+
+    Bytes are fed as they arrive; once enough whole frames are buffered they
+    are decoded and queued on the channel. Each decode covers only the new
+    frames, led by a frame carrying their bit reservoir and WARMUP_FRAMES
+    already played frames (the synthesis filter overlaps neighbouring
+    frames). The lead-in PCM is dropped and only the new tail is played, so
+    segments join seamlessly and a sentence is decoded about once.
+    """
+
+    # Frames decoded again ahead of each segment to settle the synthesis filter
+    WARMUP_FRAMES = 2
+
+    def __init__(self, first_segment_ms=200, segment_ms=600, channel_id=0):
+        """
+        Args:
+            first_segment_ms: Audio buffered before playback starts (jitter buffer)
+            segment_ms: Audio buffered per following segment
+            channel_id: Mixer channel reserved for streaming playback
+        """
+        self.first_segment = first_segment_ms / 1000
+        self.segment = segment_ms / 1000
+
+        self.channel = reserve_channel(channel_id)
+
+        freq, size, channels = pygame.mixer.get_init()
+        self._mixer_rate = freq
+        self._frame_bytes = abs(size) // 8 * channels
+
+        self._data = bytearray()
+        self._frame_starts = []    # Byte offset of every complete frame
+        self._frames_end = 0       # Byte offset of complete frames parsed so far
+        self._decoded_frames = 0   # Frames already decoded and queued
+        self._pending_seconds = 0.0
+        self._total_seconds = 0.0  # Audio in all complete frames
+        self._decoded_seconds = 0.0  # Audio in the frames already decoded
+        self._end_time = 0.0       # When the queued audio is expected to finish
+        self.first_audio_time = None
+
+    @property
+    def data(self):
+        """All MP3 bytes received so far"""
+        return bytes(self._data)
+
+    def feed(self, data):
+        """Add MP3 bytes from the stream; starts/queues playback when enough is buffered"""
+        self._data.extend(data)
+        end, seconds = complete_frames(self._data, self._frames_end, self._frame_starts)
+        self._frames_end = end
+        self._pending_seconds += seconds
+        self._total_seconds += seconds
+
+        threshold = self.first_segment if self.first_audio_time is None else self.segment
+        if self._pending_seconds >= threshold:
+            self._emit()
+
+    def flush(self):
+        """End of stream: queue whatever is left in the jitter buffer (a truncated last frame is dropped)"""
+        if len(self._frame_starts) > self._decoded_frames:
+            self._emit()
+
+    def wait(self, poll_interval=0.002, settle=0.3):
+        """Block until the channel has finished playing
+
+        Sleeps straight to the expected end of the queued audio, then only
+        checks the channel for the short time the mixer needs to drain.
+        """
+        remaining = self._end_time - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+        deadline = time.perf_counter() + settle
+        while self.channel.get_busy() and time.perf_counter() < deadline:
+            time.sleep(poll_interval)
+
+    def finish(self):
+        """Play whatever is left and block until done"""
+        self.flush()
+        self.wait()
+
+    def stop(self):
+        self.channel.stop()
+
+    def _emit(self):
+        """Decode the new frames (after a few warm-up frames) and queue their PCM"""
+        first = max(0, self._decoded_frames - self.WARMUP_FRAMES)
+        start = self._frame_starts[first] if first else 0  # From 0: keeps a leading ID3 tag
+        window = bytes(self._data[start:self._frames_end])
+        if first:
+            window = reservoir_frame(self._data, self._frame_starts, first) + window
+        sound = pygame.mixer.Sound(file=io.BytesIO(window))
+        pcm = sound.get_raw()
+
+        # The new frames are the tail of the decode; take their length at the mixer rate
+        new = round(self._total_seconds * self._mixer_rate) - round(self._decoded_seconds * self._mixer_rate)
+        new = min(new, len(pcm) // self._frame_bytes)
+        self._decoded_frames = len(self._frame_starts)
+        self._decoded_seconds = self._total_seconds
+        self._pending_seconds = 0.0
+        if new <= 0:
+            return
+
+        end = len(pcm) - len(pcm) % self._frame_bytes
+        self._enqueue(pygame.mixer.Sound(buffer=pcm[end - new * self._frame_bytes:end]))
+
+    def _enqueue(self, sound, poll_interval=0.005):
+        if not self.channel.get_busy():
+            self.channel.play(sound)
+            self._end_time = time.perf_counter() + sound.get_length()
+        else:
+            # The channel holds one queued sound; wait for the slot to free up
+            while self.channel.get_queue() is not None and self.channel.get_busy():
+                time.sleep(poll_interval)
+            if self.channel.get_busy():
+                self.channel.queue(sound)
+                self._end_time = max(self._end_time, time.perf_counter()) + sound.get_length()
+            else:
+                self.channel.play(sound)
+                self._end_time = time.perf_counter() + sound.get_length()
+
+        if self.first_audio_time is None:
+            self.first_audio_time = time.perf_counter()
@@ -0,0 +1,236 @@
+"""
+Streaming STT Module
+Incremental Whisper transcription with local-agreement commits
+"""
+import numpy as np
+
+
+def join_words(words):
+    """Join (start, end, text) words back into text (Whisper words carry their own leading space)"""
+    return "".join(word[2] for word in words)
+
+
+class HypothesisBuffer:
+    """
+    Local agreement between consecutive decodes
+
+    A word is committed once two decodes of the growing window agree on it
+    (longest common prefix). Words are (start, end, text) in absolute seconds.
+    """
+
+    def __init__(self):
+        self.committed_in_buffer = []  # Committed words whose audio is still in the window
+        self.buffer = []               # Uncommitted tail of the previous decode
+        self.new = []
+        self.last_committed_time = 0.0
+
+    def insert(self, words, offset):
+        """
+        Take a new decode of the window
+
+        Args:
+            words: (start, end, text) relative to the window start
+            offset: Absolute time of the window start
+        """
+        words = [(start + offset, end + offset, text) for start, end, text in words]
+        # Words before the last commit were already emitted (small tolerance for timestamp jitter)
+        self.new = [word for word in words if word[0] > self.last_committed_time - 0.1]
+
+        # The decode may repeat the last committed words with shifted timestamps: drop that n-gram
+        if self.new and abs(self.new[0][0] - self.last_committed_time) < 1.0 and self.committed_in_buffer:
+            longest = min(len(self.committed_in_buffer), len(self.new), 5)
+            for n in range(longest, 0, -1):
+                tail = [word[2].strip() for word in self.committed_in_buffer[-n:]]
+                head = [word[2].strip() for word in self.new[:n]]
+                if tail == head:
+                    del self.new[:n]
+                    break
+
+    def flush(self):
+        """
+        Commit the prefix the new decode shares with the previous one
+
+        Returns:
+            list: Newly committed words
+        """
+        commit = []
+        while self.new and self.buffer:
+            if self.new[0][2].strip() != self.buffer[0][2].strip():
+                break
+            word = self.new.pop(0)
+            self.buffer.pop(0)
+            commit.append(word)
+            self.last_committed_time = word[1]
+
+        self.buffer = self.new
+        self.new = []
+        self.committed_in_buffer.extend(commit)
+        return commit
+
+    def commit_until(self, time):
+        """
+        Commit uncommitted words that end by `time` without waiting for agreement
+
+        Returns:
+            list: Newly committed words
+        """
+        commit = []
+        while self.buffer and self.buffer[0][1] <= time:
+            commit.append(self.buffer.pop(0))
+        if commit:
+            self.last_committed_time = commit[-1][1]
+            self.committed_in_buffer.extend(commit)
+        return commit
+
+    def pop_committed(self, time):
+        """Forget committed words that end before `time` (their audio was trimmed)"""
+        while self.committed_in_buffer and self.committed_in_buffer[0][1] <= time:
+            self.committed_in_buffer.pop(0)
+
+    def complete(self):
+        """Uncommitted words of the latest decode"""
+        return self.buffer
+
+
+class StreamingTranscriber:
+    """
+    Re-decodes a sliding window of the current utterance and emits its stable prefix
+
+    Audio is appended as it is captured; process_iter() re-runs Whisper on the
+    window and returns only the words two consecutive decodes agree on, so
+    text leaves the STT stage while the speaker is still talking. The window
+    is trimmed at the end of the last committed word once it grows past
+    `buffer_trim`, and trimmed text is fed back as the decoding prompt, so
+    there is no hard cut that could duplicate or drop words.
+    """
+
+    def __init__(self, model, sample_rate=16000, buffer_trim=12.0, prompt_chars=200, options=None):
+        """
+        Args:
+            model: faster_whisper.WhisperModel
+            sample_rate: Sample rate of the inserted audio (Whisper-ready 16kHz mono)
+            buffer_trim: Window length (seconds) above which committed audio is dropped
+            prompt_chars: Characters of already-trimmed text passed as initial_prompt
+            options: Extra keyword arguments for model.transcribe (language, task, beam_size...)
+        """
+        self.model = model
+        self.sample_rate = sample_rate
+        self.buffer_trim = buffer_trim
+        self.prompt_chars = prompt_chars
+        self.options = dict(options or {})
+        self.reset()
+
+    def reset(self):
+        """Start a new utterance"""
+        self.audio = np.zeros(0, dtype=np.float32)
+        self.pending = []     # Chunks inserted since the last decode
+        self.pending_samples = 0
+        self.offset = 0.0     # Absolute time of self.audio[0]
+        self.total_samples = 0
+        self.hypothesis = HypothesisBuffer()
+        self.trimmed_text = ""  # Committed text whose audio left the window
+
+    @property
+    def duration(self):
+        """Seconds of audio inserted for the current utterance"""
+        return self.total_samples / self.sample_rate
+
+    @property
+    def unprocessed(self):
+        """Seconds of audio inserted since the last decode"""
+        return self.pending_samples / self.sample_rate
+
+    def insert_audio(self, samples):
+        """Append Whisper-ready audio (float32 mono at `sample_rate`)"""
+        if len(samples):
+            self.pending.append(np.asarray(samples, dtype=np.float32))
+            self.pending_samples += len(samples)
+            self.total_samples += len(samples)
+
+    def process_iter(self):
+        """
+        Decode the window and commit its stable prefix
+
+        Returns:
+            str: Newly committed text ('' if nothing is stable yet, may start with a space)
+        """
+        self._take_pending()
+        if not len(self.audio):
+            return ""
+
+        self.hypothesis.insert(self._decode(), self.offset)
+        committed = self.hypothesis.flush()
+
+        if len(self.audio) / self.sample_rate > self.buffer_trim:
+            committed += self._trim()
+        return join_words(committed)
+
+    def finish(self):
+        """
+        End of utterance: final decode, everything left is committed
+
+        Returns:
+            str: Text not returned by process_iter yet (may start with a space)
+        """
+        self._take_pending()
+        text = ""
+        if len(self.audio):
+            self.hypothesis.insert(self._decode(), self.offset)
+            committed = self.hypothesis.flush()
+            text = join_words(committed + self.hypothesis.complete())
+        self.reset()
+        return text
+
+    def _take_pending(self):
+        if self.pending:
+            self.audio = np.concatenate([self.audio] + self.pending)
+            self.pending = []
+            self.pending_samples = 0
+
+    def _decode(self):
+        """
+        Returns:
+            list: (start, end, text) words relative to the window start
+        """
+        options = dict(self.options)
+        options.update(word_timestamps=True, condition_on_previous_text=False)
+        if self.trimmed_text:
+            options['initial_prompt'] = self.trimmed_text[-self.prompt_chars:]
+
+        segments, _ = self.model.transcribe(self.audio, **options)
+        return [
+            (word.start, word.end, word.word)
+            for segment in segments
+            for word in (segment.words or [])
+        ]
+
+    def _trim(self):
+        """
+        Drop the audio of committed words, keeping the prefix as prompt text
+
+        Returns:
+            list: Words committed without agreement to make room (see below)
+        """
+        forced = []
+        committed = self.hypothesis.committed_in_buffer
+        if committed:
+            cut_time = committed[-1][1]
+        else:
+            # Nothing agreed for a whole window: keep the newest part so decoding stays bounded.
+            # Hypothesis words before the cut are committed as they are instead of being lost.
+            cut_time = self.offset + len(self.audio) / self.sample_rate - self.buffer_trim / 2
+            forced = self.hypothesis.commit_until(cut_time)
+            if forced:
+                cut_time = forced[-1][1]
+                committed = self.hypothesis.committed_in_buffer
+
+        cut = int(round((cut_time - self.offset) * self.sample_rate))
+        if cut <= 0:
+            return forced
+
+        self.trimmed_text += join_words([word for word in committed if word[1] <= cut_time])
+        self.hypothesis.pop_committed(cut_time)
+        self.hypothesis.last_committed_time = max(self.hypothesis.last_committed_time, cut_time)
+        self.audio = self.audio[cut:]
+        self.offset = cut_time
+        return forced
@@ -0,0 +1,7 @@
+"""
+Test setup: the modules live as flat scripts in the repository root
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
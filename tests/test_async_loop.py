@@ -0,0 +1,58 @@
+"""
+Persistent asyncio loop: results, timeouts and shutdown of in-flight work
+"""
+import asyncio
+import concurrent.futures
+import threading
+
+import pytest
+
+from async_loop import AsyncLoopThread
+
+
+@pytest.fixture
+def loop_thread():
+    loop_thread = AsyncLoopThread(name='test-loop')
+    yield loop_thread
+    loop_thread.stop()
+
+
+def test_run_returns_result_on_the_loop_thread(loop_thread):
+    async def which_thread():
+        await asyncio.sleep(0)
+        return threading.current_thread().name
+
+    assert loop_thread.run(which_thread(), timeout=5) == 'test-loop'
+    assert loop_thread.run(which_thread(), timeout=5) == 'test-loop'
+
+
+def test_timeout_cancels_the_coroutine(loop_thread):
+    cancelled = threading.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(concurrent.futures.TimeoutError):
+        loop_thread.run(slow(), timeout=0.05)
+    assert cancelled.wait(2)
+
+
+def test_stop_cancels_in_flight_work(loop_thread):
+    future = loop_thread.submit(asyncio.sleep(10))
+    loop_thread.stop()
+
+    with pytest.raises(concurrent.futures.CancelledError):
+        future.result(2)
+    assert not loop_thread.is_running
+
+
+def test_submit_after_stop_raises(loop_thread):
+    loop_thread.stop()
+    coro = asyncio.sleep(0)
+    with pytest.raises(RuntimeError):
+        loop_thread.submit(coro)
+    assert coro.cr_frame is None  # Closed, no "never awaited" warning
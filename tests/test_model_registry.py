@@ -0,0 +1,134 @@
+"""
+Model registry: shared loads, LRU eviction at the memory budget, failed loads
+"""
+import threading
+import time
+
+import pytest
+
+from model_registry import ModelRegistry
+
+
+class FakeLoader:
+    """Returns a fresh object per load; can block until released or fail once"""
+
+    def __init__(self, block=False, fail=0):
+        self.calls = []
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.block = block
+        self.fail = fail
+
+    def __call__(self, model_name, device, compute_type):
+        self.calls.append((model_name, device, compute_type))
+        self.started.set()
+        if self.block:
+            self.release.wait(5)
+        if self.fail:
+            self.fail -= 1
+            raise RuntimeError("download failed")
+        return object()
+
+
+def test_get_returns_cached_instance():
+    loader = FakeLoader()
+    registry = ModelRegistry(loader=loader)
+    model = registry.get('small', 'cpu', 'int8')
+    assert registry.get('small', 'cpu', 'int8') is model
+    assert registry.get('small', 'cuda', 'float16') is not model
+    assert len(loader.calls) == 2
+    assert registry.stats()['hits'] == 1
+
+
+def test_concurrent_get_loads_once():
+    loader = FakeLoader(block=True)
+    registry = ModelRegistry(loader=loader)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get('small', 'cpu', 'int8')))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    assert loader.started.wait(5)
+    time.sleep(0.05)  # Let the other threads reach the wait
+    loader.release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(loader.calls) == 1
+    assert len(results) == 4
+    assert all(model is results[0] for model in results)
+    assert registry.stats()['loads'] == 1
+
+
+def test_lru_eviction_at_budget():
+    # int8 halves the float16 estimate: small = 242.5 MB, base = 72.5 MB, medium = 765 MB
+    registry = ModelRegistry(memory_budget_mb=400, loader=FakeLoader())
+    registry.get('small', 'cpu', 'int8')
+    registry.get('base', 'cpu', 'int8')
+    registry.get('small', 'cpu', 'int8')   # small is now the most recent
+    registry.get('tiny', 'cpu', 'int8')    # 352.5 MB, fits
+    assert registry.stats()['models'] == ['base', 'small', 'tiny']
+
+    registry.get('base', 'cpu', 'float32')  # +290 MB: drops the LRU models until it fits
+    stats = registry.stats()
+    assert stats['models'] == ['tiny', 'base']
+    assert stats['evictions'] == 2
+    assert stats['estimated_mb'] <= 400
+
+
+def test_model_over_budget_is_still_kept():
+    registry = ModelRegistry(memory_budget_mb=100, loader=FakeLoader())
+    registry.get('tiny', 'cpu', 'int8')
+    model = registry.get('medium', 'cpu', 'int8')
+    assert registry.stats()['models'] == ['medium']
+    assert registry.get('medium', 'cpu', 'int8') is model
+
+
+def test_failed_load_is_not_cached():
+    loader = FakeLoader(fail=1)
+    registry = ModelRegistry(loader=loader)
+    with pytest.raises(RuntimeError):
+        registry.get('small', 'cpu', 'int8')
+    assert not registry.contains('small', 'cpu', 'int8')
+
+    model = registry.get('small', 'cpu', 'int8')
+    assert registry.get('small', 'cpu', 'int8') is model
+    assert len(loader.calls) == 2
+
+
+def test_waiter_retries_after_failed_load():
+    loader = FakeLoader(block=True, fail=1)
+    registry = ModelRegistry(loader=loader)
+    outcome = {}
+
+    def first():
+        try:
+            registry.get('small', 'cpu', 'int8')
+        except RuntimeError as e:
+            outcome['first'] = e
+
+    thread = threading.Thread(target=first)
+    thread.start()
+    assert loader.started.wait(5)
+    waiter = threading.Thread(target=lambda: outcome.setdefault('second', registry.get('small', 'cpu', 'int8')))
+    waiter.start()
+    time.sleep(0.05)
+    loader.release.set()
+    thread.join(5)
+    waiter.join(5)
+
+    assert isinstance(outcome['first'], RuntimeError)
+    assert outcome['second'] is not None
+    assert len(loader.calls) == 2
+
+
+def test_release_and_clear():
+    registry = ModelRegistry(loader=FakeLoader())
+    registry.get('small', 'cpu', 'int8')
+    registry.get('base', 'cpu', 'int8')
+    registry.release('small', 'cpu', 'int8')
+    assert registry.stats()['models'] == ['base']
+    registry.clear()
+    assert registry.stats()['models'] == []
@@ -0,0 +1,46 @@
+"""
+Overlap chunking at forced cuts: held-back words, carried tail, dedupe
+"""
+from overlap_chunker import OverlapChunker
+
+
+def test_words_near_the_cut_are_held_back():
+    chunker = OverlapChunker(guard=0.5, max_overlap=2.0)
+    words = [(0.0, 1.0, "一"), (1.0, 3.0, "二"), (3.0, 3.8, "三")]
+
+    text, keep = chunker.split(words, 4.0, final=False)
+
+    assert text == "一二"
+    assert keep == 1.0
+    assert chunker.in_progress
+    assert chunker.chunk_start == 3.0
+
+
+def test_next_chunk_drops_already_emitted_words():
+    chunker = OverlapChunker(guard=0.5, max_overlap=2.0)
+    chunker.split([(0.0, 1.0, "一"), (1.0, 3.0, "二"), (3.0, 3.8, "三")], 4.0, final=False)
+
+    # The next chunk starts at 3.0 and hears "三" whole, then more speech
+    text, keep = chunker.split([(0.0, 0.9, "三"), (0.9, 2.0, "四")], 2.0, final=True)
+
+    assert text == "三四"
+    assert keep == 0.0
+    assert not chunker.in_progress
+
+
+def test_repeated_words_with_shifted_timestamps_are_dropped():
+    chunker = OverlapChunker(guard=0.5, max_overlap=2.0)
+    chunker.split([(0.0, 1.0, "一"), (1.0, 2.5, "二"), (3.6, 3.9, "三")], 4.0, final=False)
+
+    # Decode of the carried tail repeats "二" although it was cut off before
+    text, _ = chunker.split([(0.0, 0.6, "二"), (0.6, 1.4, "三")], 2.0, final=True)
+
+    assert text == "三"
+
+
+def test_tail_is_bounded_by_max_overlap():
+    chunker = OverlapChunker(guard=0.5, max_overlap=2.0)
+    text, keep = chunker.split([(3.7, 3.9, "一")], 4.0, final=False)
+
+    assert text == ""
+    assert keep == 2.0
@@ -0,0 +1,52 @@
+"""
+Pitch estimation and gender labels on synthetic pitched signals
+"""
+import numpy as np
+import pytest
+
+from audio_utils import AudioUtils
+from pitch_detector import PitchEstimator, classify_gender
+
+SAMPLE_RATE = 16000
+
+
+def synthetic_voice(f0, seconds=2.0, seed=0, vibrato=0.03, noise=0.02):
+    """Harmonic-rich pitched signal with vibrato and a syllable-like envelope"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    freq = f0 * (1 + vibrato * np.sin(2 * np.pi * 5 * t))
+    phase = 2 * np.pi * np.cumsum(freq) / SAMPLE_RATE
+    audio = sum((0.6 / k) * np.sin(k * phase) for k in range(1, 12))
+    audio *= (0.5 + 0.5 * np.sin(2 * np.pi * 1.5 * t)) ** 2
+    audio += noise * rng.standard_normal(len(t))
+    return audio.astype(np.float32)
+
+
+@pytest.mark.parametrize('f0', [70, 85, 100, 120, 140, 160, 190, 210, 240, 280, 320, 380])
+def test_estimate_within_one_percent(f0):
+    estimate = PitchEstimator(SAMPLE_RATE).estimate(synthetic_voice(f0))
+    assert estimate is not None
+    assert abs(estimate - f0) / f0 < 0.01
+
+
+@pytest.mark.parametrize('f0, expected', [(100, 'male'), (140, 'male'), (210, 'female'), (280, 'female')])
+def test_detect_gender_labels(f0, expected):
+    assert AudioUtils.detect_gender(synthetic_voice(f0), SAMPLE_RATE) == expected
+
+
+def test_noise_and_silence_are_unknown():
+    noise = (0.1 * np.random.default_rng(0).standard_normal(SAMPLE_RATE * 2)).astype(np.float32)
+    assert AudioUtils.detect_gender(noise, SAMPLE_RATE) == 'unknown'
+    assert PitchEstimator(SAMPLE_RATE).estimate(np.zeros(SAMPLE_RATE, dtype=np.float32)) is None
+
+
+def test_short_audio_has_no_frames():
+    estimator = PitchEstimator(SAMPLE_RATE)
+    assert len(estimator.frame_pitches(np.zeros(estimator.frame_length - 1))) == 0
+
+
+def test_classify_gender_overlap_zone():
+    assert classify_gender(None) == 'unknown'
+    assert classify_gender(120) == 'male'
+    assert classify_gender(172) == 'unknown'
+    assert classify_gender(230) == 'female'
@@ -0,0 +1,155 @@
+"""
+Line playback: PCM mixing (back to back, crossfade, stop), completion handles,
+pygame channel playback and channel reservation
+"""
+import os
+from collections import deque
+
+import numpy as np
+import pytest
+
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+pygame = pytest.importorskip('pygame')
+
+import playback
+from playback import PCMPlayback, PlaybackHandle, PygamePlayback
+from streaming_player import StreamingPlayer
+
+
+def pcm_player(crossfade_ms=0, rate=1000):
+    """PCMPlayback without an output stream (the tests call _mix like the audio callback)"""
+    player = object.__new__(PCMPlayback)
+    player.crossfade_ms = crossfade_ms
+    player.rate = rate
+    player.channels = 1
+    player._pending = deque()
+    player._voices = []
+    player._clear = False
+    return player
+
+
+def queue_line(player, frames, value):
+    pcm = np.full((frames, 1), value, dtype=np.int16)
+    handle = PlaybackHandle(frames / player.rate)
+    player._pending.append((pcm, handle))
+    return handle
+
+
+def test_lines_play_back_to_back():
+    player = pcm_player()
+    first = queue_line(player, 150, 100)
+    second = queue_line(player, 100, 7)
+
+    out = player._mix(128)[:, 0]
+    assert np.all(out == 100)
+    out = player._mix(128)[:, 0]
+    assert np.all(out[:22] == 100) and np.all(out[22:122] == 7) and np.all(out[122:] == 0)
+    assert first.done() and second.done()
+    assert player._voices == []
+
+
+def test_crossfade_overlaps_next_line():
+    player = pcm_player(crossfade_ms=10)   # 10 frames at 1 kHz
+    queue_line(player, 50, 100)
+    queue_line(player, 50, 10)
+
+    player._mix(20)
+    out = player._mix(64)[:, 0]
+    assert np.all(out[:20] == 100)
+    assert np.all(out[20:30] == 110)
+    assert np.all(out[30:] == 10)
+
+
+def test_mix_clips_instead_of_wrapping():
+    player = pcm_player(crossfade_ms=10)
+    queue_line(player, 20, 30000)
+    queue_line(player, 20, 30000)
+    player._mix(5)
+    out = player._mix(20)[:, 0]
+    assert out.max() == 32767
+    assert out.min() > 0
+
+
+def test_stopped_handle_is_skipped():
+    player = pcm_player()
+    playing = queue_line(player, 300, 100)
+    player._mix(64)
+    skipped = queue_line(player, 100, 50)
+    queued = queue_line(player, 100, 7)
+
+    playing.stop()
+    skipped.stop()
+    out = player._mix(64)[:, 0]
+    assert np.all(out == 7)
+    assert not queued.done()
+
+
+def test_stop_clears_everything_and_playback_recovers():
+    player = pcm_player()
+    playing = queue_line(player, 300, 100)
+    player._mix(64)
+    queued = queue_line(player, 100, 7)
+
+    player.stop()
+    assert queued.done()
+    assert np.all(player._mix(64) == 0)
+    assert playing.done()
+
+    # Idle stream (underrun) then a new line: starts at the top of the next buffer
+    assert np.all(player._mix(64) == 0)
+    line = queue_line(player, 10, 5)
+    out = player._mix(64)[:, 0]
+    assert np.all(out[:10] == 5) and np.all(out[10:] == 0)
+    assert line.done()
+
+
+def test_handle_completion():
+    handle = PlaybackHandle(1.0)
+    ended = []
+    handle.add_done_callback(ended.append)
+    assert not handle.wait(0.01)
+
+    handle._finish()
+    assert handle.wait(0)
+    assert ended == [handle]
+    assert handle.ended is not None
+
+    stopped = []
+    handle = PlaybackHandle(1.0, on_stop=lambda: stopped.append(True))
+    handle.stop()
+    handle.stop()
+    assert stopped == [True]
+    handle.add_done_callback(ended.append)   # Already done: runs right away
+    assert ended[-1] is handle
+
+
+@pytest.fixture
+def mixer():
+    pygame.mixer.init(frequency=24000, size=-16, channels=2)
+    yield
+    pygame.mixer.quit()
+
+
+def test_pygame_playback_completes_and_stops(mixer):
+    player = PygamePlayback(settle_ms=50)
+    short = player.prepare(np.zeros((2400, 2), dtype=np.int16))   # 0.1 s
+    handle = player.play(short)
+    assert handle.duration == pytest.approx(0.1, abs=0.01)
+    assert handle.wait(2)
+
+    long = player.play(np.zeros((240000, 2), dtype=np.int16))      # 10 s
+    replaced = player.play(short)                                    # Stops the line before it
+    assert long.wait(0)
+    player.stop()
+    assert replaced.wait(0)
+
+
+def test_players_share_one_channel_reservation(mixer, monkeypatch):
+    reserved = []
+    set_reserved = pygame.mixer.set_reserved
+    monkeypatch.setattr(pygame.mixer, 'set_reserved', lambda count: reserved.append(count) or set_reserved(count))
+
+    PygamePlayback(channel_id=1)._channel()
+    StreamingPlayer(channel_id=0)
+    assert reserved and min(reserved) >= playback.TTS_CHANNELS
+    assert pygame.mixer.get_num_channels() >= playback.TTS_CHANNELS
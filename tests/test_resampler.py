@@ -0,0 +1,55 @@
+"""
+Polyphase resampler: anti-aliasing and chunked vs one-shot output
+"""
+import numpy as np
+import pytest
+
+from resampler import resample, StreamingResampler, StreamingPreprocessor
+
+WHISPER_RATE = 16000
+
+
+def streaming(audio, from_rate, chunk):
+    resampler = StreamingResampler(from_rate, WHISPER_RATE)
+    parts = [resampler.process(audio[i:i + chunk]) for i in range(0, len(audio), chunk)]
+    parts.append(resampler.flush())
+    return np.concatenate(parts)
+
+
+@pytest.mark.parametrize('rate', [44100, 48000])
+def test_tone_above_nyquist_is_removed(rate):
+    t = np.arange(rate * 2) / rate
+    tone = (0.5 * np.sin(2 * np.pi * 10000 * t)).astype(np.float32)
+    out = resample(tone, rate, WHISPER_RATE)
+    level = 20 * np.log10(np.sqrt(np.mean(out ** 2)) / (0.5 / np.sqrt(2)) + 1e-12)
+    assert level < -40
+
+
+@pytest.mark.parametrize('rate', [44100, 48000])
+def test_speech_band_tone_passes(rate):
+    t = np.arange(rate * 2) / rate
+    tone = (0.5 * np.sin(2 * np.pi * 1000 * t)).astype(np.float32)
+    out = resample(tone, rate, WHISPER_RATE)
+    assert len(out) == 2 * WHISPER_RATE
+    assert np.sqrt(np.mean(out[1000:-1000] ** 2)) == pytest.approx(0.5 / np.sqrt(2), rel=0.02)
+
+
+@pytest.mark.parametrize('rate, chunk', [(48000, 512), (44100, 333), (44100, 1)])
+def test_streaming_matches_one_shot(rate, chunk):
+    audio = np.random.default_rng(0).standard_normal(rate // 2).astype(np.float32)
+    expected = resample(audio, rate, WHISPER_RATE)
+    out = streaming(audio, rate, chunk)
+    assert len(out) == len(expected)
+    assert np.abs(out - expected).max() < 1e-5
+
+
+def test_preprocessor_downmixes_interleaved_stereo():
+    rate = 48000
+    t = np.arange(rate) / rate
+    left = 0.4 * np.sin(2 * np.pi * 500 * t)
+    stereo = np.stack([left, left], axis=1).astype(np.float32).ravel()
+    preprocessor = StreamingPreprocessor(rate, 2, WHISPER_RATE)
+    out = np.concatenate([preprocessor.process(stereo[i:i + 2048]) for i in range(0, len(stereo), 2048)]
+                         + [preprocessor.flush()])
+    assert len(out) == WHISPER_RATE
+    assert np.abs(out[1000:-1000]).max() == pytest.approx(0.4, rel=0.02)
@@ -0,0 +1,90 @@
+"""
+Streaming MP3 playback: frame parsing, reservoir carrier frames, incremental decode
+"""
+import io
+import os
+
+import numpy as np
+import pytest
+
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+pygame = pytest.importorskip('pygame')
+
+from streaming_player import (StreamingPlayer, complete_frames, parse_mp3_header,
+                              reservoir_frame, side_info_length)
+
+# MPEG-2 Layer III, 48 kbps, 24 kHz, mono (Edge TTS output format), no CRC
+HEADER = bytes([0xFF, 0xF3, 0x64, 0xC4])
+
+
+def frame(begin, fill):
+    """One 144-byte frame: main_data_begin `begin`, main data bytes all `fill`"""
+    length = parse_mp3_header(HEADER)[0]
+    side = bytes([begin]) + bytes(side_info_length(HEADER) - 1)
+    return HEADER + side + bytes([fill]) * (length - 4 - len(side))
+
+
+def test_parse_header():
+    assert parse_mp3_header(HEADER) == (144, 24000, 576)
+    assert parse_mp3_header(b'\x00\x00\x00\x00') is None
+
+
+def test_complete_frames_skips_id3_and_partial_frame():
+    id3 = b'ID3\x04\x00\x00\x00\x00\x00\x05' + b'x' * 5
+    data = id3 + frame(0, 1) + frame(0, 2) + frame(0, 3)[:50]
+    starts = []
+
+    end, seconds = complete_frames(data, 0, starts)
+
+    assert starts == [15, 159]
+    assert end == 303
+    assert seconds == pytest.approx(2 * 576 / 24000)
+
+
+def test_reservoir_frame_carries_borrowed_bytes():
+    data = frame(0, 1) + frame(0, 2) + frame(200, 3)
+    starts = []
+    complete_frames(data, 0, starts)
+
+    carrier = reservoir_frame(data, starts, 2)
+
+    assert parse_mp3_header(carrier[:4])[0] == len(carrier) == 480
+    assert carrier[4:4 + side_info_length(carrier)] == bytes(side_info_length(carrier))
+    main_data = 144 - 4 - side_info_length(HEADER)
+    assert carrier[-200:] == bytes([1]) * (200 - main_data) + bytes([2]) * main_data
+    assert reservoir_frame(data, starts, 1) == b''
+
+
+@pytest.fixture
+def mixer():
+    pygame.mixer.init(frequency=24000, size=-16, channels=2)
+    yield
+    pygame.mixer.quit()
+
+
+def test_incremental_decode_matches_full_decode(mixer):
+    lameenc = pytest.importorskip('lameenc')
+    rate = 24000
+    t = np.arange(rate * 5) / rate
+    phase = 2 * np.pi * np.cumsum(180 * (1 + 0.1 * np.sin(2 * np.pi * 1.3 * t))) / rate
+    voice = sum(np.sin(k * phase) / k for k in range(1, 10)) * 0.2
+    voice += 0.02 * np.random.default_rng(0).standard_normal(len(t))
+    encoder = lameenc.Encoder()
+    encoder.set_bit_rate(48)
+    encoder.set_in_sample_rate(rate)
+    encoder.set_channels(1)
+    mp3 = encoder.encode((voice * 32767).astype(np.int16).tobytes()) + encoder.flush()
+
+    player = StreamingPlayer()
+    segments = []
+    player._enqueue = lambda sound: segments.append(sound.get_raw())
+    for i in range(0, len(mp3), 700):
+        player.feed(mp3[i:i + 700])
+    player.flush()
+
+    full = pygame.mixer.Sound(file=io.BytesIO(mp3)).get_raw()
+    streamed = b''.join(segments)
+    assert len(segments) > 5
+    assert len(streamed) == len(full)
+    difference = np.abs(np.frombuffer(streamed, np.int16).astype(int) - np.frombuffer(full, np.int16))
+    assert difference.max() <= 1
@@ -0,0 +1,82 @@
+"""
+Streaming STT: local-agreement commits and window trimming (fake Whisper model)
+"""
+import re
+from types import SimpleNamespace
+
+import numpy as np
+
+from streaming_stt import HypothesisBuffer, StreamingTranscriber
+
+SAMPLE_RATE = 16000
+
+
+class FakeModel:
+    """
+    Word i spans 0.5*i .. 0.5*i + 0.4 s of the utterance; a word is heard
+    once its audio is in the window. With `unstable`, every decode spells
+    the words differently, so two decodes never agree.
+    """
+
+    def __init__(self, transcriber, unstable=False):
+        self.transcriber = transcriber
+        self.unstable = unstable
+        self.calls = 0
+
+    def transcribe(self, audio, **options):
+        self.calls += 1
+        offset = self.transcriber.offset
+        window_end = offset + len(audio) / SAMPLE_RATE
+        suffix = "ab"[self.calls % 2] if self.unstable else ""
+        words = []
+        i = 0
+        while 0.5 * i + 0.4 <= window_end:
+            start = 0.5 * i
+            if start >= offset - 1e-6:
+                words.append(SimpleNamespace(start=start - offset, end=start + 0.4 - offset, word=f" w{i}{suffix}"))
+            i += 1
+        return [SimpleNamespace(words=words)], None
+
+
+def run(transcriber, seconds, step=0.5):
+    text = ""
+    for _ in range(int(seconds / step)):
+        transcriber.insert_audio(np.zeros(int(step * SAMPLE_RATE), dtype=np.float32))
+        text += transcriber.process_iter()
+    return text, transcriber.finish()
+
+
+def indices(text):
+    return [int(i) for i in re.findall(r'w(\d+)', text)]
+
+
+def test_agreement_commits_while_speaking():
+    transcriber = StreamingTranscriber(None, SAMPLE_RATE, buffer_trim=3.0)
+    transcriber.model = FakeModel(transcriber)
+
+    streamed, rest = run(transcriber, 6.0)
+
+    assert indices(streamed)[:5] == [0, 1, 2, 3, 4]
+    assert indices(streamed + rest) == list(range(12))
+
+
+def test_trim_without_agreement_keeps_every_word():
+    transcriber = StreamingTranscriber(None, SAMPLE_RATE, buffer_trim=3.0)
+    model = FakeModel(transcriber, unstable=True)
+    transcriber.model = model
+
+    streamed, rest = run(transcriber, 8.0)
+
+    assert streamed  # Words before the fallback cut left STT during speech
+    assert indices(streamed + rest) == list(range(16))
+    assert len(transcriber.audio) == 0  # finish() reset the window
+
+
+def test_commit_until_moves_words_before_time():
+    hypothesis = HypothesisBuffer()
+    hypothesis.insert([(0.0, 0.4, " a"), (0.5, 0.9, " b"), (1.0, 1.4, " c")], 0.0)
+    hypothesis.flush()
+
+    assert hypothesis.commit_until(1.0) == [(0.0, 0.4, " a"), (0.5, 0.9, " b")]
+    assert hypothesis.complete() == [(1.0, 1.4, " c")]
+    assert hypothesis.last_committed_time == 0.9
@@ -0,0 +1,73 @@
+"""
+Translation micro-batching: queue draining and joined requests
+"""
+import queue
+import threading
+import time
+
+import pytest
+
+from translation_batcher import MAX_PAYLOAD_CHARS, drain_batch, translate_batch
+
+
+class FakeTranslator:
+    """Prefixes every line; `drop_lines` loses the line breaks of joined requests"""
+
+    def __init__(self, drop_lines=False):
+        self.requests = []
+        self.drop_lines = drop_lines
+
+    def translate(self, text):
+        self.requests.append(text)
+        if self.drop_lines:
+            text = text.replace("\n", " ")
+        return "\n".join(f"vi:{line}" for line in text.split("\n"))
+
+
+def test_drain_batch_collects_within_window():
+    q = queue.Queue()
+    for i in range(3):
+        q.put(i)
+    assert drain_batch(q, max_batch=8, window=0.01) == [0, 1, 2]
+
+
+def test_drain_batch_stops_at_max_batch():
+    q = queue.Queue()
+    for i in range(5):
+        q.put(i)
+    assert drain_batch(q, max_batch=2, window=0.01) == [0, 1]
+    assert q.qsize() == 3
+
+
+def test_drain_batch_waits_for_late_items():
+    q = queue.Queue()
+    q.put('first')
+    threading.Timer(0.02, q.put, ('late',)).start()
+    assert drain_batch(q, max_batch=8, window=0.2) == ['first', 'late']
+
+
+def test_drain_batch_raises_when_idle():
+    start = time.perf_counter()
+    with pytest.raises(queue.Empty):
+        drain_batch(queue.Queue(), timeout=0.01)
+    assert time.perf_counter() - start < 0.5
+
+
+def test_one_request_per_batch():
+    translator = FakeTranslator()
+    assert translate_batch(translator, ["一", "二\n三", "四"]) == ["vi:一", "vi:二 三", "vi:四"]
+    assert len(translator.requests) == 1
+
+
+def test_line_count_mismatch_falls_back_to_single_requests():
+    translator = FakeTranslator(drop_lines=True)
+    assert translate_batch(translator, ["一", "二"]) == ["vi:一", "vi:二"]
+    assert len(translator.requests) == 3
+
+
+def test_large_batches_are_split_under_the_payload_limit():
+    translator = FakeTranslator()
+    lines = ["字" * 1000 for _ in range(10)]
+    assert len(translate_batch(translator, lines)) == 10
+    assert len(translator.requests) > 1
+    assert all(len(request) <= MAX_PAYLOAD_CHARS for request in translator.requests)
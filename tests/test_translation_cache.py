@@ -0,0 +1,111 @@
+"""
+Translation cache: hit/miss, TTL, persistence and CachedTranslator fallthrough
+"""
+import json
+
+import translation_cache
+from translation_cache import CachedTranslator, TranslationCache
+
+
+class FakeTranslator:
+    """Counts calls; translation = '<vi>' + text"""
+
+    def __init__(self):
+        self.calls = []
+        self.batch_calls = []
+
+    def translate(self, text):
+        self.calls.append(text)
+        return f"<vi>{text}"
+
+    def translate_batch(self, texts):
+        self.batch_calls.append(list(texts))
+        return [f"<vi>{text}" for text in texts]
+
+
+def test_hit_and_miss_counts():
+    cache = TranslationCache()
+    assert cache.get("你好") is None
+    cache.put("你好", "xin chào")
+
+    assert cache.get("你好") == "xin chào"
+    assert cache.get("你好 !") == "xin chào"  # Normalized key
+    stats = cache.stats()
+    assert (stats['hits'], stats['misses']) == (2, 1)
+
+
+def test_ttl_expires_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(translation_cache.time, 'time', lambda: now[0])
+    cache = TranslationCache(ttl=10)
+    cache.put("你好", "xin chào")
+
+    now[0] += 5
+    assert cache.get("你好") == "xin chào"
+    now[0] += 10
+    assert cache.get("你好") is None
+    assert cache.stats()['expired'] == 1
+
+
+def test_lru_eviction():
+    cache = TranslationCache(max_entries=2)
+    cache.put("一", "một")
+    cache.put("二", "hai")
+    cache.get("一")
+    cache.put("三", "ba")
+
+    assert cache.get("二") is None
+    assert cache.get("一") == "một"
+    assert cache.stats()['evictions'] == 1
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "translations.json")
+    cache = TranslationCache(path)
+    cache.put("你好", "xin chào")
+    cache.save()
+
+    assert TranslationCache(path).get("你好") == "xin chào"
+
+
+def test_load_skips_expired_entries(tmp_path):
+    path = tmp_path / "translations.json"
+    path.write_text(json.dumps({'entries': [["你好", ["xin chào", 0.0]]]}), encoding='utf-8')
+    assert TranslationCache(str(path), ttl=60).get("你好") is None
+
+
+def test_load_treats_bad_files_as_empty(tmp_path):
+    path = tmp_path / "translations.json"
+    for content in ("not json", "[]", '{"entries": 5}', '{"entries": [[1, 2, 3]]}',
+                    '{"entries": [["a", ["b", "later"]]]}', '{"entries": [["a", [null, 1]]]}'):
+        path.write_text(content, encoding='utf-8')
+        cache = TranslationCache(str(path))
+        assert cache.stats()['entries'] == 0
+
+
+def test_cached_translator_falls_through_on_miss_only():
+    backend = FakeTranslator()
+    translator = CachedTranslator(backend, TranslationCache())
+
+    assert translator.translate("你好") == "<vi>你好"
+    assert translator.translate("你好") == "<vi>你好"
+    assert backend.calls == ["你好"]
+
+
+def test_cached_translator_batches_only_misses():
+    backend = FakeTranslator()
+    translator = CachedTranslator(backend, TranslationCache())
+    translator.translate("一")
+
+    assert translator.translate_batch(["一", "二", "二", "三"]) == ["<vi>一", "<vi>二", "<vi>二", "<vi>三"]
+    assert backend.batch_calls == [["二", "三"]]
+
+
+def test_namespaces_keep_language_pairs_apart():
+    cache = TranslationCache()
+    zh = CachedTranslator(FakeTranslator(), cache)
+    en = CachedTranslator(FakeTranslator(), cache, namespace='en→vi|')
+    cache.put("ok", "từ tiếng Trung")
+
+    assert zh.translate("ok") == "từ tiếng Trung"
+    assert en.translate("ok") == "<vi>ok"
@@ -0,0 +1,145 @@
+"""
+Translator backends: the abstract interface, backend selection and local MT
+token handling with fake deep_translator / ctranslate2 / sentencepiece modules
+"""
+import sys
+import types
+
+import pytest
+
+import translator_backends
+from translator_backends import GoogleBackend, LocalMTBackend, TranslatorBackend, create_translator
+
+
+class FakeGoogleTranslator:
+    def __init__(self, source, target):
+        self.source = source
+        self.target = target
+
+    def translate(self, text):
+        return f"{self.target}:{text}"
+
+
+class FakeSentencePiece:
+    """One piece per character"""
+
+    def __init__(self, model_file):
+        self.model_file = model_file
+
+    def encode(self, text, out_type=str):
+        return list(text)
+
+    def decode(self, tokens):
+        return "".join(tokens)
+
+
+class FakeResult:
+    def __init__(self, hypothesis):
+        self.hypotheses = [hypothesis]
+
+
+class FakeCTranslator:
+    """Echoes the source pieces upper-cased, behind the forced target prefix"""
+
+    def __init__(self, model_dir, **options):
+        self.model_dir = model_dir
+        self.options = options
+        self.calls = []
+
+    def translate_batch(self, batch, beam_size=1, max_decoding_length=256, target_prefix=None):
+        self.calls.append((batch, target_prefix))
+        results = []
+        for i, tokens in enumerate(batch):
+            hypothesis = [t.upper() for t in tokens if t != "</s>" and not t.startswith("zho")]
+            if target_prefix:
+                hypothesis = target_prefix[i] + hypothesis
+            results.append(FakeResult(hypothesis))
+        return results
+
+
+@pytest.fixture
+def fake_google(monkeypatch):
+    module = types.ModuleType('deep_translator')
+    module.GoogleTranslator = FakeGoogleTranslator
+    monkeypatch.setitem(sys.modules, 'deep_translator', module)
+
+
+@pytest.fixture
+def fake_local(monkeypatch):
+    monkeypatch.setattr(translator_backends, 'ctranslate2', types.SimpleNamespace(Translator=FakeCTranslator))
+    monkeypatch.setattr(translator_backends, 'sentencepiece',
+                        types.SimpleNamespace(SentencePieceProcessor=FakeSentencePiece))
+
+
+def test_backend_interface_is_abstract():
+    with pytest.raises(TypeError):
+        TranslatorBackend()
+
+    class Incomplete(TranslatorBackend):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_default_translate_batch_joins_lines():
+    class Echo(TranslatorBackend):
+        def __init__(self):
+            self.requests = []
+
+        def translate(self, text):
+            self.requests.append(text)
+            return text.upper()
+
+    backend = Echo()
+    assert backend.translate_batch(["a", "b"]) == ["A", "B"]
+    assert backend.requests == ["a\nb"]
+
+
+def test_create_translator_google(fake_google):
+    backend = create_translator()
+    assert isinstance(backend, GoogleBackend)
+    assert (backend.translator.source, backend.translator.target) == ('zh-CN', 'vi')
+    assert backend.translate("你好") == "vi:你好"
+
+    pivot = create_translator({'translator_backend': 'google'}, pivot=True)
+    assert pivot.translator.source == 'en'
+
+
+def test_create_translator_local(fake_local, tmp_path):
+    model_dir = tmp_path / 'opus-mt'
+    model_dir.mkdir()
+    backend = create_translator({'translator_backend': 'local', 'local_mt_model_dir': str(model_dir)})
+    assert isinstance(backend, LocalMTBackend)
+    assert backend.translator.model_dir == str(model_dir)
+    assert backend.source_sp.model_file.endswith('source.spm')
+    assert backend.target_sp.model_file.endswith('target.spm')
+
+    pivot_dir = tmp_path / 'pivot'
+    pivot_dir.mkdir()
+    pivot = create_translator({'translator_backend': 'local', 'local_mt_pivot_model_dir': str(pivot_dir)}, pivot=True)
+    assert pivot.translator.model_dir == str(pivot_dir)
+
+
+def test_local_mt_missing_model(fake_local, tmp_path):
+    with pytest.raises(RuntimeError):
+        LocalMTBackend(str(tmp_path / 'missing'))
+
+
+def test_local_mt_strips_target_prefix(fake_local, tmp_path):
+    (tmp_path / 'sentencepiece.bpe.model').write_bytes(b'')
+    backend = LocalMTBackend(str(tmp_path), source_prefix='zho_Hans', target_prefix='vie_Latn')
+    assert backend.source_sp is backend.target_sp
+
+    assert backend.translate_batch(["ab", "c"]) == ["AB", "C"]
+    batch, target_prefix = backend.translator.calls[-1]
+    assert batch == [['zho_Hans', 'a', 'b', '</s>'], ['zho_Hans', 'c', '</s>']]
+    assert target_prefix == [['vie_Latn'], ['vie_Latn']]
+    assert backend.translate("x") == "X"
+    assert backend.translate_batch([]) == []
+
+
+def test_local_mt_without_prefix(fake_local, tmp_path):
+    backend = LocalMTBackend(str(tmp_path))
+    assert backend.translate_batch(["vie_Latn"]) == ["VIE_LATN"]
+    assert backend.translator.calls[-1][1] is None
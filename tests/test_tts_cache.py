@@ -0,0 +1,97 @@
+"""
+TTS cache: key normalization, memory LRU, disk store and pruning, counters
+"""
+import os
+
+from tts_cache import TTSCache
+
+
+def files(cache_dir):
+    return sorted(name for name in os.listdir(cache_dir) if name.endswith('.audio'))
+
+
+def test_make_key_normalizes_text():
+    key = TTSCache.make_key('edge', 'vi-VN-HoaiMyNeural', '+0%', "xin  chào\n")
+    assert key == TTSCache.make_key('edge', 'vi-VN-HoaiMyNeural', '+0%', " xin chào")
+    # NFD input ("a" + combining grave) matches the precomposed form
+    assert TTSCache.make_key('edge', 'v', 0, "cha\u0300o") == TTSCache.make_key('edge', 'v', 0, "ch\u00e0o")
+    assert key != TTSCache.make_key('edge', 'vi-VN-NamMinhNeural', '+0%', "xin chào")
+    assert key != TTSCache.make_key('gtts', 'vi-VN-HoaiMyNeural', '+0%', "xin chào")
+    assert key != TTSCache.make_key('edge', 'vi-VN-HoaiMyNeural', '+10%', "xin chào")
+
+
+def test_memory_lru_bound():
+    cache = TTSCache(max_memory_bytes=10)
+    cache.put('a', b'1234')
+    cache.put('b', b'1234')
+    assert cache.get('a') == b'1234'   # a is now the most recent
+    cache.put('c', b'1234')            # 12 bytes: evicts b
+
+    assert cache.get('b') is None
+    assert cache.get('a') == b'1234'
+    assert cache.get('c') == b'1234'
+    stats = cache.stats()
+    assert stats['memory_entries'] == 2
+    assert stats['memory_bytes'] == 8
+    assert stats['evictions'] == 1
+
+
+def test_oversized_entry_skips_memory():
+    cache = TTSCache(max_memory_bytes=4)
+    cache.put('big', b'123456')
+    cache.put('empty', b'')
+    assert cache.stats()['memory_entries'] == 0
+    assert cache.get('big') is None
+
+
+def test_disk_store_survives_restart(tmp_path):
+    cache = TTSCache(str(tmp_path))
+    cache.put('k', b'audio')
+    assert files(tmp_path) == ['k.audio']
+
+    restarted = TTSCache(str(tmp_path))
+    assert restarted.stats()['disk_bytes'] == 5
+    assert restarted.get('k') == b'audio'
+    assert restarted.get('k') == b'audio'   # Promoted to memory
+    stats = restarted.stats()
+    assert (stats['hits'], stats['disk_hits'], stats['misses']) == (2, 1, 0)
+    assert stats['memory_entries'] == 1
+
+
+def test_disk_pruning_drops_least_recently_used(tmp_path):
+    cache = TTSCache(str(tmp_path), max_disk_bytes=10)
+    for age, key in enumerate(('old', 'mid', 'new')):
+        cache.put(key, b'1234')
+        os.utime(tmp_path / f'{key}.audio', (1000 + age, 1000 + age))
+    # 12 bytes on disk: the oldest file went when 'new' was written
+    assert files(tmp_path) == ['mid.audio', 'new.audio']
+
+    # A disk read refreshes the file's age
+    cache._memory.clear()
+    assert cache.get('mid') == b'1234'
+    cache.put('newest', b'1234')
+    assert files(tmp_path) == ['mid.audio', 'newest.audio']
+    assert cache.stats()['disk_bytes'] == 8
+
+
+def test_startup_prunes_over_budget_store(tmp_path):
+    for i in range(4):
+        (tmp_path / f'{i}.audio').write_bytes(b'12345')
+        os.utime(tmp_path / f'{i}.audio', (1000 + i, 1000 + i))
+    (tmp_path / 'notes.txt').write_bytes(b'x' * 100)
+
+    cache = TTSCache(str(tmp_path), max_disk_bytes=10)
+    assert files(tmp_path) == ['2.audio', '3.audio']
+    assert os.path.exists(tmp_path / 'notes.txt')
+    assert cache.stats()['disk_bytes'] == 10
+
+
+def test_hit_miss_counters(tmp_path):
+    cache = TTSCache(str(tmp_path))
+    assert cache.get('missing') is None
+    cache.put('k', b'audio')
+    cache.get('k')
+    stats = cache.stats()
+    assert (stats['hits'], stats['disk_hits'], stats['misses']) == (1, 0, 1)
+    assert stats['hit_rate'] == 0.5
+    assert TTSCache().stats()['hit_rate'] == 0.0
@@ -0,0 +1,114 @@
+"""
+TTS pipeline: ordered playback, the idle streaming handoff, padding and shutdown
+"""
+import threading
+import time
+
+from tts_pipeline import TTSPipeline
+
+
+class FakeEngine:
+    """Records what was played; `delays` slows synthesis per line, `hold` blocks playback"""
+
+    def __init__(self, mode='gtts', streaming=False, delays=None):
+        self.mode = mode
+        self.streaming = streaming
+        self.delays = delays or {}
+        self.hold = threading.Event()
+        self.hold.set()
+        self.played = []
+        self.paddings = {}
+        self.done = threading.Semaphore(0)
+
+    def generate_audio(self, text, gender, padding):
+        time.sleep(self.delays.get(text, 0))
+        self.paddings[text] = padding
+        return (f"mp3:{text}".encode(), None)
+
+    def prepare_audio(self, data):
+        return data.decode().replace('mp3:', 'pcm:')
+
+    def play_audio_data(self, audio):
+        self.hold.wait(5)
+        self.played.append(audio)
+        self.done.release()
+
+    def speak(self, text, gender, padding=False):
+        self.hold.wait(5)
+        self.paddings[text] = padding
+        self.played.append(f"stream:{text}")
+        self.done.release()
+
+
+def wait_played(engine, count):
+    for _ in range(count):
+        assert engine.done.acquire(timeout=5)
+
+
+def test_lines_play_in_submit_order():
+    engine = FakeEngine(delays={'one': 0.1})
+    pipeline = TTSPipeline(engine, workers=2)
+    for text in ('one', 'two', 'three'):
+        pipeline.submit(text)
+    wait_played(engine, 3)
+    pipeline.shutdown()
+    assert engine.played == ['pcm:one', 'pcm:two', 'pcm:three']
+
+
+def test_idle_edge_line_is_streamed():
+    engine = FakeEngine(mode='edge', streaming=True)
+    engine.hold.clear()
+    pipeline = TTSPipeline(engine)
+    pipeline.submit('first')    # Idle: handed to speak()
+    pipeline.submit('second')   # Behind a playing line: synthesized ahead
+    engine.hold.set()
+    wait_played(engine, 2)
+    pipeline.shutdown()
+    assert engine.played == ['stream:first', 'pcm:second']
+
+
+def test_padding_only_after_a_silent_gap():
+    engine = FakeEngine()
+    engine.hold.clear()
+    pipeline = TTSPipeline(engine)
+    pipeline.submit('first')
+    pipeline.submit('queued')
+    engine.hold.set()
+    wait_played(engine, 2)
+    assert engine.paddings == {'first': True, 'queued': False}
+
+    time.sleep(0.05)  # Let the playback loop record the end time
+    pipeline.submit('soon after')
+    wait_played(engine, 1)
+    assert engine.paddings['soon after'] is False
+
+    pipeline._last_end = time.time() - TTSPipeline.PADDING_GAP - 1
+    pipeline.submit('after silence')
+    wait_played(engine, 1)
+    pipeline.shutdown()
+    assert engine.paddings['after silence'] is True
+
+
+def test_shutdown_drops_queued_lines_and_unblocks_submit():
+    engine = FakeEngine()
+    engine.hold.clear()
+    pipeline = TTSPipeline(engine, workers=1, lookahead=1)
+    pipeline.submit('playing')
+    while pipeline.playback_queue.qsize():
+        time.sleep(0.01)
+    pipeline.submit('queued')     # Fills the queue
+
+    blocked = threading.Thread(target=pipeline.submit, args=('blocked',))
+    blocked.start()
+    time.sleep(0.2)
+    assert blocked.is_alive()     # Waiting for room in the queue
+
+    pipeline.shutdown()
+    blocked.join(2)
+    assert not blocked.is_alive()
+    engine.hold.set()
+    pipeline.thread.join(2)
+
+    pipeline.submit('late')       # Ignored after shutdown
+    assert not pipeline.thread.is_alive()
+    assert engine.played == ['pcm:playing']
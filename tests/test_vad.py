@@ -0,0 +1,127 @@
+"""
+Energy VAD: silence, rumble, steady backgrounds and speech over them;
+Silero windowing and gate transitions with a fake ONNX session
+"""
+import numpy as np
+
+from vad import EnergyVAD, SileroVAD, VoiceActivityDetector, create_vad
+
+SAMPLE_RATE = 16000
+CHUNK = 512
+
+
+def chunks(audio):
+    return [audio[i:i + CHUNK] for i in range(0, len(audio) - CHUNK + 1, CHUNK)]
+
+
+def tone(freq, seconds, level=0.2):
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    return (level * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+
+
+def voiced(seconds, f0=150, level=0.2):
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    audio = sum(np.sin(2 * np.pi * f0 * k * t) / k for k in range(1, 15))
+    return (level * audio / np.abs(audio).max()).astype(np.float32)
+
+
+def test_silence_is_not_speech():
+    vad = EnergyVAD(SAMPLE_RATE)
+    assert not any(vad.is_speech(chunk) for chunk in chunks(np.zeros(SAMPLE_RATE, dtype=np.float32)))
+    assert not vad.is_speech(np.zeros(0, dtype=np.float32))
+
+
+def test_voice_after_quiet_is_speech():
+    vad = EnergyVAD(SAMPLE_RATE)
+    quiet = (1e-4 * np.random.default_rng(0).standard_normal(SAMPLE_RATE)).astype(np.float32)
+    for chunk in chunks(quiet):
+        vad.is_speech(chunk)
+    assert all(vad.is_speech(chunk) for chunk in chunks(voiced(0.5)))
+
+
+def test_rumble_is_rejected_by_speech_band():
+    vad = EnergyVAD(SAMPLE_RATE)
+    assert not any(vad.is_speech(chunk) for chunk in chunks(tone(60, 1.0, level=0.5)))
+
+
+def test_steady_background_is_absorbed_into_floor():
+    vad = EnergyVAD(SAMPLE_RATE)
+    results = [vad.is_speech(chunk) for chunk in chunks(tone(440, 20.0))]
+    assert not any(results[-SAMPLE_RATE // CHUNK:])
+
+
+def test_floor_frozen_during_speech():
+    frozen = EnergyVAD(SAMPLE_RATE)
+    drifting = EnergyVAD(SAMPLE_RATE)
+    for chunk in chunks(voiced(3.0)):
+        frozen.is_speech(chunk, speech_active=True)
+        drifting.is_speech(chunk)
+    assert frozen.floor_db < drifting.floor_db - 6
+
+
+def test_detector_hangover_bridges_short_gaps():
+    detector, warning = create_vad({'vad_backend': 'energy'}, SAMPLE_RATE)
+    assert warning is None
+    for chunk in chunks(voiced(0.5)):
+        detector.is_speech(chunk)
+    gap = np.zeros(CHUNK, dtype=np.float32)
+    assert detector.is_speech(gap)
+    assert detector.stats()['speech_chunks'] > 0
+
+
+class FakeSession:
+    """Speech probability = loudest sample of the window; records every input"""
+
+    def __init__(self):
+        self.inputs = []
+
+    def run(self, outputs, feeds):
+        self.inputs.append(feeds['input'][0].copy())
+        probability = float(np.abs(feeds['input'][0][SileroVAD.CONTEXT:]).max())
+        return np.array([[probability]], dtype=np.float32), feeds['state'] + 1
+
+
+class FakeGate:
+    """Energy stage that opens whenever the chunk is not all zeros"""
+
+    def is_speech(self, chunk, speech_active=False):
+        return bool(np.any(chunk))
+
+    def reset(self):
+        pass
+
+
+def fake_silero():
+    silero = SileroVAD.__new__(SileroVAD)
+    silero.session = FakeSession()
+    silero.sample_rate = np.array(SAMPLE_RATE, dtype=np.int64)
+    silero.reset()
+    return silero
+
+
+def test_silero_partial_windows_return_none():
+    silero = fake_silero()
+    assert silero.probability(np.full(300, 0.9, dtype=np.float32)) is None
+    assert silero.probability(np.full(300, 0.9, dtype=np.float32)) == np.float32(0.9)
+    assert silero.probability(np.full(100, 0.1, dtype=np.float32)) is None
+    assert len(silero.session.inputs) == 1
+    assert len(silero._pending) == 188
+
+
+def test_detector_needs_a_fresh_window_per_run():
+    silero = fake_silero()
+    detector = VoiceActivityDetector(FakeGate(), silero, threshold=0.5, hangover_ms=0)
+    loud = np.full(171, 0.9, dtype=np.float32)
+    quiet = np.full(171, 0.1, dtype=np.float32)
+    silence = np.zeros(171, dtype=np.float32)
+
+    # No window completed yet: undecided chunks are not speech
+    assert [detector.is_speech(loud) for _ in range(4)] == [False, False, True, True]
+
+    # Gate closes; the next run must not reuse the loud decision or the loud audio
+    assert not detector.is_speech(silence)
+    assert [detector.is_speech(quiet) for _ in range(3)] == [False, False, False]
+    assert np.all(silero.session.inputs[-1][:SileroVAD.CONTEXT] == 0)
+    assert np.all(silero.session.inputs[-1][SileroVAD.CONTEXT:] == np.float32(0.1))
+    assert silero._state.max() == 1
+    assert detector.stats()['neural_rejects'] == 5
@@ -0,0 +1,102 @@
+"""
+Voice catalog: language/gender detection, lookups and the on-disk cache
+"""
+import json
+from types import SimpleNamespace
+
+import voice_catalog
+from voice_catalog import VoiceCatalog, get_catalog, voice_gender, voice_language
+
+
+def voice(voice_id, name, language, gender):
+    return {'id': voice_id, 'name': name, 'language': language, 'gender': gender}
+
+
+VOICES = [
+    voice('TTS_MS_EN-US_ZIRA_11.0', 'Microsoft Zira', 'en', 'female'),
+    voice('TTS_MS_VI-VN_AN_11.0', 'Microsoft An', 'vi', 'male'),
+    voice('vi-hoaimy', 'Hoài My', 'vi', 'female'),
+    voice('vi-other', 'Other', 'vi', None)
+]
+
+
+class FakeEngine:
+    def __init__(self, voices):
+        self.voices = voices
+        self.enumerations = 0
+
+    def getProperty(self, name):
+        assert name == 'voices'
+        self.enumerations += 1
+        return self.voices
+
+
+def test_voice_language_and_gender():
+    assert voice_language('TTS_MS_EN-US_DAVID_11.0', 'Microsoft David') == 'en'
+    assert voice_language('x', 'y', [b'\x05vi']) == 'vi'
+    assert voice_language('HKEY\\Tokens\\MSTTS_V110_viVN_An', 'Microsoft An') == 'vi'
+    assert voice_gender('Microsoft An') == 'male'
+    assert voice_gender('Microsoft Hoài My') == 'female'
+    assert voice_gender('Microsoft Zira', 'VoiceGenderMale') == 'male'
+    assert voice_gender('Anna') is None
+
+
+def test_find_and_best():
+    catalog = VoiceCatalog(VOICES)
+    assert [v['id'] for v in catalog.find('vi')] == ['TTS_MS_VI-VN_AN_11.0', 'vi-hoaimy', 'vi-other']
+    assert [v['id'] for v in catalog.find('vi', 'female')] == ['vi-hoaimy']
+    assert catalog.best('vi', 'male') == 'TTS_MS_VI-VN_AN_11.0'
+    assert catalog.best('en', 'male') == 'TTS_MS_EN-US_ZIRA_11.0'  # Falls back to any voice of the language
+    assert catalog.best('fr') is None
+    assert catalog.find('fr') == []
+
+
+def test_cache_round_trip(tmp_path):
+    path = str(tmp_path / 'voices' / 'voices.json')
+    VoiceCatalog(VOICES, 'key', stamp='3@1').save(path)
+
+    cached = VoiceCatalog.load(path, 'key', stamp='3@1')
+    assert cached.from_cache
+    assert cached.voices == VOICES
+    assert cached.best('vi', 'female') == 'vi-hoaimy'
+
+
+def test_cache_rejects_other_key_stamp_or_age(tmp_path):
+    path = str(tmp_path / 'voices.json')
+    VoiceCatalog(VOICES, 'key', created=1000.0, stamp='3@1').save(path)
+
+    assert VoiceCatalog.load(path, 'other', stamp='3@1') is None
+    assert VoiceCatalog.load(path, 'key', stamp='4@2') is None  # Voice pack installed since
+    assert VoiceCatalog.load(path, 'key', max_age=60, stamp='3@1') is None
+    assert VoiceCatalog.load(path, 'key', stamp='3@1') is not None
+
+
+def test_cache_ignores_bad_files(tmp_path):
+    path = tmp_path / 'voices.json'
+    assert VoiceCatalog.load(str(path), 'key') is None
+    path.write_text('{not json', encoding='utf-8')
+    assert VoiceCatalog.load(str(path), 'key') is None
+    path.write_text(json.dumps({'key': 'key', 'created': 'soon', 'voices': []}), encoding='utf-8')
+    assert VoiceCatalog.load(str(path), 'key') is None
+    path.write_text(json.dumps({'key': 'key', 'created': 1.0, 'voices': [{'id': 'x'}]}), encoding='utf-8')
+    assert VoiceCatalog.load(str(path), 'key') is None
+
+
+def test_get_catalog_enumerates_once_per_voice_set(tmp_path, monkeypatch):
+    monkeypatch.setitem(voice_catalog.Config.CACHE, 'dir', str(tmp_path))
+    monkeypatch.setattr(voice_catalog, '_catalog', None)
+    stamp = ['1@1']
+    monkeypatch.setattr(voice_catalog, 'voice_set_stamp', lambda: stamp[0])
+    engine = FakeEngine([SimpleNamespace(id='TTS_MS_EN-US_ZIRA_11.0', name='Microsoft Zira')])
+
+    assert get_catalog(engine).find('vi') == []
+    monkeypatch.setattr(voice_catalog, '_catalog', None)
+    assert get_catalog(engine).from_cache  # No Vietnamese voice, still no re-enumeration
+    assert engine.enumerations == 1
+
+    # Installing a voice changes the stamp
+    engine.voices.append(SimpleNamespace(id='vi-hoaimy', name='Microsoft Hoài My', languages=['vi-VN']))
+    stamp[0] = '2@2'
+    monkeypatch.setattr(voice_catalog, '_catalog', None)
+    assert get_catalog(engine).best('vi', 'female') == 'vi-hoaimy'
+    assert engine.enumerations == 2
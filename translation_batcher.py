@@ -0,0 +1,77 @@
+"""
+Translation Batcher Module
+Micro-batching of queued transcripts into one translation request
+"""
+import queue
+import time
+
+
+# Joins lines into one request; Google keeps line breaks in its output
+BATCH_DELIMITER = "\n"
+# Google Translate rejects payloads above 5000 characters
+MAX_PAYLOAD_CHARS = 4500
+
+
+def drain_batch(q, max_batch=8, window=0.05, timeout=0.5):
+    """
+    Collect a batch of items from a queue
+
+    Blocks up to `timeout` for the first item, then keeps collecting for at
+    most `window` seconds (or until `max_batch` items).
+
+    Raises:
+        queue.Empty: If nothing arrives within `timeout`
+    """
+    batch = [q.get(timeout=timeout)]
+    deadline = time.perf_counter() + window
+
+    while len(batch) < max_batch:
+        remaining = deadline - time.perf_counter()
+        try:
+            if remaining > 0:
+                batch.append(q.get(timeout=remaining))
+            else:
+                batch.append(q.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+
+def _payload_groups(texts):
+    """Split texts into groups whose joined payload stays under MAX_PAYLOAD_CHARS"""
+    group, size = [], 0
+    for text in texts:
+        if group and size + len(text) + len(BATCH_DELIMITER) > MAX_PAYLOAD_CHARS:
+            yield group
+            group, size = [], 0
+        group.append(text)
+        size += len(text) + len(BATCH_DELIMITER)
+    if group:
+        yield group
+
+
+def translate_batch(translator, texts):
+    """
+    Translate several lines with as few requests as possible
+
+    Sends one delimiter-joined payload per group and splits the result (the
+    deep_translator translate_batch is just a loop of single requests). If the
+    line count does not survive the round trip, falls back to one call per line.
+
+    Returns:
+        list: Translations in the same order as `texts`
+    """
+    if len(texts) == 1:
+        return [translator.translate(texts[0])]
+
+    results = []
+    for group in _payload_groups(texts):
+        # Lines must not contain the delimiter themselves
+        cleaned = [text.replace(BATCH_DELIMITER, " ") for text in group]
+        translated = translator.translate(BATCH_DELIMITER.join(cleaned)) or ""
+        parts = [part.strip() for part in translated.split(BATCH_DELIMITER)]
+        if len(parts) == len(group):
+            results.extend(parts)
+        else:
+            results.extend(translator.translate(text) for text in group)
+    return results
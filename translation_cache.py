@@ -0,0 +1,202 @@
+"""
+Translation Cache Module
+Memoizes translations of repeated lines (LRU + optional TTL, persisted to JSON)
+"""
+import json
+import os
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+from config import Config
+
+
+class TranslationCache:
+    """
+    Translations keyed on normalized source text
+
+    Normalization folds width variants (NFKC), case, whitespace and
+    punctuation, so "你好！" and "你好 !" share one entry.
+    """
+
+    def __init__(self, path=None, max_entries=5000, ttl=None, save_every=20):
+        """
+        Args:
+            path: JSON file the cache is loaded from / saved to (None = memory only)
+            max_entries: LRU capacity
+            ttl: Seconds an entry stays valid (None = forever)
+            save_every: Save automatically after this many new entries
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.save_every = save_every
+        self.lock = threading.Lock()
+
+        self._entries = OrderedDict()  # key -> (translation, created_at)
+        self._unsaved = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+        if self.path:
+            self.load()
+
+    @staticmethod
+    def normalize(text):
+        """Fold width, case, whitespace and punctuation"""
+        text = unicodedata.normalize('NFKC', text or '').lower()
+        return "".join(
+            ch for ch in text
+            if not ch.isspace() and not unicodedata.category(ch).startswith('P')
+        )
+
+    def get(self, text):
+        """
+        Returns:
+            str or None: Cached translation
+        """
+        key = self.normalize(text)
+        with self.lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.time() - entry[1] > self.ttl:
+                del self._entries[key]
+                self.expired += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, text, translation):
+        key = self.normalize(text)
+        if not key or not translation:
+            return
+        with self.lock:
+            self._entries[key] = (translation, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            self._unsaved += 1
+            should_save = self.path and self._unsaved >= self.save_every
+        if should_save:
+            self.save()
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'expired': self.expired,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+    def load(self):
+        """Load entries from `path` (missing, corrupt or wrongly shaped files start empty)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            entries = []
+            for key, (translation, created_at) in data['entries']:
+                if not isinstance(key, str) or not isinstance(translation, str):
+                    raise ValueError("bad cache entry")
+                entries.append((key, translation, float(created_at)))
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return
+
+        now = time.time()
+        with self.lock:
+            for key, translation, created_at in entries:
+                if self.ttl is not None and now - created_at > self.ttl:
+                    continue
+                self._entries[key] = (translation, created_at)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def save(self):
+        """Write entries (LRU order) to `path` atomically"""
+        if not self.path:
+            return
+        with self.lock:
+            data = {'entries': [[key, list(value)] for key, value in self._entries.items()]}
+            self._unsaved = 0
+
+        temp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass
+
+
+class CachedTranslator:
+    """Drop-in wrapper around a TranslatorBackend: answers from the cache before calling it"""
+
+    def __init__(self, translator, cache, namespace=''):
+        """
+        Args:
+            translator: TranslatorBackend
+            cache: TranslationCache (may be shared by several translators)
+            namespace: Key prefix keeping language pairs apart in a shared cache
+        """
+        self.translator = translator
+        self.cache = cache
+        self.namespace = namespace
+
+    def _key(self, text):
+        return f"{self.namespace}{text}" if self.namespace else text
+
+    def translate(self, text):
+        translated = self.cache.get(self._key(text))
+        if translated is not None:
+            return translated
+
+        translated = self.translator.translate(text)
+        if translated:
+            self.cache.put(self._key(text), translated)
+        return translated
+
+    def translate_batch(self, texts):
+        """Translate several lines; only cache misses are sent (as one batch)"""
+        results = [self.cache.get(self._key(text)) for text in texts]
+
+        misses = []
+        for text, translated in zip(texts, results):
+            if translated is None and text not in misses:
+                misses.append(text)
+
+        if misses:
+            fresh = dict(zip(misses, self.translator.translate_batch(misses)))
+            for text, translated in fresh.items():
+                if translated:
+                    self.cache.put(self._key(text), translated)
+            results = [fresh.get(text) if translated is None else translated
+                       for text, translated in zip(texts, results)]
+        return results
+
+    def stats(self):
+        return self.cache.stats()
+
+    def save(self):
+        self.cache.save()
+
+
+def default_translation_cache():
+    """TranslationCache configured from Config.CACHE"""
+    ttl_hours = Config.CACHE['translation_ttl_hours']
+    return TranslationCache(
+        path=os.path.join(Config.CACHE['dir'], Config.CACHE['translation_file']),
+        max_entries=Config.CACHE['translation_max_entries'],
+        ttl=ttl_hours * 3600 if ttl_hours else None
+    )
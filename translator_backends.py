@@ -0,0 +1,154 @@
+"""
+Translator Backends Module
+Common interface over online (Google) and offline (local CTranslate2 MT) translation
+"""
+import os
+from abc import ABC, abstractmethod
+
+from config import Config
+from translation_batcher import translate_batch as joined_translate_batch
+
+try:
+    import ctranslate2
+    import sentencepiece
+except ImportError:  # Offline MT is optional
+    ctranslate2 = None
+    sentencepiece = None
+
+
+class TranslatorBackend(ABC):
+    """Interface every translation backend implements"""
+
+    name = "base"
+
+    @abstractmethod
+    def translate(self, text):
+        """Translate one line"""
+
+    def translate_batch(self, texts):
+        """Translate several lines (default: one joined request)"""
+        return joined_translate_batch(self, texts)
+
+
+class GoogleBackend(TranslatorBackend):
+    """Google Translate through deep_translator (network)"""
+
+    name = "Google Translate"
+
+    def __init__(self, source='zh-CN', target='vi'):
+        try:
+            from deep_translator import GoogleTranslator
+        except ImportError:
+            raise RuntimeError("Google Translate needs: pip install deep-translator")
+        self.translator = GoogleTranslator(source=source, target=target)
+
+    def translate(self, text):
+        return self.translator.translate(text)
+
+
+class LocalMTBackend(TranslatorBackend):
+    """
+    On-CPU machine translation with a CTranslate2-converted model
+
+    Works with MarianMT (source.spm / target.spm) and NLLB / M2M
+    (sentencepiece.bpe.model + language prefix tokens) conversions, e.g.:
+        ct2-transformers-converter --model Helsinki-NLP/opus-mt-zh-vi \\
+            --output_dir opus-mt-zh-vi --quantization int8 --copy_files source.spm target.spm
+    """
+
+    name = "Local MT"
+
+    def __init__(self, model_dir, device='cpu', compute_type='int8', beam_size=2,
+                 source_prefix=None, target_prefix=None, threads=0):
+        """
+        Args:
+            model_dir: Directory of the converted model and its sentencepiece files
+            device: 'cpu' or 'cuda'
+            compute_type: CTranslate2 compute type ('int8' is fastest on CPU)
+            beam_size: Beam width (1 = greedy)
+            source_prefix: Source language token for multilingual models (e.g. 'zho_Hans')
+            target_prefix: Target language token for multilingual models (e.g. 'vie_Latn')
+            threads: intra_threads for CTranslate2 (0 = library default)
+        """
+        if ctranslate2 is None:
+            raise RuntimeError("Local MT needs: pip install ctranslate2 sentencepiece")
+        if not os.path.isdir(model_dir):
+            raise RuntimeError(f"Local MT model not found: {model_dir}")
+
+        self.translator = ctranslate2.Translator(
+            model_dir, device=device, compute_type=compute_type, intra_threads=threads
+        )
+        self.beam_size = beam_size
+        self.source_prefix = source_prefix
+        self.target_prefix = target_prefix
+
+        shared = os.path.join(model_dir, 'sentencepiece.bpe.model')
+        if os.path.exists(shared):
+            self.source_sp = self.target_sp = sentencepiece.SentencePieceProcessor(model_file=shared)
+        else:
+            self.source_sp = sentencepiece.SentencePieceProcessor(model_file=os.path.join(model_dir, 'source.spm'))
+            self.target_sp = sentencepiece.SentencePieceProcessor(model_file=os.path.join(model_dir, 'target.spm'))
+
+    def translate(self, text):
+        return self.translate_batch([text])[0]
+
+    def translate_batch(self, texts):
+        """Native batched decoding (one forward pass for the whole batch)"""
+        if not texts:
+            return []
+
+        batch = []
+        for text in texts:
+            tokens = self.source_sp.encode(text, out_type=str) + ["</s>"]
+            if self.source_prefix:
+                tokens = [self.source_prefix] + tokens
+            batch.append(tokens)
+
+        results = self.translator.translate_batch(
+            batch,
+            beam_size=self.beam_size,
+            max_decoding_length=256,
+            target_prefix=[[self.target_prefix]] * len(batch) if self.target_prefix else None
+        )
+
+        translations = []
+        for result in results:
+            tokens = result.hypotheses[0]
+            if self.target_prefix and tokens and tokens[0] == self.target_prefix:
+                tokens = tokens[1:]
+            translations.append(self.target_sp.decode(tokens))
+        return translations
+
+
+def create_translator(settings=None, pivot=False):
+    """
+    Build the translation backend selected in settings ('translator_backend')
+
+    Args:
+        settings: Settings dict
+        pivot: Build the English -> Vietnamese hop used after Whisper's translate task
+
+    Returns:
+        TranslatorBackend
+    """
+    settings = settings or {}
+    backend = settings.get('translator_backend', Config.DEFAULTS['translator_backend'])
+
+    if backend == 'local':
+        local = Config.LOCAL_MT
+        if pivot:
+            return LocalMTBackend(
+                settings.get('local_mt_pivot_model_dir', local['pivot_model_dir']),
+                device=local['device'],
+                compute_type=local['compute_type'],
+                beam_size=local['beam_size']
+            )
+        return LocalMTBackend(
+            settings.get('local_mt_model_dir', local['model_dir']),
+            device=local['device'],
+            compute_type=local['compute_type'],
+            beam_size=local['beam_size'],
+            source_prefix=local['source_prefix'],
+            target_prefix=local['target_prefix']
+        )
+    return GoogleBackend(source='en' if pivot else 'zh-CN', target='vi')
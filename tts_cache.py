@@ -0,0 +1,193 @@
+"""
+TTS Cache Module
+Content-addressed cache of synthesized audio (memory LRU + disk store)
+"""
+import hashlib
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+
+
+class TTSCache:
+    """
+    Encoded audio keyed by (engine mode, voice, rate, normalized text)
+
+    Recent entries live in a size-bounded in-memory LRU; every entry is also
+    written to `cache_dir` so repeated lines survive restarts. Disk hits are
+    promoted back into memory.
+    """
+
+    WHITESPACE_PATTERN = re.compile(r'\s+')
+
+    def __init__(self, cache_dir=None, max_memory_bytes=32 * 1024 * 1024, max_disk_bytes=256 * 1024 * 1024):
+        """
+        Args:
+            cache_dir: Directory for the persistent store (None = memory only)
+            max_memory_bytes: Budget of the in-memory LRU
+            max_disk_bytes: Budget of the disk store (oldest files are pruned)
+        """
+        self.cache_dir = cache_dir
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.lock = threading.Lock()
+
+        self._memory = OrderedDict()  # key -> bytes
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+            self._prune_disk()
+
+    @classmethod
+    def normalize_text(cls, text):
+        """Unicode NFC + folded whitespace (same spoken line -> same key)"""
+        text = unicodedata.normalize('NFC', text or '')
+        return cls.WHITESPACE_PATTERN.sub(' ', text).strip()
+
+    @classmethod
+    def make_key(cls, mode, voice, rate, text):
+        """Content address for one synthesized line"""
+        raw = "\x1f".join((str(mode), str(voice), str(rate), cls.normalize_text(text)))
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """
+        Look up encoded audio
+
+        Returns:
+            bytes or None
+        """
+        with self.lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return data
+
+        data = self._read_disk(key)
+        with self.lock:
+            if data is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._store_memory(key, data)
+        return data
+
+    def put(self, key, data):
+        """Store encoded audio in memory and on disk"""
+        if not data:
+            return
+        with self.lock:
+            self._store_memory(key, data)
+        self._write_disk(key, data)
+
+    def stats(self):
+        """Hit/miss/eviction counters"""
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'memory_entries': len(self._memory),
+                'memory_bytes': self._memory_bytes,
+                'disk_bytes': self._disk_bytes
+            }
+
+    # --- Memory LRU (caller holds the lock) ---
+
+    def _store_memory(self, key, data):
+        if len(data) > self.max_memory_bytes:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= len(old)
+        self._memory[key] = data
+        self._memory_bytes += len(data)
+
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self.evictions += 1
+
+    # --- Disk store ---
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.audio")
+
+    def _read_disk(self, key):
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)  # Keep recently used files out of pruning
+            return data
+        except OSError:
+            return None
+
+    def _write_disk(self, key, data):
+        if not self.cache_dir:
+            return
+        path = self._path(key)
+        if os.path.exists(path):
+            return
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            return
+
+        with self.lock:
+            self._disk_bytes += len(data)
+            over_budget = self._disk_bytes > self.max_disk_bytes
+        if over_budget:
+            self._prune_disk()
+
+    def _disk_entries(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.audio'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue
+            entries.append((name, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _prune_disk(self):
+        """Delete least recently used files until the disk store fits its budget"""
+        entries = sorted(self._disk_entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        for name, size, _ in entries:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.unlink(os.path.join(self.cache_dir, name))
+                total -= size
+                with self.lock:
+                    self.evictions += 1
+            except OSError:
+                pass
+        with self.lock:
+            self._disk_bytes = total
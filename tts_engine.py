@@ -4,23 +4,44 @@ TTS Engine - OPTIMIZED VERSION
 - Normalize punctuation: . ! ? ; : → ,
 - OPTIMIZED: Cache regex, faster processing
 - Added generate_audio for gapless playback
+- Edge/gTTS synthesis and playback stay in memory (no temp files)
+- Streaming Edge playback: speak from the first audio chunk
+- Content-addressed audio cache for repeated lines
+- Event-driven playback completion (no get_busy polling)
+- Optional PCM backend: persistent PortAudio output stream
+- pyttsx3: one long-lived engine thread instead of init() per sentence
 """
-import pyttsx3
 from gtts import gTTS
 import edge_tts
-import asyncio
 import pygame
-import tempfile
 import os
+import io
 import time
 import threading
+import queue
 import re
 
+from async_loop import AsyncLoopThread
+from pyttsx3_worker import Pyttsx3Worker
+from playback import PygamePlayback, create_playback
+from streaming_player import StreamingPlayer
+from tts_cache import TTSCache
+from config import Config
+
 class TTSEngine:
     # Compile regex once (faster!)
     PUNCT_PATTERN = re.compile(r'[.!?;:]')
     COMMA_PATTERN = re.compile(r',+')
     
+    # Max seconds to wait for one Edge TTS request
+    EDGE_TIMEOUT = 30
+    
+    # Max seconds to wait for one pyttsx3 line (rendered or spoken)
+    PYTTSX3_TIMEOUT = 30
+    
+    # Seconds past a line's length before playback counts as stalled
+    PLAYBACK_STALL_MARGIN = 2.0
+    
     def __init__(self, mode='edge', ui=None, settings=None):
         """Initialize TTS Engine"""
         self.mode = mode
@@ -28,6 +49,20 @@ class TTSEngine:
         self.settings = settings or {}
         self.lock = threading.Lock()
         self.is_playing = False
+        self.async_loop = None  # Persistent event loop for Edge TTS
+        self.closed = False     # Set by shutdown(); guards async_loop
+        self.pyttsx3_worker = None  # Long-lived pyttsx3 engine thread
+        self.streaming = self.settings.get('tts_streaming', Config.DEFAULTS['tts_streaming'])
+        self.last_ttfa_ms = None  # Time-to-first-audio of the last streamed sentence
+        
+        # Audio cache: repeated lines skip synthesis entirely
+        self.cache = None
+        if self.settings.get('tts_cache', Config.DEFAULTS['tts_cache']):
+            self.cache = TTSCache(
+                cache_dir=os.path.join(Config.CACHE['dir'], 'tts'),
+                max_memory_bytes=Config.CACHE['tts_memory_mb'] * 1024 * 1024,
+                max_disk_bytes=Config.CACHE['tts_disk_mb'] * 1024 * 1024
+            )
         
         # Padding: 1 từ "ừ"
         self.padding_words = self.settings.get('padding_words', 1)
@@ -41,6 +76,8 @@ class TTSEngine:
         
         # Always initialize mixer for playback (even for pyttsx3)
         self._ensure_mixer_init()
+        self.player, warning = create_playback(self.settings)
+        if warning and self.ui: self.ui.log(f"⚠️ Playback: {warning}", 'warning')
         
         if mode == 'edge':
             self._init_edge_tts()
@@ -63,6 +100,11 @@ class TTSEngine:
         self.edge_voice_male = "vi-VN-NamMinhNeural"
         self.edge_voice_female = "vi-VN-HoaiMyNeural"
         
+        # One long-lived loop instead of asyncio.run() per sentence.
+        # edge_tts opens its own websocket per Communicate (the session closes
+        # its connector), so the loop is what can be reused across requests.
+        self.async_loop = AsyncLoopThread(name='edge-tts-loop')
+        
         if self.ui:
             self.ui.log("✅ Edge TTS initialized", 'info')
             self.ui.log(f"   🔧 Padding: {self.padding_words} x '{self.padding_word}'", 'info')
@@ -73,7 +115,8 @@ class TTSEngine:
             self.ui.log("✅ Google TTS initialized", 'info')
     
     def _init_pyttsx3(self):
-        """Initialize pyttsx3 settings (Engine init is delayed)"""
+        """Start the pyttsx3 worker (engine and voice are set up once, off this thread)"""
+        self.pyttsx3_worker = Pyttsx3Worker(self.settings.get('tts_speed', 150), self.ui)
         if self.ui:
             self.ui.log("✅ pyttsx3 (Offline) mode selected", 'info')
 
@@ -101,23 +144,24 @@ class TTSEngine:
         text = self.COMMA_PATTERN.sub(',', text)
         return text.strip(',').strip()
 
-    def generate_audio(self, text, gender='female'):
+    def generate_audio(self, text, gender='female', padding=None):
         """
         Generate audio bytes for the given text
         Smart Padding: Only add padding if silence > 2s
+        
+        Args:
+            padding: None = decide from time since the last call,
+                     True/False = caller knows (TTSPipeline synthesizes ahead of playback)
         """
         if not text:
             return None
             
-        # Check time since last playback
-        current_time = time.time()
-        time_since_last = current_time - self.last_playback_time
-        
-        # Determine if we need padding
-        need_padding = time_since_last > 2.0
-        
-        # Update last playback time
-        self.last_playback_time = current_time
+        # Determine if we need padding (explicit padding leaves the automatic clock alone)
+        need_padding = padding
+        if padding is None:
+            current_time = time.time()
+            need_padding = current_time - self.last_playback_time > 2.0
+            self.last_playback_time = current_time
         
         # Prepare text (handle word padding here)
         final_text = text
@@ -129,193 +173,233 @@ class TTSEngine:
             if self.ui: self.ui.log(f"➕ Smart Padding: '{padding}'", 'info')
 
         try:
+            # Cached line: no synthesis round trip
+            cache_key = self._cache_key(final_text, gender)
+            audio_data = self.cache.get(cache_key) if self.cache else None
+            if audio_data:
+                if self.ui: self.ui.log("💾 TTS cache hit", 'info')
+                return [audio_data]
+            
             # Generate main audio
-            audio_data = None
             if self.mode == 'edge':
                 audio_data = self._generate_edge_audio(final_text, gender)
             elif self.mode == 'gtts':
                 audio_data = self._generate_gtts_audio(final_text)
             else:
-                audio_data = self._generate_pyttsx3_audio(final_text)
+                audio_data = self._generate_pyttsx3_audio(final_text, gender)
             
             if not audio_data:
                 return None
+            
+            if self.cache:
+                self.cache.put(cache_key, audio_data)
 
             # Return list for compatibility with voicetrans.py
             return [audio_data]
             
         except Exception as e:
-            if self.ui:
+            if self.ui and not self.closed:
                 self.ui.log(f"❌ Audio generation error: {str(e)}", 'error')
             return None
 
-    def _generate_edge_audio(self, text, gender):
-        """Generate audio bytes using Edge TTS"""
+    def _cache_key(self, text, gender):
+        """Cache key for a line in the current mode/voice/rate"""
+        if self.mode == 'edge':
+            voice = self._edge_voice_and_rate(gender)[0]
+        elif self.mode == 'gtts':
+            voice = 'vi'
+        else:
+            voice = self.pyttsx3_worker.voice_for(gender) or 'pyttsx3'
+        return TTSCache.make_key(self.mode, voice, self.settings.get('tts_speed', 150), text)
+
+    def _edge_voice_and_rate(self, gender):
+        """Edge voice name and rate string for the current settings"""
         voice = self.edge_voice_male if gender == 'male' else self.edge_voice_female
         
         speed = self.settings.get('tts_speed', 150)
         rate_str = f"{'+' if speed >= 100 else ''}{speed - 100}%"
-        
-        temp_file = os.path.join(tempfile.gettempdir(), f"tts_{int(time.time()*1000)}.mp3")
+        return voice, rate_str
+
+    def _edge_loop(self):
+        """The Edge TTS event loop (raises once shutdown() has started)"""
+        with self.lock:
+            if self.closed or self.async_loop is None:
+                raise RuntimeError("TTS engine is shut down")
+            return self.async_loop
+
+    def _generate_edge_audio(self, text, gender):
+        """Generate audio bytes using Edge TTS"""
+        voice, rate_str = self._edge_voice_and_rate(gender)
         
         async def generate():
+            # Collect audio chunks in memory (no temp file round trip)
             communicate = edge_tts.Communicate(text, voice, rate=rate_str)
-            await communicate.save(temp_file)
+            audio = bytearray()
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    audio.extend(chunk["data"])
+            return bytes(audio)
         
-        try:
-            asyncio.run(generate())
-            
-            with open(temp_file, 'rb') as f:
-                audio_data = f.read()
-                
-            try:
-                os.unlink(temp_file)
-            except:
-                pass
-                
-            return audio_data
-        except Exception as e:
-            raise e
+        return self._edge_loop().run(generate(), timeout=self.EDGE_TIMEOUT)
 
     def _generate_gtts_audio(self, text):
-        """Generate audio bytes using gTTS"""
+        """Generate audio bytes using gTTS (in memory)"""
         tts = gTTS(text=text, lang='vi')
         
-        temp_file = os.path.join(tempfile.gettempdir(), f"gtts_{int(time.time()*1000)}.mp3")
-        tts.save(temp_file)
-        
-        with open(temp_file, 'rb') as f:
-            audio_data = f.read()
-            
-        try:
-            os.unlink(temp_file)
-        except:
-            pass
-            
-        return audio_data
+        buffer = io.BytesIO()
+        tts.write_to_fp(buffer)
+        return buffer.getvalue()
 
-    def _generate_pyttsx3_audio(self, text):
-        """Generate audio bytes using pyttsx3 (Thread-Safe)"""
-        temp_file = os.path.join(tempfile.gettempdir(), f"pyttsx3_{int(time.time()*1000)}.wav")
-        
+    def _generate_pyttsx3_audio(self, text, gender='female'):
+        """Generate WAV bytes on the shared pyttsx3 worker (one engine, voice picked once)"""
         try:
-            # Initialize engine LOCALLY to avoid threading issues
-            engine = pyttsx3.init()
-            engine.setProperty('rate', self.settings.get('tts_speed', 150))
-            engine.setProperty('volume', 1.0)
-            
-            # Select Voice
-            voices = engine.getProperty('voices')
-            selected_voice_id = None
-            for voice in voices:
-                name_lower = voice.name.lower()
-                id_lower = voice.id.lower()
-                if any(x in name_lower or x in id_lower for x in ['vietnam', 'việt', 'viet', 'vi-', 'vivn']):
-                    selected_voice_id = voice.id
-                    break
-            
-            if selected_voice_id:
-                engine.setProperty('voice', selected_voice_id)
-            
-            # Generate
-            engine.save_to_file(text, temp_file)
-            engine.runAndWait()
-            
-            # Read file
-            if os.path.exists(temp_file) and os.path.getsize(temp_file) > 0:
-                with open(temp_file, 'rb') as f:
-                    audio_data = f.read()
-            else:
-                audio_data = None
-                
+            return self.pyttsx3_worker.synthesize(text, gender, timeout=self.PYTTSX3_TIMEOUT)
         except Exception as e:
             if self.ui: self.ui.log(f"⚠️ pyttsx3 Error: {e}", 'warning')
-            audio_data = None
-        finally:
-            # Cleanup temp file
-            try:
-                if os.path.exists(temp_file):
-                    os.unlink(temp_file)
-            except:
-                pass
-            
-        return audio_data
+            return None
 
-    def speak(self, text, gender='female'):
+    def speak(self, text, gender='female', padding=None):
         """
         Direct Speak Method (For Thread 3)
         Handles both generation and playback synchronously.
+        
+        Args:
+            padding: None = decide from time since the last line,
+                     True/False = caller knows (TTSPipeline tracks real playback gaps)
         """
         if not text: return
 
         # Smart Padding (Simple)
         current_time = time.time()
-        if current_time - self.last_playback_time > 2.0:
+        if padding is None:
+            padding = current_time - self.last_playback_time > 2.0
+            self.last_playback_time = current_time
+        if padding:
              padding = self.padding_word if self.padding_word else ""
              if padding:
                  text = f"{padding} {text}"
                  if self.ui: self.ui.log(f"➕ Padding: '{padding}'", 'info')
-        self.last_playback_time = current_time
 
         try:
             if self.mode == 'pyttsx3':
-                self._speak_pyttsx3(text)
+                self._speak_pyttsx3(text, gender)
+            elif self.mode == 'edge' and self.streaming:
+                self._speak_edge_streaming(text, gender)
             else:
                 # Edge / gTTS (File based)
-                audio_data = self.generate_audio(text, gender)
+                audio_data = self.generate_audio(text, gender, padding=False)
                 if audio_data:
                     # generate_audio returns list, take first item
                     data = audio_data[0] if isinstance(audio_data, list) else audio_data
                     self._play_with_pygame(data)
         except Exception as e:
-            if self.ui: self.ui.log(f"❌ Speak Error: {e}", 'error')
+            if self.ui and not self.closed: self.ui.log(f"❌ Speak Error: {e}", 'error')
 
-    def _speak_pyttsx3(self, text):
-        """Direct speak using pyttsx3 (No temp files)"""
+    def _speak_edge_streaming(self, text, gender):
+        """Play Edge TTS audio while it is still being synthesized"""
+        cache_key = self._cache_key(text, gender) if self.cache else None
+        cached = self.cache.get(cache_key) if self.cache else None
+        if cached:
+            if self.ui: self.ui.log("💾 TTS cache hit", 'info')
+            self._play_with_pygame(cached)
+            return
+        
+        voice, rate_str = self._edge_voice_and_rate(gender)
+        chunks = queue.Queue()
+        
+        async def produce():
+            try:
+                communicate = edge_tts.Communicate(text, voice, rate=rate_str)
+                async for chunk in communicate.stream():
+                    if chunk["type"] == "audio":
+                        chunks.put(chunk["data"])
+            finally:
+                chunks.put(None)
+        
+        start = time.perf_counter()
+        future = self._edge_loop().submit(produce())
+        player = StreamingPlayer(
+            first_segment_ms=Config.TTS_STREAMING['first_segment_ms'],
+            segment_ms=Config.TTS_STREAMING['segment_ms']
+        )
+        
         try:
-            engine = pyttsx3.init()
-            engine.setProperty('rate', self.settings.get('tts_speed', 150))
-            engine.setProperty('volume', 1.0)
-            
-            # Select Voice
-            voices = engine.getProperty('voices')
-            for voice in voices:
-                if 'viet' in voice.name.lower() or 'vivn' in voice.id.lower():
-                    engine.setProperty('voice', voice.id)
+            while True:
+                data = chunks.get(timeout=self.EDGE_TIMEOUT)
+                if data is None:
                     break
-            
-            engine.say(text)
-            engine.runAndWait()
+                player.feed(data)
+            future.result()  # Re-raise synthesis errors
+        except Exception:
+            future.cancel()
+            player.stop()
+            raise
+        
+        player.flush()
+        synth_ms = (time.perf_counter() - start) * 1000
+        if player.first_audio_time is not None:
+            self.last_ttfa_ms = (player.first_audio_time - start) * 1000
+            if self.ui: self.ui.log(f"⚡ First audio in {self.last_ttfa_ms:.0f}ms (synthesis {synth_ms:.0f}ms)", 'info')
+        
+        if self.cache:
+            self.cache.put(cache_key, player.data)
+        
+        player.wait()
+
+    def _speak_pyttsx3(self, text, gender='female'):
+        """Direct speak using pyttsx3 (No temp files)"""
+        try:
+            self.pyttsx3_worker.speak(text, gender, timeout=self.PYTTSX3_TIMEOUT)
         except Exception as e:
             if self.ui: self.ui.log(f"⚠️ pyttsx3 Error: {e}", 'warning')
 
     def _play_with_pygame(self, audio_data):
-        """Simple Pygame Playback"""
+        """Simple Pygame Playback (from memory, no temp file)"""
         self._ensure_mixer_init()
         try:
-            # Detect format
-            ext = ".wav" if audio_data[:4] == b'RIFF' else ".mp3"
-            temp_file = os.path.join(tempfile.gettempdir(), f"play_{int(time.time()*1000)}_{threading.get_ident()}{ext}")
-            
-            with open(temp_file, 'wb') as f:
-                f.write(audio_data)
-            
-            pygame.mixer.music.load(temp_file)
-            pygame.mixer.music.play()
-            
-            # Wait for playback to finish (Blocking)
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.1)
-                
-            try:
-                os.unlink(temp_file)
-            except:
-                pass
+            # Returns as soon as the line ends (no get_busy polling)
+            handle = self.player.play(audio_data)
+            if not handle.wait(handle.duration + self.PLAYBACK_STALL_MARGIN):
+                # Output stream stopped calling back (device error/unplugged): replay on pygame
+                handle.stop()
+                if isinstance(self.player, PygamePlayback):
+                    return
+                if self.ui: self.ui.log("⚠️ Playback stalled, switching to pygame output", 'warning')
+                try:
+                    self.player.close()
+                except Exception:
+                    pass
+                self.player = PygamePlayback()
+                self.player.play(audio_data).wait(handle.duration + self.PLAYBACK_STALL_MARGIN)
         except Exception as e:
             if self.ui: self.ui.log(f"❌ Pygame Error: {e}", 'error')
 
-    # Remove old complex playback methods
+    def shutdown(self):
+        """Release background resources (Edge TTS event loop, output stream)"""
+        self.player.close()
+        if self.pyttsx3_worker:
+            self.pyttsx3_worker.shutdown()
+        with self.lock:
+            self.closed = True
+            loop, self.async_loop = self.async_loop, None
+        if loop:
+            # In-flight Edge requests are cancelled; later ones fail fast in _edge_loop()
+            loop.stop()
+        if self.cache and self.ui:
+            stats = self.cache.stats()
+            self.ui.log(f"💾 TTS cache: {stats['hits']} hits / {stats['misses']} misses "
+                        f"({stats['hit_rate']*100:.0f}%), {stats['evictions']} evictions", 'info')
+
+    def prepare_audio(self, audio_data):
+        """Decode bytes from generate_audio ahead of playback (safe off the playback thread)"""
+        self._ensure_mixer_init()
+        return self.player.prepare(audio_data)
+
     def play_audio_data(self, audio_data):
-        pass
+        """Play bytes or a prepare_audio() result (blocking), used by TTSPipeline"""
+        if audio_data:
+            self._play_with_pygame(audio_data)
+
+    # Remove old complex playback methods
     def cleanup_files(self):
         pass
@@ -0,0 +1,147 @@
+"""
+TTS Pipeline Module
+Synthesize upcoming lines while the current one is playing (gapless output)
+"""
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config import Config
+
+
+class TTSPipeline:
+    """
+    Two-stage output: synthesis worker pool -> single playback worker
+
+    submit() starts synthesizing a line right away in the pool and queues
+    it for playback in order; the playback worker plays the lines back to
+    back, so line N+1 is usually ready the moment line N ends. A line that
+    arrives while nothing is playing or queued is handed to speak() instead,
+    which keeps the Edge streaming path (first audio before synthesis ends).
+    Padding is decided here for both paths, from the real playback gap.
+    """
+
+    # Seconds of silence after which a line gets the padding word again
+    PADDING_GAP = 2.0
+
+    def __init__(self, tts_engine, ui=None, workers=2, lookahead=4):
+        """
+        Args:
+            tts_engine: TTSEngine used for synthesis and playback
+            ui: UI for logging
+            workers: Synthesis threads (lines synthesized concurrently)
+            lookahead: Max lines waiting for playback (submit blocks beyond it)
+        """
+        self.tts_engine = tts_engine
+        self.ui = ui
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='tts-synth')
+        self.playback_queue = queue.Queue(maxsize=lookahead)
+        self.lock = threading.Lock()
+
+        self.is_running = True
+        self._pending = 0             # Lines queued or playing
+        self._last_end = 0.0          # When the last line finished playing
+        self.gaps = []                # Silence between consecutive lines (seconds)
+
+        self.thread = threading.Thread(target=self._playback_loop, daemon=True, name='tts-playback')
+        self.thread.start()
+
+    @classmethod
+    def for_engine(cls, tts_engine, ui=None):
+        """Pipeline configured from Config.TTS_PIPELINE (pyttsx3 gets a single synthesis worker)"""
+        settings = Config.TTS_PIPELINE
+        workers = 1 if tts_engine.mode == 'pyttsx3' else settings['workers']
+        return cls(tts_engine, ui, workers=workers, lookahead=settings['lookahead'])
+
+    def submit(self, text, gender='female'):
+        """Queue a line for playback, starting its synthesis immediately"""
+        if not text or not self.is_running:
+            return
+
+        with self.lock:
+            idle = self._pending == 0
+            self._pending += 1
+            padding = idle and time.time() - self._last_end > self.PADDING_GAP
+
+        if idle and self.tts_engine.streaming and self.tts_engine.mode == 'edge':
+            # Nothing to overlap with: stream it
+            future = None
+        else:
+            try:
+                future = self.executor.submit(self._synthesize, text, gender, padding)
+            except RuntimeError:  # shutdown() raced this submit (is_running is already False)
+                future = None
+
+        if not self._enqueue((text, gender, padding, future)):
+            if future:
+                future.cancel()
+            with self.lock:
+                self._pending -= 1
+
+    def _enqueue(self, item):
+        """Wait for room in the playback queue, giving up once the pipeline shuts down"""
+        while self.is_running:
+            try:
+                self.playback_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _synthesize(self, text, gender, padding):
+        """Synthesis worker: bytes -> decoded audio, so playback starts without a decode step"""
+        audio_data = self.tts_engine.generate_audio(text, gender, padding)
+        return self.tts_engine.prepare_audio(audio_data[0]) if audio_data else None
+
+    def shutdown(self):
+        """Stop playback and drop queued lines"""
+        self.is_running = False
+        while True:
+            try:
+                future = self.playback_queue.get_nowait()[3]
+            except queue.Empty:
+                break
+            if future:
+                future.cancel()
+        try:
+            # A submit() that passed the is_running check may have refilled the queue;
+            # the playback loop then exits on is_running after its next item
+            self.playback_queue.put_nowait(None)
+        except queue.Full:
+            pass
+        self.executor.shutdown(wait=False)
+
+        if self.gaps and self.ui:
+            self.ui.log(f"🎶 Gap between lines: avg {sum(self.gaps) / len(self.gaps) * 1000:.0f}ms "
+                        f"over {len(self.gaps)} back-to-back lines", 'info')
+
+    def _playback_loop(self):
+        while self.is_running:
+            item = self.playback_queue.get()
+            if item is None or not self.is_running:
+                break
+            text, gender, padding, future = item
+
+            try:
+                if future is None:
+                    if self.ui: self.ui.log(f"▶️ Speaking: {text[:20]}...", 'info')
+                    self.tts_engine.speak(text, gender, padding=padding)
+                else:
+                    audio = future.result()
+                    if audio:
+                        self._record_gap()
+                        if self.ui: self.ui.log(f"▶️ Speaking: {text[:20]}...", 'info')
+                        self.tts_engine.play_audio_data(audio)
+            except Exception as e:
+                if self.ui: self.ui.log(f"❌ Playback Error: {e}", 'error')
+            finally:
+                with self.lock:
+                    self._pending -= 1
+                    self._last_end = time.time()
+
+    def _record_gap(self):
+        """Silence since the previous line ended (only when lines were queued back to back)"""
+        with self.lock:
+            if self._last_end and time.time() - self._last_end < self.PADDING_GAP:
+                self.gaps.append(time.time() - self._last_end)
@@ -0,0 +1,286 @@
+"""
+Voice Activity Detection Module
+Per-chunk speech gate for the capture loop (adaptive energy gate + optional Silero VAD)
+"""
+import os
+
+import numpy as np
+
+from config import Config
+
+try:
+    import onnxruntime
+except ImportError:  # Neural VAD is optional
+    onnxruntime = None
+
+
+class EnergyVAD:
+    """
+    Energy gate with an adaptive noise floor
+
+    The floor follows quiet chunks down quickly and drifts up slowly, so a
+    steady music bed or ambience raises it within seconds and stops counting
+    as speech. While speech is active the floor does not rise (for up to
+    `floor_freeze_s`), so a long line or speech over music is not absorbed
+    into it mid-sentence. A chunk must also carry enough of its energy in
+    the speech band (rejects rumble from explosions and engines).
+    """
+
+    def __init__(self, sample_rate=16000, margin_db=8.0, min_level_db=-50.0,
+                 floor_rise_s=4.0, floor_fall_s=0.1, min_speech_band_ratio=0.3,
+                 floor_freeze_s=4.0):
+        """
+        Args:
+            sample_rate: Sample rate of the chunks
+            margin_db: How far above the noise floor a chunk must be
+            min_level_db: Absolute level (dBFS) below which a chunk is always silence
+            floor_rise_s: Time constant of the floor rising towards louder audio
+            floor_fall_s: Time constant of the floor falling towards quieter audio
+            min_speech_band_ratio: Minimum share of energy in 250-4000 Hz
+            floor_freeze_s: Longest continuous speech the floor stays frozen for
+                            (longer "speech" is treated as a steady background)
+        """
+        self.sample_rate = sample_rate
+        self.margin_db = margin_db
+        self.min_level_db = min_level_db
+        self.floor_rise_s = floor_rise_s
+        self.floor_fall_s = floor_fall_s
+        self.min_speech_band_ratio = min_speech_band_ratio
+        self.floor_freeze_s = floor_freeze_s
+        self.reset()
+
+    def reset(self):
+        self.floor_db = self.min_level_db
+        self.level_db = -120.0
+        self.speech_run_s = 0.0  # Continuous active speech so far
+
+    def is_speech(self, chunk, speech_active=False):
+        """
+        Args:
+            chunk: Mono float32 audio at `sample_rate`
+            speech_active: The caller's speech state before this chunk (freezes the floor)
+
+        Returns:
+            bool: True if the chunk is loud enough above the floor and speech-band heavy
+        """
+        if not len(chunk):
+            return False
+        self.level_db = 10 * np.log10(np.mean(np.square(chunk, dtype=np.float64)) + 1e-12)
+
+        # Exponential floor tracking in dB (fast down, slow up; no rise during speech)
+        seconds = len(chunk) / self.sample_rate
+        self.speech_run_s = self.speech_run_s + seconds if speech_active else 0.0
+        rising = self.level_db >= self.floor_db
+        if not (rising and speech_active and self.speech_run_s <= self.floor_freeze_s):
+            tau = self.floor_rise_s if rising else self.floor_fall_s
+            alpha = 1.0 - np.exp(-seconds / tau)
+            self.floor_db = max(self.floor_db + alpha * (self.level_db - self.floor_db), self.min_level_db)
+
+        if self.level_db < max(self.floor_db + self.margin_db, self.min_level_db):
+            return False
+        return self._speech_band_ratio(chunk) >= self.min_speech_band_ratio
+
+    def _speech_band_ratio(self, chunk):
+        spectrum = np.abs(np.fft.rfft(chunk)) ** 2
+        freqs = np.fft.rfftfreq(len(chunk), 1.0 / self.sample_rate)
+        total = spectrum.sum()
+        if total <= 0:
+            return 0.0
+        return spectrum[(freqs >= 250) & (freqs <= 4000)].sum() / total
+
+
+class SileroVAD:
+    """
+    Silero VAD (v5 ONNX model) on CPU
+
+    Needs 16 kHz audio; chunks of any length are re-framed into the model's
+    512-sample windows. The recurrent state is kept between calls, so the
+    chunks fed between two reset() calls must be contiguous audio.
+    """
+
+    FRAME = 512    # Samples per model window at 16 kHz
+    CONTEXT = 64   # Samples of the previous window prepended to each input
+
+    def __init__(self, model_path, sample_rate=16000):
+        """
+        Args:
+            model_path: Path to silero_vad.onnx (v5)
+            sample_rate: Must be 16000
+        """
+        if onnxruntime is None:
+            raise RuntimeError("Silero VAD needs: pip install onnxruntime")
+        if not os.path.exists(model_path):
+            raise RuntimeError(f"Silero VAD model not found: {model_path}")
+        if sample_rate != 16000:
+            raise ValueError("Silero VAD runs on 16 kHz audio")
+
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = 1
+        options.inter_op_num_threads = 1
+        self.session = onnxruntime.InferenceSession(
+            model_path, sess_options=options, providers=['CPUExecutionProvider']
+        )
+        self.sample_rate = np.array(sample_rate, dtype=np.int64)
+        self.reset()
+
+    def reset(self):
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._context = np.zeros(self.CONTEXT, dtype=np.float32)
+        self._pending = np.zeros(0, dtype=np.float32)
+
+    def probability(self, chunk):
+        """
+        Feed audio and return the speech probability of the newest full window
+
+        Returns:
+            float or None: 0..1, None if this chunk did not complete a window
+        """
+        probability = None
+        self._pending = np.concatenate((self._pending, np.asarray(chunk, dtype=np.float32)))
+        while len(self._pending) >= self.FRAME:
+            frame = self._pending[:self.FRAME]
+            self._pending = self._pending[self.FRAME:]
+
+            inputs = np.concatenate((self._context, frame))[np.newaxis, :]
+            output, self._state = self.session.run(
+                None, {'input': inputs, 'state': self._state, 'sr': self.sample_rate}
+            )
+            self._context = frame[-self.CONTEXT:]
+            probability = float(output[0][0])
+        return probability
+
+
+class VoiceActivityDetector:
+    """
+    Energy gate -> (optional) neural check -> hangover smoothing
+
+    The energy gate rejects silence and steady backgrounds for almost no CPU;
+    only chunks that pass it are scored by the neural model. The model is reset
+    each time the gate reopens so it never stitches separate stretches of audio
+    together, and chunks too short to complete one of its windows reuse the
+    last fresh decision of the current run (none yet = not speech). After speech,
+    `hangover_ms` of following chunks still count as speech so word endings
+    and short gaps are not chopped.
+    """
+
+    def __init__(self, energy, neural=None, threshold=0.5, hangover_ms=200, sample_rate=16000):
+        """
+        Args:
+            energy: EnergyVAD
+            neural: SileroVAD or None (energy only)
+            threshold: Neural speech probability threshold
+            hangover_ms: Speech state held after the last speech chunk
+            sample_rate: Sample rate of the chunks
+        """
+        self.energy = energy
+        self.neural = neural
+        self.threshold = threshold
+        self.hangover_samples = int(hangover_ms * sample_rate / 1000)
+
+        self.chunks = 0
+        self.speech_chunks = 0
+        self.energy_rejects = 0
+        self.neural_rejects = 0
+        self._hangover = 0
+        self._gate_open = False
+        self._neural_speech = None
+
+    @property
+    def name(self):
+        return "Energy + Silero VAD" if self.neural else "Energy VAD"
+
+    def reset(self):
+        """Forget the noise floor and model state (e.g. after a device change)"""
+        self.energy.reset()
+        if self.neural:
+            self.neural.reset()
+        self._hangover = 0
+        self._gate_open = False
+        self._neural_speech = None
+
+    def is_speech(self, chunk):
+        """
+        Args:
+            chunk: Mono float32 audio at the detector's sample rate
+
+        Returns:
+            bool: True while speech (or its hangover) is active
+        """
+        self.chunks += 1
+        speech = self.energy.is_speech(chunk, speech_active=self._hangover > 0)
+        gate_was_open, self._gate_open = self._gate_open, speech
+        if not speech:
+            self.energy_rejects += 1
+        elif self.neural:
+            if not gate_was_open:
+                # New run of gated audio: start the model from a clean state
+                self.neural.reset()
+                self._neural_speech = None
+            probability = self.neural.probability(chunk)
+            if probability is not None:
+                self._neural_speech = probability >= self.threshold
+            if not self._neural_speech:
+                self.neural_rejects += 1
+                speech = False
+
+        if speech:
+            self.speech_chunks += 1
+            self._hangover = self.hangover_samples
+            return True
+        if self._hangover > 0:
+            self._hangover -= len(chunk)
+            return True
+        return False
+
+    def stats(self):
+        return {
+            'chunks': self.chunks,
+            'speech_chunks': self.speech_chunks,
+            'energy_rejects': self.energy_rejects,
+            'neural_rejects': self.neural_rejects
+        }
+
+
+def create_vad(settings=None, sample_rate=16000):
+    """
+    Build the detector selected in Config.VAD / settings ('vad_backend')
+
+    'hybrid' falls back to the energy gate alone when onnxruntime or the
+    Silero model is missing. The UI's 'silence_threshold' (int16 RMS) sets the
+    absolute level below which audio is always silence.
+
+    Returns:
+        tuple: (VoiceActivityDetector, warning message or None)
+    """
+    settings = settings or {}
+    vad = Config.VAD
+    backend = settings.get('vad_backend', vad['backend'])
+
+    min_level_db = vad['min_level_db']
+    if settings.get('silence_threshold'):
+        min_level_db = 20 * np.log10(settings['silence_threshold'] / 32768.0)
+
+    energy = EnergyVAD(
+        sample_rate,
+        margin_db=vad['margin_db'],
+        min_level_db=min_level_db,
+        floor_rise_s=vad['floor_rise_s'],
+        floor_fall_s=vad['floor_fall_s'],
+        min_speech_band_ratio=vad['min_speech_band_ratio'],
+        floor_freeze_s=vad['floor_freeze_s']
+    )
+
+    neural, warning = None, None
+    if backend == 'hybrid':
+        try:
+            neural = SileroVAD(settings.get('silero_model', vad['silero_model']), sample_rate)
+        except (RuntimeError, ValueError) as e:
+            warning = f"{e}, using the energy gate only"
+
+    detector = VoiceActivityDetector(
+        energy, neural,
+        threshold=vad['speech_threshold'],
+        hangover_ms=vad['hangover_ms'],
+        sample_rate=sample_rate
+    )
+    return detector, warning
@@ -0,0 +1,253 @@
+"""
+Voice Catalog Module
+Installed pyttsx3 voices, enumerated once and indexed by language/gender
+"""
+import json
+import os
+import platform
+import re
+import sys
+import threading
+import time
+import unicodedata
+
+from config import Config
+
+# Name/id fragments of Vietnamese voices (SAPI5 voices usually carry no language tag)
+VIETNAMESE_KEYWORDS = ('vietnam', 'việt', 'viet', 'vi-', 'vi_', 'vivn')
+
+# First names of common voices whose driver reports no gender (accent-folded, no spaces)
+FEMALE_NAMES = {'zira', 'hazel', 'susan', 'heera', 'hoaimy', 'huong', 'linh', 'mai', 'samantha', 'karen'}
+MALE_NAMES = {'david', 'mark', 'george', 'ravi', 'an', 'namminh', 'daniel', 'alex'}
+
+# 'en-us' before 'en_us': SAPI ids look like TTS_MS_EN-US_DAVID_11.0
+LANGUAGE_TAGS = (
+    re.compile(r'(?<![a-z])([a-z]{2})-[a-z]{2}(?![a-z])'),
+    re.compile(r'(?<![a-z])([a-z]{2})_[a-z]{2}(?![a-z])')
+)
+NAME_TOKEN = re.compile(r'[^\W\d_]+')
+
+
+def _language_tag(text):
+    for pattern in LANGUAGE_TAGS:
+        match = pattern.search(text)
+        if match:
+            return match.group(1)
+    return None
+
+
+def voice_language(voice_id, name, languages=()):
+    """Two-letter language of a voice, or None"""
+    for tag in languages:
+        if isinstance(tag, bytes):  # espeak: b'\x05en-gb'
+            tag = tag[1:].decode('utf-8', 'ignore')
+        tag = str(tag).lower()
+        language = tag if re.fullmatch(r'[a-z]{2}', tag) else _language_tag(tag)
+        if language:
+            return language
+
+    text = f"{name} {voice_id}".lower()
+    if any(x in text for x in VIETNAMESE_KEYWORDS):
+        return 'vi'
+    return _language_tag(text)
+
+
+def _name_keys(name):
+    """Accent-folded name tokens plus adjacent pairs joined ("Hoài My" -> hoai, my, hoaimy)"""
+    folded = unicodedata.normalize('NFD', name.lower().replace('đ', 'd'))
+    folded = "".join(ch for ch in folded if not unicodedata.combining(ch))
+    tokens = NAME_TOKEN.findall(folded)
+    return set(tokens) | {a + b for a, b in zip(tokens, tokens[1:])}
+
+
+def voice_gender(name, gender=None):
+    """'male' / 'female' from the driver's gender field, else from the voice name"""
+    gender = str(gender or '').lower()
+    if 'female' in gender:
+        return 'female'
+    if 'male' in gender:
+        return 'male'
+
+    tokens = _name_keys(name)
+    if tokens & FEMALE_NAMES:
+        return 'female'
+    if tokens & MALE_NAMES:
+        return 'male'
+    return None
+
+
+class VoiceCatalog:
+    """Voice entries ({'id', 'name', 'language', 'gender'}) with a language/gender index"""
+
+    def __init__(self, voices, key=None, created=None, stamp=''):
+        """
+        Args:
+            voices: List of voice dicts
+            key: Engine/driver/OS key the list was enumerated under
+            created: Enumeration time (epoch seconds)
+            stamp: voice_set_stamp() at enumeration time
+        """
+        self.voices = voices
+        self.key = key
+        self.created = created or time.time()
+        self.stamp = stamp
+        self.from_cache = False  # True when read from the cache file
+
+        self._index = {}
+        for voice in voices:
+            if voice['gender']:
+                self._index.setdefault((voice['language'], voice['gender']), []).append(voice)
+            self._index.setdefault((voice['language'], None), []).append(voice)
+
+    @classmethod
+    def from_engine(cls, engine, key=None, stamp=''):
+        """Enumerate the voices of a pyttsx3 engine (the slow part: SAPI5 loads every token)"""
+        voices = []
+        for voice in engine.getProperty('voices'):
+            voices.append({
+                'id': voice.id,
+                'name': voice.name,
+                'language': voice_language(voice.id, voice.name, getattr(voice, 'languages', None) or ()),
+                'gender': voice_gender(voice.name, getattr(voice, 'gender', None))
+            })
+        return cls(voices, key, stamp=stamp)
+
+    def find(self, language='vi', gender=None):
+        """Voices in `language`, optionally only one gender"""
+        return list(self._index.get((language, gender), []))
+
+    def best(self, language='vi', gender=None):
+        """
+        Voice id for a language, preferring the requested gender
+
+        Returns:
+            str or None: None when no voice speaks the language
+        """
+        voices = self.find(language, gender) or self.find(language)
+        return voices[0]['id'] if voices else None
+
+    @staticmethod
+    def load(path, key, max_age=None, stamp=''):
+        """Cached catalog from `path`, or None when missing, stale, for another driver or voice set"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data['key'] != key or data.get('stamp', '') != stamp:
+                return None
+            created = float(data['created'])
+            voices = [
+                {field: voice[field] for field in ('id', 'name', 'language', 'gender')}
+                for voice in data['voices']
+            ]
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return None
+        if max_age is not None and time.time() - created > max_age:
+            return None
+        catalog = VoiceCatalog(voices, key, created, stamp)
+        catalog.from_cache = True
+        return catalog
+
+    def save(self, path):
+        """Write the catalog to `path` atomically (errors are ignored: it is only a cache)"""
+        temp_path = f"{path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                data = {'key': self.key, 'created': self.created, 'stamp': self.stamp, 'voices': self.voices}
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except OSError:
+            pass
+
+
+def driver_key():
+    """Cache key: pyttsx3 version + default driver + OS build (voice installs need an OS change or refresh)"""
+    try:
+        from importlib.metadata import version
+        engine_version = version('pyttsx3')
+    except Exception:
+        engine_version = 'unknown'
+    driver = {'win32': 'sapi5', 'darwin': 'nsss'}.get(sys.platform, 'espeak')
+    return f"pyttsx3-{engine_version}/{driver}/{platform.platform()}"
+
+
+# Where installed voices are registered (a voice install touches one of these)
+SAPI_VOICE_KEYS = (
+    r'SOFTWARE\Microsoft\Speech\Voices\Tokens',
+    r'SOFTWARE\Microsoft\Speech_OneCore\Voices\Tokens'
+)
+VOICE_DIRS = (
+    '/System/Library/Speech/Voices',
+    '/Library/Speech/Voices',
+    os.path.expanduser('~/Library/Speech/Voices'),
+    '/usr/share/espeak-ng-data/voices',
+    '/usr/lib/x86_64-linux-gnu/espeak-ng-data/voices',
+    '/usr/share/espeak-data/voices'
+)
+
+
+def voice_set_stamp():
+    """
+    Cheap fingerprint of the installed voices, without creating an engine
+
+    Windows: entry count + last-write time of the SAPI voice token keys;
+    elsewhere: entry count + mtime of the system voice directories.
+    Returns '' when nothing can be read (the cache then relies on max_age).
+    """
+    parts = []
+    if sys.platform == 'win32':
+        import winreg
+        for path in SAPI_VOICE_KEYS:
+            try:
+                with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, path) as handle:
+                    subkeys, _, modified = winreg.QueryInfoKey(handle)
+                parts.append(f"{subkeys}@{modified}")
+            except OSError:
+                continue
+    else:
+        for path in VOICE_DIRS:
+            try:
+                parts.append(f"{len(os.listdir(path))}@{os.stat(path).st_mtime_ns}")
+            except OSError:
+                continue
+    return ";".join(parts)
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog(engine=None, refresh=False):
+    """
+    Process-wide voice catalog
+
+    Read from the cache file in Config.CACHE['dir'] when it was written
+    under the same driver key and voice set stamp and is younger than
+    max_age_hours; otherwise enumerated (with `engine`, or a temporary
+    pyttsx3 engine) and saved.
+
+    Args:
+        engine: pyttsx3 engine to enumerate with (must be used on its own thread)
+        refresh: Ignore the in-process and on-disk caches
+    """
+    global _catalog
+    with _catalog_lock:
+        if _catalog is not None and not refresh:
+            return _catalog
+
+        settings = Config.VOICE_CATALOG
+        path = os.path.join(Config.CACHE['dir'], settings['file'])
+        key = driver_key()
+        stamp = voice_set_stamp()
+        max_age = settings['max_age_hours'] * 3600 if settings['max_age_hours'] else None
+
+        catalog = None if refresh else VoiceCatalog.load(path, key, max_age, stamp)
+        if catalog is None:
+            if engine is None:
+                import pyttsx3
+                engine = pyttsx3.init()
+            catalog = VoiceCatalog.from_engine(engine, key, stamp)
+            catalog.save(path)
+
+        _catalog = catalog
+        return catalog
@@ -7,8 +7,6 @@ import numpy as np
 import threading
 import queue
 import time
-from faster_whisper import WhisperModel
-from deep_translator import GoogleTranslator
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 import torch
@@ -19,17 +17,29 @@ import tempfile
 
 # Import our modules
 from tts_engine import TTSEngine
+from tts_pipeline import TTSPipeline
 from audio_utils import AudioUtils
+from resampler import StreamingPreprocessor
+from translation_cache import CachedTranslator, default_translation_cache
+from translation_batcher import drain_batch
+from translator_backends import create_translator
+from streaming_stt import StreamingTranscriber
+from overlap_chunker import OverlapChunker
+from vad import create_vad
+from whisper_preloader import WhisperPreloader
+from model_registry import default_registry
+from decoding_profiles import decoding_options
 from config import Config
 
 class TranslatorEngine:
-    def __init__(self, settings, ui):
+    def __init__(self, settings, ui, whisper_model=None, audio=None):
         self.settings = settings
         self.ui = ui
         self.is_running = False
         
-        # Audio settings
-        self.audio = pyaudio.PyAudio()
+        # Audio settings (the UI's PyAudio instance is reused across Stop/Start)
+        self.owns_audio = audio is None
+        self.audio = audio or pyaudio.PyAudio()
         self.chunk = Config.AUDIO['chunk_size']
         self.format = pyaudio.paFloat32 # Use Float32 for WASAPI compatibility
         self.device_index = settings.get('device_index', None) # Store user-selected device
@@ -37,27 +47,47 @@ class TranslatorEngine:
         # Queues for 3-Thread Pipeline
         self.trans_queue = queue.Queue() # Thread 1 -> Thread 2
         self.tts_queue = queue.Queue()   # Thread 2 -> Thread 3
+        self.stream_queue = queue.Queue() # Capture -> Streaming STT (16kHz chunks, None = end of utterance)
         
-        # Initialize Engines
-        device = "cuda" if torch.cuda.is_available() else "cpu"
-        self.whisper_model = WhisperModel(
-            settings['model'],
-            device=device,
-            compute_type=settings['compute_type']
-        )
-        if ui: ui.log(f"✅ Whisper loaded on {device.upper()}", 'info')
+        # Initialize Engines (the UI hands over its preloaded, warmed-up model)
+        if whisper_model is not None:
+            self.whisper_model = whisper_model
+        else:
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            self.whisper_model = default_registry().get(settings['model'], device, settings['compute_type'])
+            if ui: ui.log(f"✅ Whisper loaded on {device.upper()}", 'info')
         
+        translation_cache = default_translation_cache()
         try:
-            self.translator = GoogleTranslator(source='zh-CN', target='vi')
-            if ui: ui.log("✅ Google Translate ready", 'success')
+            backend = create_translator(settings)
+            self.translator = CachedTranslator(backend, translation_cache)
+            if ui: ui.log(f"✅ {backend.name} ready (cached)", 'success')
         except Exception as e:
             if ui: ui.log(f"❌ Translator Error: {e}", 'error')
+        
+        # Single-hop mode: Whisper translates to English, a light en->vi hop finishes it
+        self.pipeline_mode = settings.get('pipeline_mode', Config.DEFAULTS['pipeline_mode'])
+        if self.pipeline_mode == 'whisper_translate':
+            try:
+                pivot_backend = create_translator(settings, pivot=True)
+                self.pivot_translator = CachedTranslator(pivot_backend, translation_cache, namespace='en→vi|')
+                if ui: ui.log(f"✅ Single-hop mode: Whisper translate + {pivot_backend.name} (en→vi, cached)", 'success')
+            except Exception as e:
+                if ui: ui.log(f"❌ Pivot Translator Error: {e}, falling back to cascade", 'error')
+                self.pipeline_mode = 'cascade'
+        self.whisper_task = 'translate' if self.pipeline_mode == 'whisper_translate' else 'transcribe'
+        self.stt_mode = settings.get('stt_mode', Config.DEFAULTS['stt_mode'])
+        
+        # Forced cuts keep an overlap tail; words near the cut are re-decoded in the next chunk
+        overlap = Config.OVERLAP_CHUNKING
+        self.chunker = OverlapChunker(overlap['guard'], overlap['max_overlap']) if overlap['enabled'] else None
             
         self.tts_engine = TTSEngine(
             mode=settings.get('tts_engine', 'edge'),
             ui=ui,
             settings=settings
         )
+        self.tts_pipeline = TTSPipeline.for_engine(self.tts_engine, ui)
 
     def start(self):
         self.is_running = True
@@ -66,11 +96,16 @@ class TranslatorEngine:
         self.thread1 = threading.Thread(target=self.speech_to_text_thread, daemon=True)
         self.thread1.start()
         
+        # Thread 1b: Streaming STT (decodes while Thread 1 keeps capturing)
+        if self.stt_mode == 'streaming':
+            self.thread1b = threading.Thread(target=self.streaming_stt_thread, daemon=True)
+            self.thread1b.start()
+        
         # Thread 2: Translate
         self.thread2 = threading.Thread(target=self.translation_thread, daemon=True)
         self.thread2.start()
         
-        # Thread 3: Output (TTS & Play)
+        # Thread 3: Output (TTS pool -> playback worker)
         self.thread3 = threading.Thread(target=self.output_thread, daemon=True)
         self.thread3.start()
         
@@ -78,8 +113,16 @@ class TranslatorEngine:
 
     def stop(self):
         self.is_running = False
-        if hasattr(self, 'audio'):
+        if hasattr(self, 'audio') and self.owns_audio:
             self.audio.terminate()
+        if hasattr(self, 'tts_pipeline'):
+            self.tts_pipeline.shutdown()
+        if hasattr(self, 'tts_engine'):
+            self.tts_engine.shutdown()
+        if hasattr(self, 'translator'):
+            self.translator.save()
+            stats = self.translator.stats()
+            if self.ui: self.ui.log(f"📚 Translation cache: {stats['hits']} hits / {stats['misses']} misses ({stats['hit_rate']*100:.0f}%)", 'info')
 
     def speech_to_text_thread(self):
         """Thread 1: Listen -> Text -> Queue 1"""
@@ -168,24 +211,48 @@ class TranslatorEngine:
 
         if self.ui: self.ui.log(f"🎤 Listening on: {default_speakers['name']}", 'info')
         
-        frames = []
-        silence_threshold = 0.01
         min_audio_length = 1.0 # Reduce to 1.0s for faster response
         pause_time = 0.3 # Reduce to 0.3s for faster silence detection
         max_buffer_duration = 4.0 # Force processing after 4s even without silence
         last_speech_time = time.time()
         first_speech_time = None
         
+        # Streaming pre-processing: each chunk is downmixed + resampled to 16kHz mono
+        # as it arrives, so the buffer is already Whisper-ready when the pause ends.
+        # The resampler runs continuously (VAD input too), it is never flushed between utterances.
+        whisper_rate = Config.AUDIO['whisper_rate']
+        preprocessor = StreamingPreprocessor(
+            int(default_speakers["defaultSampleRate"]),
+            self.channels,
+            whisper_rate
+        )
+        
+        frames = []
+        
+        # Speech gate on the 16kHz stream (adaptive noise floor + optional Silero, with hangover)
+        vad, vad_warning = create_vad(self.settings, whisper_rate)
+        if self.ui:
+            if vad_warning: self.ui.log(f"⚠️ VAD: {vad_warning}", 'warning')
+            self.ui.log(f"🎚️ Speech gate: {vad.name}", 'info')
+        
+        # Streaming mode: chunks go to the streaming STT thread, which bounds its own window
+        streaming = self.stt_mode == 'streaming'
+        
         while self.is_running:
             try:
                 data = stream.read(self.chunk)
                 audio_np = np.frombuffer(data, dtype=np.float32)
-                volume = np.abs(audio_np).mean()
+                audio_16k = preprocessor.process(audio_np)
                 
-                if volume > silence_threshold:
+                if vad.is_speech(audio_16k):
+                    preprocessor.count_last()
                     if first_speech_time is None:
                         first_speech_time = time.time()
-                    frames.append(audio_np)
+                    if streaming:
+                        self.stream_queue.put(audio_16k)
+                        last_speech_time = time.time()
+                        continue
+                    frames.append(audio_16k)
                     last_speech_time = time.time()
                     
                     # Force processing if buffer is too long
@@ -194,105 +261,222 @@ class TranslatorEngine:
                         if self.ui: self.ui.log(f"⏱️ Max buffer reached ({buffer_duration:.1f}s), processing...", 'info')
                         # Process immediately
                         if len(frames) > 0:
-                            self._process_audio_buffer(frames, default_speakers, first_speech_time)
-                            frames = []
-                            first_speech_time = None
+                            audio = self._finish_utterance(frames, preprocessor, final=False)
+                            keep = self._process_audio_buffer(audio, first_speech_time, final=False)
+                            if keep:
+                                # Overlap tail: the next chunk starts where the emitted words ended
+                                frames = [audio[max(0, len(audio) - int(keep * whisper_rate)):]]
+                                first_speech_time = time.time() - keep
+                            else:
+                                frames = []
+                                first_speech_time = None
                             
+                elif streaming and first_speech_time is not None:
+                    # Silence detected: close the utterance in the streaming STT thread
+                    if time.time() - last_speech_time > pause_time:
+                        self.stream_queue.put(None)
+                        preprocessor.reset_stats()
+                        first_speech_time = None
+                        
                 elif frames:
                     # Silence detected
                     if time.time() - last_speech_time > pause_time:
                         duration = (time.time() - first_speech_time) if first_speech_time else 0
-                        if duration > min_audio_length:
-                            self._process_audio_buffer(frames, default_speakers, first_speech_time)
+                        if duration > min_audio_length or (self.chunker and self.chunker.in_progress):
+                            self._process_audio_buffer(self._finish_utterance(frames, preprocessor), first_speech_time)
+                        else:
+                            preprocessor.reset_stats()
                         frames = []
                         first_speech_time = None
                         
             except Exception as e:
                 if self.ui: self.ui.log(f"⚠️ Audio error: {e}", 'warning')
-    
-    def _process_audio_buffer(self, frames, device_info, start_time):
-        """Helper method to process accumulated audio frames"""
+        
         try:
-            audio_float = np.concatenate(frames)
-            sample_rate = int(device_info["defaultSampleRate"])
-            duration = len(audio_float) / sample_rate
+            stream.stop_stream()
+            stream.close()
+        except Exception:
+            pass
+    
+    def _finish_utterance(self, frames, preprocessor, final=True):
+        """Join the Whisper-ready frames and report the DSP time moved off the critical path"""
+        if not final and self.chunker:
+            # Forced cut with overlap: audio continues in the next chunk
+            return np.concatenate(frames)
+        
+        # DSP of the gated speech chunks only (silence is preprocessed for the VAD anyway)
+        streamed_ms = preprocessor.dsp_time * 1000
+        preprocessor.reset_stats()
+        
+        if self.ui: self.ui.log(f"⚡ Audio Whisper-ready (saved ~{streamed_ms:.1f}ms DSP at end of speech)", 'info')
+        return np.concatenate(frames)
+    
+    def _process_audio_buffer(self, audio_float, start_time, final=True):
+        """
+        Helper method to transcribe a Whisper-ready utterance (16kHz mono)
+        
+        Args:
+            final: False at a forced cut (max_buffer_duration), the utterance goes on
             
-            # Downmix stereo to mono for Whisper
-            if device_info["maxInputChannels"] == 2:
-                # Reshape to (samples, 2) and average channels
-                audio_float = audio_float.reshape(-1, 2).mean(axis=1)
+        Returns:
+            float: Seconds of audio to keep as overlap for the next chunk (0 = clear)
+        """
+        # Word timestamps are only needed around forced cuts
+        chunked = self.chunker is not None and (not final or self.chunker.in_progress)
+        try:
+            duration = len(audio_float) / Config.AUDIO['whisper_rate']
             
             # Ensure audio is in valid range [-1, 1]
             max_val = np.abs(audio_float).max()
             if max_val > 1.0:
                 audio_float = audio_float / max_val
             
-            # Resample to 16kHz if needed (Whisper expects 16kHz)
-            if sample_rate != 16000:
-                if self.ui: self.ui.log(f"🔄 Resampling from {sample_rate}Hz to 16000Hz", 'info')
-                # Simple resampling using numpy
-                target_length = int(len(audio_float) * 16000 / sample_rate)
-                audio_float = np.interp(
-                    np.linspace(0, len(audio_float), target_length),
-                    np.arange(len(audio_float)),
-                    audio_float
-                )
-            
             if self.ui: self.ui.log(f"🎧 Processing {duration:.1f}s audio ({len(audio_float)} samples @ 16kHz, max: {max_val:.3f})", 'info')
             
             segments, info = self.whisper_model.transcribe(
                 audio_float, 
-                beam_size=5, 
-                language='zh',
-                vad_filter=False,  # Disable VAD temporarily to debug
-                no_speech_threshold=0.6
+                **decoding_options(
+                    self.settings,
+                    language='zh',
+                    task=self.whisper_task,
+                    vad_filter=False,  # Disable VAD temporarily to debug
+                    no_speech_threshold=0.6,
+                    word_timestamps=chunked
+                )
             )
             
             segment_list = list(segments)
             if self.ui: self.ui.log(f"📊 Whisper found {len(segment_list)} segments", 'info')
             
-            text = " ".join([s.text for s in segment_list]).strip()
+            keep = 0.0
+            if chunked:
+                words = [(w.start, w.end, w.word) for s in segment_list for w in (s.words or [])]
+                text, keep = self.chunker.split(words, duration, final)
+                if keep and self.ui: self.ui.log(f"✂️ Carrying {keep:.2f}s overlap into the next chunk", 'info')
+            else:
+                text = " ".join([s.text for s in segment_list]).strip()
             
             if text:
-                if self.ui: self.ui.log(f"🗣️ Heard: {text}", 'chinese')
-                self.trans_queue.put(text)
-            else:
+                self._emit_text(text)
+            elif final:
                 if self.ui: self.ui.log(f"⚠️ No text detected in {duration:.1f}s audio (lang: {info.language}, prob: {info.language_probability:.2f})", 'warning')
+            return keep
                 
         except Exception as e:
             if self.ui: self.ui.log(f"❌ Processing error: {e}", 'error')
             import traceback
             if self.ui: self.ui.log(f"Stack: {traceback.format_exc()}", 'error')
+            if self.chunker:
+                self.chunker.reset()
+            return 0.0
+
+    def streaming_stt_thread(self):
+        """Thread 1b (streaming mode): re-decode the growing utterance, stable words -> Queue 1"""
+        if self.ui: self.ui.log("🌊 Thread 1b (Streaming STT) started", 'info')
+        
+        options = Config.STREAMING_STT
+        transcriber = StreamingTranscriber(
+            self.whisper_model,
+            Config.AUDIO['whisper_rate'],
+            buffer_trim=options['buffer_trim'],
+            prompt_chars=options['prompt_chars'],
+            options=decoding_options(
+                self.settings,
+                language='zh',
+                task=self.whisper_task,
+                vad_filter=False,
+                no_speech_threshold=0.6
+            )
+        )
+        pending = ""  # Committed text held back until it is worth translating
+        
+        while self.is_running:
+            try:
+                chunk = self.stream_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            
+            try:
+                if chunk is None:
+                    # End of utterance: everything still pending is final
+                    if transcriber.duration >= options['min_chunk']:
+                        pending += transcriber.finish()
+                    else:
+                        transcriber.reset()
+                    if pending.strip():
+                        self._emit_text(pending.strip())
+                    pending = ""
+                    continue
+                
+                transcriber.insert_audio(chunk)
+                if transcriber.unprocessed >= options['update_interval'] and transcriber.duration >= options['min_chunk']:
+                    start = time.perf_counter()
+                    pending += transcriber.process_iter()
+                    if len(pending.strip()) >= options['min_fragment_chars']:
+                        if self.ui: self.ui.log(f"🌊 Committed at {transcriber.duration:.1f}s into speech (decode {(time.perf_counter() - start) * 1000:.0f}ms)", 'info')
+                        self._emit_text(pending.strip(), partial=True)
+                        pending = ""
+            except Exception as e:
+                if self.ui: self.ui.log(f"❌ Streaming STT error: {e}", 'error')
+                transcriber.reset()
+                pending = ""
+
+    def _emit_text(self, text, partial=False):
+        """Hand recognized text to Queue 1 (marked as English in single-hop mode)"""
+        pivot = self.pipeline_mode == 'whisper_translate'
+        if self.ui:
+            if pivot:
+                self.ui.log(f"🗣️ Heard (en){' (partial)' if partial else ''}: {text}", 'english')
+            else:
+                self.ui.log(f"🗣️ Heard{' (partial)' if partial else ''}: {text}", 'chinese')
+        self.trans_queue.put((text, pivot))
 
     def translation_thread(self):
         """Thread 2: Queue 1 -> Translate -> Queue 2"""
         if self.ui: self.ui.log("🌍 Thread 2 (Translate) started", 'info')
         
+        max_batch = self.settings.get('translation_batch_size', Config.TRANSLATION['batch_size'])
+        window = self.settings.get('translation_batch_window_ms', Config.TRANSLATION['batch_window_ms']) / 1000
+        
         while self.is_running:
             try:
-                text = self.trans_queue.get(timeout=0.5)
+                # Micro-batch: everything queued within the window goes out as one request
+                batch = drain_batch(self.trans_queue, max_batch, window, timeout=0.5)
                 
-                translated = self.translator.translate(text)
-                if translated:
-                    if self.ui: self.ui.log(f"✅ Trans: {translated}", 'vietnamese')
-                    self.tts_queue.put(translated)
+                # Single-hop mode queues English: the en->vi hop runs here, off the capture thread
+                for pivot in (False, True):
+                    texts = [text for text, is_pivot in batch if is_pivot == pivot]
+                    if not texts:
+                        continue
+                    translator = self.pivot_translator if pivot else self.translator
+                    
+                    start = time.perf_counter()
+                    results = translator.translate_batch(texts)
+                    trans_ms = (time.perf_counter() - start) * 1000
+                    if len(texts) > 1 and self.ui:
+                        self.ui.log(f"📦 Batched {len(texts)} lines in {trans_ms:.0f}ms ({trans_ms / len(texts):.0f}ms/line)", 'info')
+                    
+                    for translated in results:
+                        if translated:
+                            if self.ui: self.ui.log(f"✅ Trans{' [en hop]' if pivot else ''}: {translated}", 'vietnamese')
+                            self.tts_queue.put(translated)
                     
-                self.trans_queue.task_done()
+                for _ in batch:
+                    self.trans_queue.task_done()
             except queue.Empty:
                 continue
             except Exception as e:
                 if self.ui: self.ui.log(f"❌ Trans Error: {e}", 'error')
 
     def output_thread(self):
-        """Thread 3: Queue 2 -> Speak (Direct)"""
+        """Thread 3: Queue 2 -> TTS pipeline (synthesis runs ahead of playback)"""
         if self.ui: self.ui.log("🔊 Thread 3 (Output) started", 'info')
         
         while self.is_running:
             try:
                 text = self.tts_queue.get(timeout=0.5)
                 
-                if self.ui: self.ui.log(f"▶️ Speaking: {text[:20]}...", 'info')
-                self.tts_engine.speak(text)
+                self.tts_pipeline.submit(text)
                 
                 self.tts_queue.task_done()
             except queue.Empty:
@@ -316,6 +500,15 @@ class AudioTranslatorUI:
         self.create_ui()
         self.load_audio_devices()
         self.check_gpu()
+        
+        # Load + warm up Whisper while the user is still picking settings
+        self.whisper_device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.preloader = WhisperPreloader(ui=self)
+        self.preload_model()
+    
+    def preload_model(self, *args):
+        """Preload the selected model (again when the model / compute selection changes)"""
+        self.preloader.preload(self.model_combo.get(), self.compute_combo.get(), self.whisper_device)
     
     def create_ui(self):
         style = ttk.Style()
@@ -338,12 +531,14 @@ class AudioTranslatorUI:
         self.model_combo = ttk.Combobox(settings_frame, values=Config.WHISPER_MODELS, state='readonly', width=15)
         self.model_combo.set(Config.DEFAULTS['model'])
         self.model_combo.grid(row=1, column=1, sticky=tk.W, pady=5, padx=5)
+        self.model_combo.bind('<<ComboboxSelected>>', self.preload_model)
         
         # Compute
         ttk.Label(settings_frame, text="⚡ Compute:").grid(row=2, column=0, sticky=tk.W, pady=5)
         self.compute_combo = ttk.Combobox(settings_frame, values=Config.COMPUTE_TYPES, state='readonly', width=15)
         self.compute_combo.set(Config.DEFAULTS['compute_type'])
         self.compute_combo.grid(row=2, column=1, sticky=tk.W, pady=5, padx=5)
+        self.compute_combo.bind('<<ComboboxSelected>>', self.preload_model)
         
         # TTS Engine
         ttk.Label(settings_frame, text="🔊 TTS Engine:").grid(row=3, column=0, sticky=tk.W, pady=5)
@@ -352,10 +547,36 @@ class AudioTranslatorUI:
         tts_frame.grid(row=3, column=1, sticky=tk.W, pady=5, padx=5)
         for mode_key, mode_info in Config.TTS_MODES.items():
             ttk.Radiobutton(tts_frame, text=mode_info['display'], variable=self.tts_engine_var, value=mode_key).pack(anchor=tk.W)
+        self.tts_streaming_var = tk.BooleanVar(value=Config.DEFAULTS['tts_streaming'])
+        ttk.Checkbutton(tts_frame, text="⚡ Streaming playback (Edge)", variable=self.tts_streaming_var).pack(anchor=tk.W)
         
         # Sliders
         self.create_sliders(settings_frame)
         
+        # Translator Backend
+        ttk.Label(settings_frame, text="🌍 Translator:").grid(row=11, column=0, sticky=tk.W, pady=5)
+        self.translator_combo = ttk.Combobox(settings_frame, values=list(Config.TRANSLATOR_BACKENDS.values()), state='readonly', width=30)
+        self.translator_combo.set(Config.TRANSLATOR_BACKENDS[Config.DEFAULTS['translator_backend']])
+        self.translator_combo.grid(row=11, column=1, sticky=tk.W, pady=5, padx=5)
+        
+        # Pipeline Mode
+        ttk.Label(settings_frame, text="🔀 Pipeline:").grid(row=12, column=0, sticky=tk.W, pady=5)
+        self.pipeline_combo = ttk.Combobox(settings_frame, values=list(Config.PIPELINE_MODES.values()), state='readonly', width=40)
+        self.pipeline_combo.set(Config.PIPELINE_MODES[Config.DEFAULTS['pipeline_mode']])
+        self.pipeline_combo.grid(row=12, column=1, sticky=tk.W, pady=5, padx=5)
+        
+        # STT Mode
+        ttk.Label(settings_frame, text="🌊 STT Mode:").grid(row=13, column=0, sticky=tk.W, pady=5)
+        self.stt_mode_combo = ttk.Combobox(settings_frame, values=list(Config.STT_MODES.values()), state='readonly', width=40)
+        self.stt_mode_combo.set(Config.STT_MODES[Config.DEFAULTS['stt_mode']])
+        self.stt_mode_combo.grid(row=13, column=1, sticky=tk.W, pady=5, padx=5)
+        
+        # Decoding Profile
+        ttk.Label(settings_frame, text="🧠 Decoding:").grid(row=14, column=0, sticky=tk.W, pady=5)
+        self.decoding_combo = ttk.Combobox(settings_frame, values=[p['display'] for p in Config.DECODING_PROFILES.values()], state='readonly', width=40)
+        self.decoding_combo.set(Config.DECODING_PROFILES[Config.DEFAULTS['decoding_profile']]['display'])
+        self.decoding_combo.grid(row=14, column=1, sticky=tk.W, pady=5, padx=5)
+        
         # GPU Info
         self.gpu_label = ttk.Label(settings_frame, text="🔍 Checking GPU...")
         self.gpu_label.grid(row=20, column=0, columnspan=2, pady=5)
@@ -381,6 +602,7 @@ class AudioTranslatorUI:
         self.log_text.pack(fill=tk.BOTH, expand=True)
         
         self.log_text.tag_config('chinese', foreground=Config.COLORS['chinese'])
+        self.log_text.tag_config('english', foreground=Config.COLORS['english'])
         self.log_text.tag_config('vietnamese', foreground=Config.COLORS['vietnamese'])
         self.log_text.tag_config('info', foreground=Config.COLORS['info'])
         self.log_text.tag_config('error', foreground=Config.COLORS['error'])
@@ -478,6 +700,11 @@ class AudioTranslatorUI:
             'tts_speed': self.tts_scale.get(),
             'device_index': device_idx,
             'tts_engine': self.tts_engine_var.get(),
+            'tts_streaming': self.tts_streaming_var.get(),
+            'translator_backend': list(Config.TRANSLATOR_BACKENDS)[self.translator_combo.current()],
+            'pipeline_mode': list(Config.PIPELINE_MODES)[self.pipeline_combo.current()],
+            'stt_mode': list(Config.STT_MODES)[self.stt_mode_combo.current()],
+            'decoding_profile': list(Config.DECODING_PROFILES)[self.decoding_combo.current()],
             'pause_time': self.pause_scale.get(),
             'min_audio_length': self.min_audio_scale.get(),
             'padding_words': self.padding_scale.get(),
@@ -489,7 +716,12 @@ class AudioTranslatorUI:
         
         def init_and_start():
             try:
-                self.translator_engine = TranslatorEngine(settings, self)
+                if not self.preloader.is_ready(settings['model'], settings['compute_type'], self.whisper_device):
+                    self.log("⏳ Waiting for Whisper preload...", 'info')
+                model = self.preloader.get(settings['model'], settings['compute_type'], self.whisper_device)
+                init_start = time.perf_counter()
+                self.translator_engine = TranslatorEngine(settings, self, whisper_model=model, audio=self.audio)
+                self.log(f"⚡ Pipeline ready in {(time.perf_counter() - init_start) * 1000:.0f}ms", 'info')
                 self.translator_engine.start()
                 self.root.after(0, lambda: self._on_start_success())
             except Exception as e:
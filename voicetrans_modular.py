@@ -7,8 +7,7 @@ import numpy as np
 import threading
 import queue
 import time
-from faster_whisper import WhisperModel
-from deep_translator import GoogleTranslator
+from concurrent.futures import Future, ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 import torch
@@ -16,17 +15,27 @@ import torch
 # Import our modules
 from tts_engine import TTSEngine
 from audio_utils import AudioUtils
+from resampler import StreamingPreprocessor
+from vad import create_vad
+from whisper_preloader import WhisperPreloader
+from model_registry import default_registry
+from decoding_profiles import decoding_options
+from batched_stt import BatchedTranscriber
+from translation_batcher import drain_batch
+from translation_cache import CachedTranslator, default_translation_cache
+from translator_backends import create_translator
 from config import Config
 
 
 class TranslatorEngine:
-    def __init__(self, settings, ui):
+    def __init__(self, settings, ui, whisper_model=None, audio=None):
         self.settings = settings
         self.ui = ui
         self.is_running = False
         self.is_tts_playing = False  # Flag to pause capture during TTS
         
-        self.audio = pyaudio.PyAudio()
+        # The UI's PyAudio instance is reused across Stop/Start
+        self.audio = audio or pyaudio.PyAudio()
         self.chunk = Config.AUDIO['chunk_size']
         self.format = pyaudio.paInt16
         
@@ -42,22 +51,32 @@ class TranslatorEngine:
         self.text_queue = queue.Queue(maxsize=10)
         self.translation_queue = queue.Queue(maxsize=10)
         
+        # Gender/pitch analysis runs beside Whisper instead of before it
+        self.gender_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='gender')
+        self.stt_thread = None
+        
         # Pause detection settings
         self.pause_time = settings.get('pause_time', 0.5)
         self.min_audio_length = settings.get('min_audio_length', 1.0)
         
-        # Whisper Model
-        self.ui.log(f"🔄 Loading Whisper model: {settings['model']}...", 'info')
-        device = "cuda" if torch.cuda.is_available() else "cpu"
-        self.whisper_model = WhisperModel(
-            settings['model'],
-            device=device,
-            compute_type=settings['compute_type']
-        )
-        self.ui.log(f"✅ Whisper model loaded on {device.upper()}", 'info')
+        # Whisper Model (preloaded by the UI when available)
+        if whisper_model is not None:
+            self.whisper_model = whisper_model
+        else:
+            self.ui.log(f"🔄 Loading Whisper model: {settings['model']}...", 'info')
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            self.whisper_model = default_registry().get(settings['model'], device, settings['compute_type'])
+            self.ui.log(f"✅ Whisper model loaded on {device.upper()}", 'info')
+        
+        # Backlogged utterances are decoded together in one batched call
+        self.batch_transcriber = BatchedTranscriber(self.whisper_model, self.whisper_rate)
+        if not self.batch_transcriber.available:
+            self.ui.log("⚠️ Batched STT needs faster-whisper >= 1.1, backlog is decoded one by one", 'warning')
         
         # Translator
-        self.translator = GoogleTranslator(source='zh-CN', target='vi')
+        backend = create_translator(settings)
+        self.translator = CachedTranslator(backend, default_translation_cache())
+        self.ui.log(f"✅ {backend.name} ready", 'info')
         
         # TTS Engine (using our new module!)
         self.tts_engine = TTSEngine(
@@ -70,9 +89,10 @@ class TranslatorEngine:
         """Start all threads"""
         self.is_running = True
         
+        self.stt_thread = threading.Thread(target=self.speech_to_text_thread, daemon=True)
         threads = [
             threading.Thread(target=self.audio_capture_thread, daemon=True),
-            threading.Thread(target=self.speech_to_text_thread, daemon=True),
+            self.stt_thread,
             threading.Thread(target=self.translation_thread, daemon=True),
             threading.Thread(target=self.tts_thread, daemon=True)
         ]
@@ -81,9 +101,23 @@ class TranslatorEngine:
             t.start()
     
     def stop(self):
-        """Stop engine"""
+        """Stop engine (returns at once; the workers are wound down on a separate thread)"""
         self.is_running = False
+        # Called from the Tk thread: joining and saving here would freeze the window
+        threading.Thread(target=self._shutdown, name='engine-shutdown').start()
+    
+    def _shutdown(self):
+        """Wait for the workers to leave their loops, then release pools, TTS and caches"""
         time.sleep(0.5)
+        # The STT thread submits to the gender pool; let it leave its loop first
+        # (one still inside a long transcribe falls back to inline detection)
+        if self.stt_thread:
+            self.stt_thread.join(timeout=2)
+        self.gender_pool.shutdown(wait=False)
+        self.tts_engine.shutdown()
+        self.translator.save()
+        stats = self.translator.stats()
+        self.ui.log(f"📚 Translation cache: {stats['hits']} hits / {stats['misses']} misses ({stats['hit_rate']*100:.0f}%)", 'info')
     
     def audio_capture_thread(self):
         """Capture audio from device"""
@@ -103,6 +137,13 @@ class TranslatorEngine:
         pause_frames = int(self.rate / self.chunk * self.pause_time)
         min_audio_frames = int(self.rate / self.chunk * self.min_audio_length)
         
+        # Speech gate (adaptive noise floor + optional Silero) on a 16kHz mono copy of each chunk
+        vad, vad_warning = create_vad(self.settings, self.whisper_rate)
+        vad_input = StreamingPreprocessor(self.rate, self.channels, self.whisper_rate)
+        if vad_warning:
+            self.ui.log(f"⚠️ VAD: {vad_warning}", 'warning')
+        self.ui.log(f"🎚️ Speech gate: {vad.name}", 'info')
+        
         while self.is_running:
             try:
                 data = stream.read(self.chunk, exception_on_overflow=False)
@@ -115,9 +156,9 @@ class TranslatorEngine:
                         is_speaking = False
                     continue
                 
-                rms = AudioUtils.calculate_rms(data)
+                samples = np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
                 
-                if rms > self.settings['silence_threshold']:
+                if vad.is_speech(vad_input.process(samples)):
                     buffer.append(data)
                     silence_counter = 0
                     if not is_speaking:
@@ -146,48 +187,84 @@ class TranslatorEngine:
         stream.close()
     
     def speech_to_text_thread(self):
-        """STT thread with gender detection"""
+        """STT thread with gender detection (a backlog of utterances is transcribed as one batch)"""
+        max_batch = Config.STT_BATCH['max_batch']
+        window = Config.STT_BATCH['window_ms'] / 1000
+        
         while self.is_running:
             try:
-                audio_data = self.audio_queue.get(timeout=1)
+                batch = drain_batch(self.audio_queue, max_batch, window, timeout=1)
                 start_time = time.time()
                 
                 # Resample to 16kHz
-                resampled_data = AudioUtils.resample_audio(
-                    audio_data, 
-                    self.device_rate, 
-                    self.whisper_rate, 
-                    self.channels
-                )
-                audio_array = np.frombuffer(resampled_data, dtype=np.int16).astype(np.float32) / 32768.0
+                audio_arrays = []
+                for audio_data in batch:
+                    resampled_data = AudioUtils.resample_audio(
+                        audio_data, 
+                        self.device_rate, 
+                        self.whisper_rate, 
+                        self.channels
+                    )
+                    audio_arrays.append(np.frombuffer(resampled_data, dtype=np.int16).astype(np.float32) / 32768.0)
                 
-                # Detect gender
-                gender = AudioUtils.detect_gender(audio_array, self.whisper_rate)
+                # Detect gender in parallel with transcription
+                gender_futures = [
+                    self._submit_gender(audio_array) if Config.GENDER_DETECTION['enabled'] else None
+                    for audio_array in audio_arrays
+                ]
                 
                 # Transcribe
-                segments, info = self.whisper_model.transcribe(
-                    audio_array,
-                    language="zh",
-                    beam_size=self.settings['beam_size'],
-                    vad_filter=True,
-                    vad_parameters=dict(min_silence_duration_ms=100),
-                    no_speech_threshold=0.6,
-                    initial_prompt="以下是普通话的句子。"
-                )
+                if len(audio_arrays) == 1:
+                    segments, info = self.whisper_model.transcribe(
+                        audio_arrays[0],
+                        **decoding_options(
+                            self.settings,
+                            language="zh",
+                            vad_filter=True,
+                            vad_parameters=dict(min_silence_duration_ms=100),
+                            no_speech_threshold=0.6,
+                            initial_prompt="以下是普通话的句子。"
+                        )
+                    )
+                    transcripts = [" ".join([segment.text for segment in segments])]
+                else:
+                    transcripts = self.batch_transcriber.transcribe(
+                        audio_arrays,
+                        **decoding_options(
+                            self.settings,
+                            language="zh",
+                            no_speech_threshold=0.6,
+                            initial_prompt="以下是普通话的句子。"
+                        )
+                    )
                 
-                transcript = " ".join([segment.text for segment in segments])
                 stt_time = (time.time() - start_time) * 1000
+                if len(batch) > 1:
+                    self.ui.log(f"📦 Batched {len(batch)} utterances in {stt_time:.0f}ms ({stt_time / len(batch):.0f}ms each)", 'info')
                 
-                if transcript.strip():
-                    gender_icon = AudioUtils.get_gender_icon(gender)
-                    self.ui.log(f"🇨🇳 {gender_icon} [{stt_time:.0f}ms] {transcript}", 'chinese')
-                    self.text_queue.put((transcript, time.time(), gender))
+                for transcript, gender_future in zip(transcripts, gender_futures):
+                    # Join the side-stage result (normally finished long before Whisper)
+                    gender = gender_future.result() if gender_future else 'unknown'
+                    
+                    if transcript.strip():
+                        gender_icon = AudioUtils.get_gender_icon(gender)
+                        self.ui.log(f"🇨🇳 {gender_icon} [{stt_time:.0f}ms] {transcript}", 'chinese')
+                        self.text_queue.put((transcript, time.time(), gender))
                 
             except queue.Empty:
                 continue
             except Exception as e:
                 self.ui.log(f"❌ STT Error: {str(e)}", 'error')
     
+    def _submit_gender(self, audio_array):
+        """Gender detection on the side pool (inline once stop() has shut the pool down)"""
+        try:
+            return self.gender_pool.submit(AudioUtils.detect_gender, audio_array, self.whisper_rate)
+        except RuntimeError:
+            future = Future()
+            future.set_result(AudioUtils.detect_gender(audio_array, self.whisper_rate))
+            return future
+    
     def translation_thread(self):
         """Translation thread"""
         while self.is_running:
@@ -247,6 +324,15 @@ class AudioTranslatorUI:
         self.create_ui()
         self.load_audio_devices()
         self.check_gpu()
+        
+        # Load + warm up Whisper while the user is still picking settings
+        self.whisper_device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.preloader = WhisperPreloader(ui=self)
+        self.preload_model()
+    
+    def preload_model(self, *args):
+        """Preload the selected model (again when the model / compute selection changes)"""
+        self.preloader.preload(self.model_combo.get(), self.compute_combo.get(), self.whisper_device)
     
     def create_ui(self):
         # Style
@@ -275,6 +361,7 @@ class AudioTranslatorUI:
                                        state='readonly', width=15)
         self.model_combo.set(Config.DEFAULTS['model'])
         self.model_combo.grid(row=1, column=1, sticky=tk.W, pady=5, padx=5)
+        self.model_combo.bind('<<ComboboxSelected>>', self.preload_model)
         
         # Compute Type
         ttk.Label(settings_frame, text="⚡ Compute:").grid(row=2, column=0, sticky=tk.W, pady=5)
@@ -282,6 +369,7 @@ class AudioTranslatorUI:
                                          state='readonly', width=15)
         self.compute_combo.set(Config.DEFAULTS['compute_type'])
         self.compute_combo.grid(row=2, column=1, sticky=tk.W, pady=5, padx=5)
+        self.compute_combo.bind('<<ComboboxSelected>>', self.preload_model)
         
         # TTS Engine Selection (NEW!)
         ttk.Label(settings_frame, text="🔊 TTS Engine:").grid(row=3, column=0, sticky=tk.W, pady=5)
@@ -297,6 +385,13 @@ class AudioTranslatorUI:
         # Sliders
         self.create_sliders(settings_frame)
         
+        # Decoding Profile
+        ttk.Label(settings_frame, text="🧠 Decoding:").grid(row=9, column=0, sticky=tk.W, pady=5)
+        self.decoding_combo = ttk.Combobox(settings_frame, values=[p['display'] for p in Config.DECODING_PROFILES.values()],
+                                          state='readonly', width=40)
+        self.decoding_combo.set(Config.DECODING_PROFILES[Config.DEFAULTS['decoding_profile']]['display'])
+        self.decoding_combo.grid(row=9, column=1, sticky=tk.W, pady=5, padx=5)
+        
         # GPU Info
         self.gpu_label = ttk.Label(settings_frame, text="🔍 Checking GPU...")
         self.gpu_label.grid(row=8, column=0, columnspan=2, pady=5)
@@ -401,10 +496,13 @@ class AudioTranslatorUI:
             'device_index': device_idx,
             'tts_engine': self.tts_engine_var.get(),  # NEW!
             'pause_time': self.pause_scale.get(),
-            'min_audio_length': self.min_audio_scale.get()
+            'min_audio_length': self.min_audio_scale.get(),
+            'decoding_profile': list(Config.DECODING_PROFILES)[self.decoding_combo.current()]
         }
         
-        self.translator_engine = TranslatorEngine(settings, self)
+        # Reuses the preloaded model (only waits if it is still loading)
+        model = self.preloader.get(settings['model'], settings['compute_type'], self.whisper_device)
+        self.translator_engine = TranslatorEngine(settings, self, whisper_model=model, audio=self.audio)
         self.translator_engine.start()
         
         self.is_running = True
@@ -0,0 +1,119 @@
+"""
+Whisper Preloader Module
+Loads and warms up the Whisper model in the background before Start is pressed
+"""
+import threading
+import time
+
+import numpy as np
+
+from model_registry import default_registry
+
+
+class WhisperPreloader:
+    """
+    Keeps one warmed-up WhisperModel for the whole UI session
+
+    preload() starts loading as soon as the window opens (and again when the
+    model selection changes), then runs one inference on synthetic audio so
+    the first real transcribe() doesn't pay the lazy initialization. get()
+    hands the same handle to every TranslatorEngine, so Stop/Start never
+    reloads it; a load still in flight is awaited instead of duplicated.
+    Models come from the process-wide ModelRegistry, so switching back to
+    a model used earlier in the session is instant.
+    """
+
+    WARMUP_SECONDS = 1.0
+
+    def __init__(self, ui=None, registry=None):
+        self.ui = ui
+        self.registry = registry or default_registry()
+        self.lock = threading.Lock()
+        self._key = None       # (model, device, compute_type) being loaded / loaded
+        self._model = None
+        self._error = None
+        self._ready = threading.Event()
+
+    def preload(self, model_name, compute_type, device):
+        """Start loading in the background (no-op if this model is already loaded or loading)"""
+        key = (model_name, device, compute_type)
+        with self.lock:
+            if key == self._key:
+                return
+            self._key = key
+            self._model = None
+            self._error = None
+            self._ready = threading.Event()
+            ready = self._ready
+
+        threading.Thread(target=self._load, args=(key, ready), daemon=True, name='whisper-preload').start()
+
+    def is_ready(self, model_name, compute_type, device):
+        with self.lock:
+            return self._key == (model_name, device, compute_type) and self._ready.is_set()
+
+    def get(self, model_name, compute_type, device, timeout=None):
+        """
+        Warmed-up model for these settings (waits for the background load)
+
+        Returns:
+            WhisperModel
+
+        Raises:
+            RuntimeError: If loading failed or timed out
+        """
+        key = (model_name, device, compute_type)
+        self.preload(model_name, compute_type, device)
+        with self.lock:
+            ready = self._ready
+        if not ready.wait(timeout):
+            raise RuntimeError(f"Timed out loading Whisper {model_name}")
+
+        with self.lock:
+            if self._key != key:
+                raise RuntimeError("Whisper model selection changed while loading")
+            if self._error is not None:
+                error = self._error
+                # Allow a retry on the next Start
+                self._key = None
+                raise RuntimeError(f"Whisper {model_name} failed to load: {error}")
+            return self._model
+
+    def _load(self, key, ready):
+        model_name, device, compute_type = key
+        if self.registry.contains(model_name, device, compute_type):
+            # Loaded (and warmed up) earlier in this session
+            model = self.registry.get(model_name, device, compute_type)
+            with self.lock:
+                if self._key == key:
+                    self._model = model
+            ready.set()
+            return
+
+        if self.ui: self.ui.log(f"🔄 Preloading Whisper {model_name} ({device.upper()}, {compute_type})...", 'info')
+        try:
+            start = time.perf_counter()
+            model = self.registry.get(model_name, device, compute_type)
+            load_time = time.perf_counter() - start
+
+            # Warm-up: the first inference initializes kernels / allocators lazily
+            start = time.perf_counter()
+            warmup = np.random.default_rng(0).standard_normal(int(16000 * self.WARMUP_SECONDS)).astype(np.float32) * 0.01
+            segments, _ = model.transcribe(warmup, beam_size=5, language='zh', vad_filter=False)
+            list(segments)
+            warmup_time = time.perf_counter() - start
+        except Exception as e:
+            with self.lock:
+                if self._key == key:
+                    self._error = e
+            ready.set()
+            if self.ui: self.ui.log(f"❌ Whisper preload failed: {e}", 'error')
+            return
+
+        with self.lock:
+            current = self._key == key
+            if current:
+                self._model = model
+        ready.set()
+        # Selection changed while loading: the model is dropped
+        if current and self.ui: self.ui.log(f"✅ Whisper {model_name} ready (load {load_time:.1f}s, warm-up {warmup_time:.1f}s)", 'success')